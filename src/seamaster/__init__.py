@@ -6,6 +6,7 @@ High-level imports for common usage.
 
 # API
 from seamaster.api.game_api import GameAPI
+from seamaster.api.tick_cache import tick_cached
 
 # Context
 from seamaster.context.bot_context import BotContext
@@ -64,11 +65,19 @@ from seamaster.utils import (
     get_direction_in_one_radius,
     get_optimal_next_hops,
     get_shortest_distance_between_points,
+    cell_of,
+    point_of_cell,
+    get_optimal_next_hops_between_cells,
+    get_shortest_distance_between_cells,
+    get_optimal_speed_hops,
+    get_optimal_speed_hops_between_cells,
+    get_speed_distance_between_points,
 )
 
 
 __all__ = [
     "GameAPI",
+    "tick_cached",
     "BotContext",
     "BotController",
     "Forager",
@@ -101,6 +110,13 @@ __all__ = [
     "get_direction_in_one_radius",
     "get_optimal_next_hops",
     "get_shortest_distance_between_points",
+    "cell_of",
+    "point_of_cell",
+    "get_optimal_next_hops_between_cells",
+    "get_shortest_distance_between_cells",
+    "get_optimal_speed_hops",
+    "get_optimal_speed_hops_between_cells",
+    "get_speed_distance_between_points",
     "AlgaeType",
     "BotStatus",
     "BotType",
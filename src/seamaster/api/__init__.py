@@ -2,8 +2,25 @@
 Docstring for seamaster.api
 """
 
+from .assignment import AssignmentService
+from .coordinator import MoveCoordinator
+from .distance_field import DistanceField
+from .energy import EnergyOracle
 from .game_api import GameAPI
+from .memory import WorldMemory
+from .occupancy import Occupancy
+from .spatial import SpatialIndex
+from .tick_cache import TickCache, tick_cached
 
 __all__ = [
+    "AssignmentService",
+    "DistanceField",
+    "EnergyOracle",
     "GameAPI",
+    "MoveCoordinator",
+    "Occupancy",
+    "SpatialIndex",
+    "TickCache",
+    "tick_cached",
+    "WorldMemory",
 ]
@@ -0,0 +1,280 @@
+"""
+Assignment module shares targets out among bots so that no two of them
+chase the same one.
+"""
+
+from typing import Callable
+
+from seamaster import shortest_distances
+from seamaster.constants import AlgaeType
+from seamaster.utils import cell_of
+
+# target kinds and the entities they are drawn from
+TARGET_SOURCES: dict[str, Callable] = {
+    "unknown_algae": lambda api: [
+        a for a in api.visible_algae() if a.is_poison == AlgaeType.UNKNOWN
+    ],
+    "non_poisonous_algae": lambda api: [
+        a for a in api.visible_algae() if a.is_poison == AlgaeType.FALSE
+    ],
+}
+
+
+def solve_assignment(cost: list[list[int]]) -> dict[int, int]:
+    """
+    Minimum-cost assignment of rows to distinct columns (Hungarian method,
+    shortest augmenting paths), O(n^2 m).
+
+    Args:
+        cost (list[list[int]]): n x m matrix with n <= m.
+
+    Returns:
+        dict[int, int]: Column assigned to every row.
+    """
+    n = len(cost)
+    m = len(cost[0]) if n else 0
+    inf = float("inf")
+    u = [0] * (n + 1)
+    v = [0] * (m + 1)
+    # p[j]: row matched to column j (1-based, 0 for none); way: path back
+    p = [0] * (m + 1)
+    way = [0] * (m + 1)
+
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = [inf] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[j0] = True
+            i0 = p[j0]
+            row = cost[i0 - 1]
+            ui0 = u[i0]
+            delta = inf
+            j1 = 0
+            for j in range(1, m + 1):
+                if not used[j]:
+                    cur = row[j - 1] - ui0 - v[j]
+                    if cur < minv[j]:
+                        minv[j] = cur
+                        way[j] = j0
+                    if minv[j] < delta:
+                        delta = minv[j]
+                        j1 = j
+            for j in range(m + 1):
+                if used[j]:
+                    u[p[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+
+    return {p[j] - 1: j - 1 for j in range(1, m + 1) if p[j]}
+
+
+class _Pool:
+    """
+    Assignment state of one target kind.
+    """
+
+    def __init__(self):
+        self.queried: set[int] = set()
+        self.previous: set[int] = set()
+        self.members: tuple[int, ...] = ()
+        self.key: tuple | None = None
+        self.result: dict[int, int] = {}
+        self.targets: dict[int, object] = {}
+        self.solved = False
+
+
+class AssignmentService:
+    """
+    Assigns each bot asking for a kind of target its own target, such that
+    the total path distance is minimal.
+
+    A pool is solved once per tick, on the first request, for every bot
+    that asked for that kind in the previous tick. A bot joining later in
+    the tick takes the nearest free target and is part of the next solve.
+    The previous tick's solution is reused as is when no bot or
+    target has moved. Otherwise it biases the new solve by `stickiness`
+    cells, so bots do not switch targets for a marginal gain. With more
+    bots than targets, some bots get no target.
+
+    With SEAMASTER_WORKERS the bots act in several processes, so the
+    wrapper's service solves every kind once per tick with `solve_all`
+    and the workers' services only answer from that solution (`use`). A
+    bot's first request of a kind then gets None, and it takes part in
+    the next tick's solve.
+    """
+
+    def __init__(self, stickiness: int = 2):
+        """
+        Args:
+            stickiness (int): Distance bonus for keeping the previous target.
+        """
+        self.stickiness = stickiness
+        self.solves = 0
+        self.reuses = 0
+        self._stamp: tuple | None = None
+        self._pools: dict[str, _Pool] = {}
+        # solution handed over by the wrapper: kind -> bot id -> target cell
+        self._fixed: dict[str, dict[int, int]] | None = None
+        # bots that asked per kind since `use`, and the targets by cell
+        self.asked: dict[str, set[int]] = {}
+        self._fixed_targets: dict[str, dict[int, object]] = {}
+
+    def target(self, api, kind: str, bot_id: int):
+        """
+        Returns the target assigned to a bot, or None.
+
+        Args:
+            api (GameAPI): API of the current tick.
+            kind (str): One of TARGET_SOURCES.
+            bot_id (int): Asking bot.
+
+        Raises:
+            ValueError: If the kind is unknown.
+        """
+        if kind not in TARGET_SOURCES:
+            raise ValueError(f"Unknown target kind: {kind}")
+        if self._fixed is not None:
+            return self._fixed_target(api, kind, bot_id)
+
+        stamp = (api.view.revision, api.view.tick)
+        if stamp != self._stamp:
+            self._stamp = stamp
+            for pool in self._pools.values():
+                pool.previous = pool.queried
+                pool.queried = set()
+                pool.solved = False
+
+        pool = self._pools.setdefault(kind, _Pool())
+        pool.queried.add(bot_id)
+        if not pool.solved:
+            self._solve(api, kind, pool)
+        elif bot_id not in pool.members:
+            self._join(api, pool, bot_id)
+        cell = pool.result.get(bot_id)
+        return None if cell is None else pool.targets[cell]
+
+    def solve_all(self, api, asked: dict[str, set[int]]) -> dict[str, dict[int, int]]:
+        """
+        Solves every kind at once, for a tick whose bots act elsewhere.
+
+        Args:
+            api (GameAPI): API of the current tick.
+            asked (dict[str, set[int]]): Bots that asked for each kind on
+                the previous tick.
+
+        Returns:
+            dict[str, dict[int, int]]: Target cell per bot id, per kind.
+        """
+        solution = {}
+        for kind, bot_ids in asked.items():
+            if kind not in TARGET_SOURCES:
+                continue
+            pool = self._pools.setdefault(kind, _Pool())
+            pool.previous = set(bot_ids)
+            pool.queried = set()
+            self._solve(api, kind, pool)
+            solution[kind] = dict(pool.result)
+        return solution
+
+    def use(self, solution: dict[str, dict[int, int]]) -> None:
+        """
+        Answers the current tick from a solution made by `solve_all`, and
+        records the bots that ask in `asked`.
+        """
+        self._fixed = solution
+        self.asked = {}
+        self._fixed_targets = {}
+
+    def _fixed_target(self, api, kind: str, bot_id: int):
+        self.asked.setdefault(kind, set()).add(bot_id)
+        cell = self._fixed.get(kind, {}).get(bot_id)
+        if cell is None:
+            return None
+        targets = self._fixed_targets.get(kind)
+        if targets is None:
+            targets = {}
+            for t in TARGET_SOURCES[kind](api):
+                targets.setdefault(cell_of(t.location), t)
+            self._fixed_targets[kind] = targets
+        return targets.get(cell)
+
+    def _join(self, api, pool: _Pool, bot_id: int) -> None:
+        """
+        Gives a bot that joins after the solve the nearest free target.
+        Bots that already acted keep theirs; the next tick's solve includes
+        the newcomer.
+        """
+        tables = shortest_distances.TABLES
+        src = cell_of(api.view.bots[bot_id].location)
+        taken = set(pool.result.values())
+        best = None
+        for dst in pool.targets:
+            if dst in taken:
+                continue
+            d = tables.distance(src, dst)
+            if d is not None and (best is None or d < best[0]):
+                best = (d, dst)
+        pool.members += (bot_id,)
+        # the pool changed, so next tick cannot reuse this solution as is
+        pool.key = None
+        if best is not None:
+            pool.result[bot_id] = best[1]
+
+    def _solve(self, api, kind: str, pool: _Pool) -> None:
+        tables = shortest_distances.TABLES
+        bots = api.view.bots
+        members = tuple(sorted(b for b in pool.queried | pool.previous if b in bots))
+        targets: dict[int, object] = {}
+        for t in TARGET_SOURCES[kind](api):
+            targets.setdefault(cell_of(t.location), t)
+
+        bot_cells = [cell_of(bots[b].location) for b in members]
+        target_cells = list(targets)
+        key = (members, tuple(bot_cells), tuple(target_cells))
+        pool.members = members
+        pool.targets = targets
+        pool.solved = True
+        if key == pool.key:
+            self.reuses += 1
+            return
+        pool.key = key
+        self.solves += 1
+
+        if not members or not target_cells:
+            pool.result = {}
+            return
+
+        # unreachable pairs cost more than any real path, then get dropped
+        unreachable = tables.cells * 2
+        cost = []
+        for b, src in zip(members, bot_cells):
+            kept = pool.result.get(b)
+            row = []
+            for dst in target_cells:
+                d = tables.distance(src, dst)
+                if d is None:
+                    d = unreachable
+                elif dst == kept:
+                    d -= self.stickiness
+                row.append(d)
+            cost.append(row)
+
+        if len(members) <= len(target_cells):
+            pairs = solve_assignment(cost).items()
+        else:
+            transposed = [list(col) for col in zip(*cost)]
+            pairs = ((i, j) for j, i in solve_assignment(transposed).items())
+
+        pool.result = {
+            members[i]: target_cells[j] for i, j in pairs if cost[i][j] < unreachable
+        }
@@ -0,0 +1,232 @@
+"""
+MoveCoordinator module turns the moves chosen by each bot into a
+conflict-free set for the whole team.
+"""
+
+import heapq
+
+from seamaster import shortest_distances
+from seamaster.api.occupancy import ENEMY, WALL
+from seamaster.constants import Direction
+from seamaster.models.action import Action
+from seamaster.shortest_distances import OFFSETS
+from seamaster.utils import cell_of
+
+_DIRECTIONS = tuple(Direction)
+
+
+class MoveCoordinator:
+    """
+    Prioritized planning over a space-time reservation table.
+
+    Bots that do not take a one-cell move reserve the cell they will stand
+    on for the whole window. Moving bots are then planned one at a time,
+    closest to their target first (but after the bot they follow), with a
+    space-time A* (cooperative A*) that may wait in place and must avoid
+    the cells and the swaps reserved by the bots planned before them. Only
+    the first step of each plan is played; the rest of the window keeps
+    bots from being steered into dead ends. Cells held by bots that are not
+    planned yet are never entered on the first step, since those bots may
+    end up staying.
+
+    Speed moves (a "step" above 1) are never replanned: the search moves
+    one cell per step, so they are sent as chosen and only reserve the cell
+    they land on. A rerouted one-cell move keeps the payload of the action
+    it replaces, "step" included, with its direction changed.
+    """
+
+    def __init__(self, window: int = 3, max_expansions: int = 400):
+        """
+        Args:
+            window (int): Steps each bot is planned ahead.
+            max_expansions (int): Search budget per bot.
+        """
+        self.window = window
+        self.max_expansions = max_expansions
+        self.rerouted = 0
+        self.held = 0
+
+    def resolve(self, api, actions: dict[int, Action]) -> dict[int, Action | None]:
+        """
+        Resolves the actions of a tick.
+
+        Args:
+            api (GameAPI): API of the tick. `api.move_targets` holds the
+                cell each bot was heading to when it chose its move.
+            actions (dict[int, Action]): Chosen action per bot id.
+
+        Returns:
+            dict[int, Action | None]: Actions to send. A move is replaced
+            by another direction when it would collide, or by None when the
+            bot has to wait.
+        """
+        tables = shortest_distances.TABLES
+        window = self.window
+        bots = api.get_my_bots()
+        static = api.occupancy().grid
+
+        cells: dict[int, int] = {}
+        occupant: dict[int, int] = {}
+        for bot in bots:
+            cells[bot.id] = cell_of(bot.location)
+            occupant[cells[bot.id]] = bot.id
+
+        reserved: dict[tuple[int, int], int] = {}
+        swaps: set[tuple[int, int, int]] = set()
+        planned: set[int] = set()
+        movers: dict[int, tuple[int, int, int]] = {}
+
+        for bot in bots:
+            src = cells[bot.id]
+            action = actions.get(bot.id)
+            first = _first_cell(tables, src, action)
+            if first is None:
+                # not moving, or a two-cell move we leave as chosen
+                stay = _landing_cell(tables, src, action)
+                for t in range(1, window + 1):
+                    reserved[(stay, t)] = bot.id
+                planned.add(bot.id)
+                continue
+            goal = api.move_targets.get(bot.id, first)
+            if tables.distance(src, goal) is None:
+                goal = first
+            movers[bot.id] = (src, goal, first)
+
+        result: dict[int, Action | None] = dict(actions)
+        visiting: set[int] = set()
+
+        def plan(bot_id: int) -> None:
+            src, goal, first = movers[bot_id]
+            visiting.add(bot_id)
+            # a bot following another one is planned after it, so it can
+            # take the cell being vacated
+            ahead = occupant.get(first)
+            if ahead in movers and ahead not in planned and ahead not in visiting:
+                plan(ahead)
+
+            path = self._search(
+                tables, static, reserved, swaps, occupant, planned, src, goal, first
+            )
+            planned.add(bot_id)
+            if path is None:
+                path = [src]
+            for t, v in enumerate(path[1:], start=1):
+                reserved[(v, t)] = bot_id
+                swaps.add((path[t - 1], v, t))
+            for t in range(len(path), window + 1):
+                reserved[(path[-1], t)] = bot_id
+
+            nxt = path[1] if len(path) > 1 else src
+            if nxt == src:
+                self.held += 1
+                result[bot_id] = None
+            elif nxt != first:
+                self.rerouted += 1
+                result[bot_id] = _redirect(
+                    actions[bot_id], _direction(tables, src, nxt)
+                )
+
+        order = sorted(movers, key=lambda i: (tables.distance(*movers[i][:2]) or 0, i))
+        for bot_id in order:
+            if bot_id not in planned:
+                plan(bot_id)
+        return result
+
+    def _search(
+        self, tables, static, reserved, swaps, occupant, planned, src, goal, first
+    ) -> list[int] | None:
+        """
+        Space-time A* from `src` towards `goal` over `window` steps.
+        """
+        width, height, n = tables.width, tables.height, tables.cells
+        dist, unreachable = tables.dist, tables.unreachable
+        base = goal * n
+        window = self.window
+
+        # heap entries: (f, -t, kept, seq, cell, t, terminal), where `kept`
+        # is 0 on paths starting with the bot's own step so that ties keep
+        # it; the first terminal popped is optimal as h never overestimates
+        heap = [(dist[base + src], 0, 0, 0, src, 0, False)]
+        parent: dict[tuple[int, int], tuple[int, int] | None] = {(src, 0): None}
+        seq = 1
+        expansions = 0
+
+        while heap:
+            _, _, kept, _, u, t, terminal = heapq.heappop(heap)
+            if terminal:
+                path = []
+                node = (u, t)
+                while node is not None:
+                    path.append(node[0])
+                    node = parent[node]
+                path.reverse()
+                return path
+
+            expansions += 1
+            if expansions > self.max_expansions:
+                return None
+
+            nt = t + 1
+            x, y = u % width, u // width
+            options = []
+            for dx, dy in OFFSETS:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < width and 0 <= ny < height:
+                    options.append(ny * width + nx)
+            options.append(u)
+
+            for v in options:
+                if (v, nt) in parent or (v, nt) in reserved:
+                    continue
+                if v != u:
+                    if static[v] & (WALL | ENEMY) or (v, u, nt) in swaps:
+                        continue
+                    if nt == 1 and v in occupant and occupant[v] not in planned:
+                        continue
+                h = dist[base + v]
+                if h == unreachable:
+                    continue
+                parent[(v, nt)] = (u, t)
+                k = int(v != first) if t == 0 else kept
+                if v == goal:
+                    entry = (nt, -nt, k, seq, v, nt, True)
+                else:
+                    entry = (nt + h, -nt, k, seq, v, nt, nt == window)
+                heapq.heappush(heap, entry)
+                seq += 1
+
+        return None
+
+
+def _first_cell(tables, src: int, action: Action | None) -> int | None:
+    """
+    Cell a one-cell move leads to, or None for any other action.
+    """
+    move = action.as_move() if action is not None else None
+    if move is None or move[1] != 1:
+        return None
+    return _step(tables, src, move[0], 1)
+
+
+def _landing_cell(tables, src: int, action: Action | None) -> int:
+    move = action.as_move() if action is not None else None
+    if move is None:
+        return src
+    cell = _step(tables, src, move[0], move[1])
+    return src if cell is None else cell
+
+
+def _step(tables, src: int, direction: Direction, step: int) -> int | None:
+    dx, dy = OFFSETS[_DIRECTIONS.index(direction)]
+    cell = tables.cell(src % tables.width + dx * step, src // tables.width + dy * step)
+    return cell if cell >= 0 else None
+
+
+def _redirect(action: Action, direction: Direction) -> Action:
+    return Action(action.action_type, {**action.payload, "direction": direction.value})
+
+
+def _direction(tables, src: int, dst: int) -> Direction:
+    dx = dst % tables.width - src % tables.width
+    dy = dst // tables.width - src // tables.width
+    return _DIRECTIONS[OFFSETS.index((dx, dy))]
@@ -0,0 +1,89 @@
+"""
+DistanceField module answers "nearest entity of a kind" queries in O(1).
+"""
+
+from array import array
+from typing import Callable, Sequence
+
+from seamaster.models.point import Point
+from seamaster.shortest_distances import PathTables
+
+_UNSET = 0xFFFF
+
+
+class DistanceField:
+    """
+    Distance from every cell to the nearest entity of one category, and
+    which entity that is.
+
+    A field is built with one multi-source BFS over the static map, so its
+    distances match the shortest-distance tables.
+    """
+
+    def __init__(self, dist: array, owner: array, entities: Sequence):
+        self.dist = dist
+        self.owner = owner
+        self.entities = entities
+
+    @classmethod
+    def build(
+        cls,
+        tables: PathTables,
+        entities: Sequence,
+        location: Callable[[object], Point] = lambda e: e.location,
+    ) -> "DistanceField":
+        """
+        Args:
+            tables (PathTables): Tables of the current map.
+            entities (Sequence): Entities to measure distances to.
+            location (Callable): Returns an entity's position.
+        """
+        cells = tables.cells
+        dist = array("H", [_UNSET]) * cells
+        owner = array("i", [-1]) * cells
+        neighbours = tables.neighbours()
+        walls = tables.wall_cells()
+
+        frontier = []
+        for i, e in enumerate(entities):
+            p = location(e)
+            c = tables.cell(p.x, p.y)
+            if c < 0 or c in walls or dist[c] == 0:
+                continue
+            dist[c] = 0
+            owner[c] = i
+            frontier.append(c)
+
+        d = 0
+        while frontier:
+            d += 1
+            nxt = []
+            for u in frontier:
+                o = owner[u]
+                for v in neighbours[u]:
+                    if dist[v] == _UNSET:
+                        dist[v] = d
+                        owner[v] = o
+                        nxt.append(v)
+            frontier = nxt
+
+        return cls(dist, owner, entities)
+
+    def distance(self, cell: int) -> int | None:
+        """
+        Returns the distance from `cell` to the nearest entity, or None if
+        no entity is reachable.
+        """
+        if cell < 0:
+            return None
+        d = self.dist[cell]
+        return None if d == _UNSET else d
+
+    def nearest(self, cell: int):
+        """
+        Returns the entity nearest to `cell`, or None if none is reachable.
+        """
+        if cell < 0:
+            return None
+        o = self.owner[cell]
+        return None if o < 0 else self.entities[o]
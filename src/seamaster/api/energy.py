@@ -0,0 +1,80 @@
+"""
+Energy module turns path distances into energy costs for a bot loadout.
+"""
+
+from seamaster.api.distance_field import DistanceField
+from seamaster.constants import ABILITY_COSTS, Ability
+from seamaster.models.point import Point
+from seamaster.utils import cell_of, get_shortest_distance_between_cells
+
+
+def loadout_traversal_cost(abilities: list) -> float:
+    """
+    Energy spent per cell moved by a bot with the given abilities, summed
+    from ABILITY_COSTS.
+
+    Args:
+        abilities (list): Ability members or their string values.
+
+    Returns:
+        float: Energy per cell.
+    """
+    total = 0.0
+    for ability in abilities:
+        try:
+            name = Ability(ability).name
+        except ValueError:
+            continue
+        total += ABILITY_COSTS.get(name, {}).get("traversal", 0)
+    return total
+
+
+class EnergyOracle:
+    """
+    Energy cost of travel for one loadout.
+
+    Every cell costs a loadout the same energy, so the cheapest route is
+    the shortest one and its cost is the table distance scaled by the
+    per-cell cost. Combined with the energy pad distance field, "reach X
+    and then recharge" is answered with two lookups.
+    """
+
+    def __init__(self, cost_per_cell: float, pads: DistanceField):
+        """
+        Args:
+            cost_per_cell (float): Energy spent per cell moved.
+            pads (DistanceField): Distance field of the energy pads.
+        """
+        self.cost_per_cell = cost_per_cell
+        self.pads = pads
+
+    def travel(self, src: Point, dst: Point) -> float | None:
+        """
+        Returns the energy needed to move from `src` to `dst`, or None if
+        there is no path.
+        """
+        d = get_shortest_distance_between_cells(cell_of(src), cell_of(dst))
+        if d is None:
+            return None
+        return d * self.cost_per_cell
+
+    def recharge(self, pos: Point) -> float | None:
+        """
+        Returns the energy needed to move from `pos` to the nearest energy
+        pad, or None if no pad is reachable.
+        """
+        d = self.pads.distance(cell_of(pos))
+        if d is None:
+            return None
+        return d * self.cost_per_cell
+
+    def round_trip(self, src: Point, target: Point) -> float | None:
+        """
+        Returns the energy needed to reach `target` from `src` and then the
+        energy pad nearest to `target`, or None if either leg has no path.
+        """
+        there = self.travel(src, target)
+        back = self.recharge(target)
+        if there is None or back is None:
+            return None
+        return there + back
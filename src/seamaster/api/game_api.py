@@ -2,7 +2,17 @@
 GameAPI module provides an interface to interact with the game state.
 """
 
+from seamaster import shortest_distances
+from seamaster.api.assignment import AssignmentService
+from seamaster.api.distance_field import DistanceField
+from seamaster.api.energy import EnergyOracle
+from seamaster.api.memory import WorldMemory
+from seamaster.api.occupancy import Occupancy
+from seamaster.api.spatial import SpatialIndex
+from seamaster.api.tick_cache import TickCache, tick_cached
 from seamaster.constants import Ability, SCRAP_COSTS
+from seamaster.deadline import TickDeadline
+from seamaster.models.action import Action
 from seamaster.models.algae import Algae
 from seamaster.models.bank import Bank
 from seamaster.models.enemy_bot import EnemyBot
@@ -11,6 +21,26 @@ from seamaster.models.player_view import PlayerView
 from seamaster.models.bot import Bot
 from seamaster.models.point import Point
 from seamaster.models.scrap import Scrap
+from seamaster.shortest_distances import PathPlanner, use_map
+
+
+# distance field categories and the GameAPI method listing their entities
+FIELD_SOURCES = {
+    "banks": "_banks",
+    "energypads": "_energypads",
+    "scraps": "visible_scraps",
+    "algae": "visible_algae",
+    "enemies": "visible_enemies",
+}
+
+# spatial index categories and the GameAPI method listing their entities
+INDEX_SOURCES = {
+    "enemies": "visible_enemies",
+    "own_bots": "_my_bots",
+    "scraps": "visible_scraps",
+    "algae": "visible_algae",
+    "walls": "visible_walls",
+}
 
 
 class GameAPI:
@@ -19,9 +49,50 @@ class GameAPI:
     """
 
     view: PlayerView
+    planner: PathPlanner
 
-    def __init__(self, view: PlayerView):
+    def __init__(
+        self,
+        view: PlayerView,
+        planner: PathPlanner | None = None,
+        cache: TickCache | None = None,
+        assignments: AssignmentService | None = None,
+        memory: WorldMemory | None = None,
+        deadline: TickDeadline | None = None,
+    ):
+        """
+        Args:
+            view (PlayerView): State of the current tick.
+            planner (PathPlanner | None): Route cache kept across ticks by
+                the wrapper. A fresh one is used when omitted.
+            cache (TickCache | None): Memo of `tick_cached` queries, kept
+                by the wrapper so its counters span the match. A fresh one
+                is used when omitted.
+            assignments (AssignmentService | None): Target assignment kept
+                across ticks by the wrapper. A fresh one is used when
+                omitted.
+            memory (WorldMemory | None): Sightings kept across ticks by
+                the wrapper (SEAMASTER_MEMORY=1), which has already
+                observed `view`. When omitted, a memory of this view alone
+                is built on first use.
+            deadline (TickDeadline | None): Time limit of the current tick,
+                started by the wrapper. No limit when omitted.
+        """
         self.view = view
+        self.planner = planner if planner is not None else PathPlanner()
+        self.cache = cache if cache is not None else TickCache()
+        self.assignments = (
+            assignments if assignments is not None else AssignmentService()
+        )
+        use_map(view.width, view.height, view.permanent_entities.walls)
+        self._occupancy: Occupancy | None = None
+        self._fields: dict[str, DistanceField] = {}
+        self._oracles: dict[float, EnergyOracle] = {}
+        self._indexes: dict[str, SpatialIndex] = {}
+        self._memory = memory
+        self.deadline = deadline
+        # target cell of each bot's last move_target call, for MoveCoordinator
+        self.move_targets: dict[int, int] = {}
 
     # ---- GLOBAL ----
     def get_tick(self) -> int:
@@ -31,6 +102,16 @@ class GameAPI:
         """
         return self.view.tick
 
+    def time_remaining(self) -> float:
+        """
+        Returns the seconds left before the tick's deadline, inf when the
+        tick has no limit.
+        returnType: float
+        """
+        if self.deadline is None:
+            return float("inf")
+        return self.deadline.remaining()
+
     def get_max_energy(self) -> int:
         return 50
 
@@ -43,10 +124,10 @@ class GameAPI:
 
     def get_my_bots(self) -> list[Bot]:
         """
-        Returns a list of bots owned by the player.
+        Returns a new list of bots owned by the player.
         returnType: list[Bot]
         """
-        return list(self.view.bots.values())
+        return list(self._my_bots())
 
     # ---- SENSING ----
     def visible_enemies(self) -> list[EnemyBot]:
@@ -65,17 +146,31 @@ class GameAPI:
 
     def banks(self) -> list[Bank]:
         """
-        Returns a list of visible banks.
+        Returns a new list of visible banks.
+        returnType: list[Bank]
+        """
+        return list(self._banks())
+
+    def my_banks(self) -> list[Bank]:
+        """
+        Returns a new list of the banks owned by the player.
         returnType: list[Bank]
         """
-        return list(self.view.permanent_entities.banks.values())
+        return list(self._my_banks())
+
+    def opponent_banks(self) -> list[Bank]:
+        """
+        Returns a new list of the banks owned by the opponent.
+        returnType: list[Bank]
+        """
+        return list(self._opponent_banks())
 
     def energypads(self) -> list[EnergyPad]:
         """
-        Returns a list of visible energy pads.
+        Returns a new list of visible energy pads.
         returnType: list[EnergyPad]
         """
-        return list(self.view.permanent_entities.energypads.values())
+        return list(self._energypads())
 
     def visible_walls(self) -> list[Point]:
         """
@@ -91,6 +186,119 @@ class GameAPI:
         """
         return self.view.visible_entities.algae
 
+    def occupancy(self) -> Occupancy:
+        """
+        Returns the occupancy grid of the current tick, built on first use
+        and shared by every bot.
+        returnType: Occupancy
+        """
+        if self._occupancy is None:
+            self._occupancy = Occupancy.from_view(self.view)
+        return self._occupancy
+
+    def memory(self) -> WorldMemory:
+        """
+        Returns the memory of entities seen on this and earlier ticks. The
+        earlier ones are only kept with SEAMASTER_MEMORY=1; otherwise this
+        is a memory of the current view, built on first use.
+        returnType: WorldMemory
+        """
+        if self._memory is None:
+            self._memory = WorldMemory()
+            self._memory.observe(self.view)
+        return self._memory
+
+    def distance_field(self, category: str) -> DistanceField:
+        """
+        Returns the distance field of an entity category for the current
+        tick, built with one BFS on first use and shared by every bot.
+
+        Args:
+            category (str): One of "banks", "energypads", "scraps", "algae"
+                or "enemies".
+
+        Raises:
+            ValueError: If the category is unknown.
+        returnType: DistanceField
+        """
+        field = self._fields.get(category)
+        if field is None:
+            source = FIELD_SOURCES.get(category)
+            if source is None:
+                raise ValueError(f"Unknown distance field category: {category}")
+            entities = getattr(self, source)()
+            field = DistanceField.build(shortest_distances.TABLES, entities)
+            self._fields[category] = field
+        return field
+
+    def spatial_index(self, category: str) -> SpatialIndex:
+        """
+        Returns the bucket grid of an entity category for the current tick,
+        built on first use and shared by every bot.
+
+        Args:
+            category (str): One of "enemies", "own_bots", "scraps", "algae"
+                or "walls".
+
+        Raises:
+            ValueError: If the category is unknown.
+        returnType: SpatialIndex
+        """
+        index = self._indexes.get(category)
+        if index is None:
+            source = INDEX_SOURCES.get(category)
+            if source is None:
+                raise ValueError(f"Unknown spatial index category: {category}")
+            entities = getattr(self, source)()
+            if category == "walls":
+                index = SpatialIndex(
+                    self.view.width, self.view.height, entities, lambda w: w
+                )
+            else:
+                index = SpatialIndex(self.view.width, self.view.height, entities)
+            self._indexes[category] = index
+        return index
+
+    def assigned_target(self, bot_id: int, kind: str):
+        """
+        Returns the target of a kind assigned to a bot this tick, or None
+        when every target went to a closer bot.
+
+        Args:
+            bot_id (int): Asking bot.
+            kind (str): "unknown_algae" or "non_poisonous_algae".
+
+        Raises:
+            ValueError: If the kind is unknown.
+        """
+        return self.assignments.target(self, kind, bot_id)
+
+    def energy_oracle(self, cost_per_cell: float) -> EnergyOracle:
+        """
+        Returns the energy oracle of a loadout for the current tick.
+
+        Args:
+            cost_per_cell (float): Energy the loadout spends per cell.
+        returnType: EnergyOracle
+        """
+        oracle = self._oracles.get(cost_per_cell)
+        if oracle is None:
+            oracle = EnergyOracle(cost_per_cell, self.distance_field("energypads"))
+            self._oracles[cost_per_cell] = oracle
+        return oracle
+
+    def commit_action(self, bot: Bot, action: Action) -> None:
+        """
+        Records the action a bot chose this tick. Moves are applied to the
+        occupancy grid so that bots acting later avoid the destination cell.
+        """
+        move = action.as_move()
+        if move is None:
+            # not a move, or a malformed one left for the engine to reject
+            return
+        direction, step = move
+        self.occupancy().commit_move(bot.location, direction, step)
+
     def can_spawn(self, abilities: list[Ability]) -> bool:
         """
         Returns whether a bot can be spawned
@@ -103,3 +311,25 @@ class GameAPI:
             cost += SCRAP_COSTS[ability.value]
 
         return cost <= self.view.scraps
+
+    # Per-tick entity queries, shared by every bot. Tuples, so that a
+    # caller cannot change what the next one reads.
+    @tick_cached
+    def _my_bots(self) -> tuple[Bot, ...]:
+        return tuple(self.view.bots.values())
+
+    @tick_cached
+    def _banks(self) -> tuple[Bank, ...]:
+        return tuple(self.view.permanent_entities.banks.values())
+
+    @tick_cached
+    def _my_banks(self) -> tuple[Bank, ...]:
+        return tuple(b for b in self._banks() if b.is_bank_owner)
+
+    @tick_cached
+    def _opponent_banks(self) -> tuple[Bank, ...]:
+        return tuple(b for b in self._banks() if not b.is_bank_owner)
+
+    @tick_cached
+    def _energypads(self) -> tuple[EnergyPad, ...]:
+        return tuple(self.view.permanent_entities.energypads.values())
@@ -0,0 +1,212 @@
+"""
+WorldMemory module remembers what bots have seen after it leaves vision.
+"""
+
+from array import array
+
+from seamaster.api.spatial import ring
+from seamaster.constants import AlgaeType
+from seamaster.models.player_view import PlayerView
+from seamaster.models.point import Point
+
+_ALGAE_CODES = {
+    AlgaeType.UNKNOWN.value: 0,
+    AlgaeType.TRUE.value: 1,
+    AlgaeType.FALSE.value: 2,
+}
+_ALGAE_TYPES = (AlgaeType.UNKNOWN, AlgaeType.TRUE, AlgaeType.FALSE)
+
+
+class _Layer:
+    """
+    Last sighting per cell of one category: the observation it was made
+    in (-1 for none) and an integer payload, plus the set of remembered
+    cells so queries never scan the whole map.
+    """
+
+    def __init__(self, cells: int):
+        self.seen = array("i", [-1]) * cells
+        self.info = array("i", [0]) * cells
+        self.cells: set[int] = set()
+        # self.cells in order, rebuilt after cells are added or dropped
+        self._ordered: list[int] | None = []
+
+    def record(self, cell: int, now: int, info: int = 0) -> None:
+        if self.seen[cell] < 0:
+            self.cells.add(cell)
+            self._ordered = None
+        self.seen[cell] = now
+        self.info[cell] = info
+
+    def forget(self, cell: int) -> None:
+        self.seen[cell] = -1
+        self.cells.discard(cell)
+        self._ordered = None
+
+    def ordered(self) -> list[int]:
+        if self._ordered is None:
+            self._ordered = sorted(self.cells)
+        return self._ordered
+
+
+class WorldMemory:
+    """
+    Fog-of-war memory of algae, enemies and scraps, kept across ticks by
+    the wrapper.
+
+    Ages are counted in observations, one per tick. A remembered entity is
+    dropped when one of our bots comes within `clear_radius` of its cell
+    and it is not visible there any more. Algae keep the poison status
+    learned by scouts even if a later sighting reports it as unknown.
+    """
+
+    CATEGORIES = ("algae", "enemies", "scraps")
+
+    def __init__(self, clear_radius: int = 1):
+        """
+        Args:
+            clear_radius (int): Manhattan radius around our bots inside
+                which missing entities are forgotten.
+        """
+        self.clear_radius = clear_radius
+        self.now = 0
+        self.width = 0
+        self.height = 0
+        self._layers: dict[str, _Layer] = {}
+        # enemy id -> cell it was last seen on
+        self._enemy_cells: dict[int, int] = {}
+
+    def observe(self, view: PlayerView) -> None:
+        """
+        Folds the entities visible in `view` into the memory.
+        """
+        width, height = view.width, view.height
+        if (width, height) != (self.width, self.height):
+            self.width, self.height = width, height
+            self._layers = {c: _Layer(width * height) for c in self.CATEGORIES}
+            self._enemy_cells = {}
+        self.now += 1
+        now = self.now
+        algae = self._layers["algae"]
+        enemies = self._layers["enemies"]
+        scraps = self._layers["scraps"]
+
+        # read from the raw tick data while the strategies have not decoded
+        # it, so that observing does not decode every entity
+        entities = view.visible_entities
+        raw = entities.raw("algae")
+        if raw is not None:
+            sightings = [(a["location"], a["is_poison"]) for a in raw]
+        else:
+            sightings = [(a.location, a.is_poison) for a in entities.algae]
+        for pos, is_poison in sightings:
+            cell = self._xy_cell(pos)
+            if cell < 0:
+                continue
+            code = _ALGAE_CODES.get(is_poison, 0)
+            if code == 0 and algae.seen[cell] >= 0:
+                code = algae.info[cell]
+            algae.record(cell, now, code)
+
+        raw = entities.raw("enemies")
+        if raw is not None:
+            sightings = [(e["location"], e["id"]) for e in raw]
+        else:
+            sightings = [(e.location, e.id) for e in entities.enemies]
+        for pos, enemy_id in sightings:
+            cell = self._xy_cell(pos)
+            if cell < 0:
+                continue
+            old = self._enemy_cells.get(enemy_id)
+            if old is not None and old != cell and enemies.info[old] == enemy_id:
+                enemies.forget(old)
+            self._enemy_cells[enemy_id] = cell
+            enemies.record(cell, now, enemy_id)
+
+        raw = entities.raw("scraps")
+        if raw is not None:
+            sightings = [s["location"] for s in raw]
+        else:
+            sightings = [s.location for s in entities.scraps]
+        for pos in sightings:
+            cell = self._xy_cell(pos)
+            if cell >= 0:
+                scraps.record(cell, now)
+
+        # sightings near our bots that were not renewed this tick are gone
+        offsets = [o for k in range(self.clear_radius + 1) for o in ring(k)]
+        for bot in view.bots.values():
+            bx, by = bot.location.x, bot.location.y
+            for dx, dy in offsets:
+                x, y = bx + dx, by + dy
+                if 0 <= x < width and 0 <= y < height:
+                    cell = y * width + x
+                    for layer in (algae, enemies, scraps):
+                        if 0 <= layer.seen[cell] < now:
+                            layer.forget(cell)
+
+    def recall(
+        self, category: str, max_age: int | None = None
+    ) -> list[tuple[Point, int, object]]:
+        """
+        Lists the remembered entities of a category.
+
+        Args:
+            category (str): "algae", "enemies" or "scraps".
+            max_age (int | None): Drop sightings older than this many ticks.
+
+        Returns:
+            list[tuple[Point, int, object]]: (position, age, detail), where
+            detail is the AlgaeType for algae, the bot id for enemies and
+            None for scraps.
+
+        Raises:
+            ValueError: If the category is unknown.
+        """
+        if category not in self.CATEGORIES:
+            raise ValueError(f"Unknown memory category: {category}")
+        layer = self._layers.get(category)
+        if layer is None:
+            return []
+        result = []
+        for cell in layer.ordered():
+            age = self.now - layer.seen[cell]
+            if max_age is not None and age > max_age:
+                continue
+            info = layer.info[cell]
+            if category == "algae":
+                detail = _ALGAE_TYPES[info]
+            elif category == "enemies":
+                detail = info
+            else:
+                detail = None
+            result.append(
+                (Point.at(cell % self.width, cell // self.width), age, detail)
+            )
+        return result
+
+    def age(self, category: str, pos: Point) -> int | None:
+        """
+        Returns how many ticks ago an entity of `category` was last seen at
+        `pos`, or None if nothing is remembered there.
+        """
+        layer = self._layers.get(category)
+        cell = self._cell(pos)
+        if layer is None or cell < 0 or layer.seen[cell] < 0:
+            return None
+        return self.now - layer.seen[cell]
+
+    def _xy_cell(self, pos) -> int:
+        # a Point or a raw {"x": .., "y": ..} location
+        if isinstance(pos, dict):
+            x, y = pos["x"], pos["y"]
+        else:
+            x, y = pos.x, pos.y
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return y * self.width + x
+        return -1
+
+    def _cell(self, pos: Point) -> int:
+        if 0 <= pos.x < self.width and 0 <= pos.y < self.height:
+            return pos.y * self.width + pos.x
+        return -1
@@ -0,0 +1,100 @@
+"""
+Occupancy module keeps a per-tick grid of what stands on every cell.
+"""
+
+from seamaster.constants import Direction
+from seamaster.models.player_view import PlayerView
+from seamaster.models.point import Point
+from seamaster.shortest_distances import OFFSETS
+
+WALL = 1
+ENEMY = 2
+OWN_BOT = 4
+BANK = 8
+
+# Flags that make a cell impossible to step onto.
+BLOCKING = WALL | ENEMY | OWN_BOT
+
+_OFFSET = dict(zip(Direction, OFFSETS))
+
+
+class Occupancy:
+    """
+    Occupancy stores one byte of flags per cell for the current tick.
+
+    It is built once from the PlayerView and shared by every BotContext of
+    the tick, so blocked-cell queries cost a single index instead of a scan
+    over walls and bots.
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.grid = bytearray(width * height)
+        # own bots per cell, so moving one bot never clears another
+        self._own = bytearray(width * height)
+
+    @classmethod
+    def from_view(cls, view: PlayerView):
+        occ = cls(view.width, view.height)
+        for wall in view.permanent_entities.walls:
+            occ.mark(wall, WALL)
+        for bank in view.permanent_entities.banks.values():
+            occ.mark(bank.location, BANK)
+        for enemy in view.visible_entities.enemies:
+            occ.mark(enemy.location, ENEMY)
+        for bot in view.bots.values():
+            occ.add_own_bot(bot.location)
+        return occ
+
+    def index(self, x: int, y: int) -> int:
+        """
+        Returns the grid index of (x, y), or -1 when it lies off the map.
+        """
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return y * self.width + x
+        return -1
+
+    def flags(self, pos: Point) -> int:
+        """
+        Returns the occupancy flags of a cell. Off-map cells read as WALL.
+        """
+        i = self.index(pos.x, pos.y)
+        if i < 0:
+            return WALL
+        return self.grid[i]
+
+    def is_blocked(self, pos: Point) -> bool:
+        """
+        Returns True if the cell is off the map or holds a wall, an enemy
+        or one of our bots.
+        """
+        i = self.index(pos.x, pos.y)
+        return i < 0 or self.grid[i] & BLOCKING != 0
+
+    def mark(self, pos: Point, flag: int) -> None:
+        i = self.index(pos.x, pos.y)
+        if i >= 0:
+            self.grid[i] |= flag
+
+    def add_own_bot(self, pos: Point) -> None:
+        i = self.index(pos.x, pos.y)
+        if i >= 0:
+            self._own[i] += 1
+            self.grid[i] |= OWN_BOT
+
+    def remove_own_bot(self, pos: Point) -> None:
+        i = self.index(pos.x, pos.y)
+        if i >= 0 and self._own[i]:
+            self._own[i] -= 1
+            if not self._own[i]:
+                self.grid[i] &= ~OWN_BOT
+
+    def commit_move(self, src: Point, direction: Direction, step: int = 1) -> None:
+        """
+        Moves one of our bots from `src` by `step` cells in `direction`, so
+        bots acting later in the tick see the cell it is heading to.
+        """
+        dx, dy = _OFFSET[direction]
+        self.remove_own_bot(src)
+        self.add_own_bot(Point.at(src.x + dx * step, src.y + dy * step))
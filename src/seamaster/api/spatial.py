@@ -0,0 +1,130 @@
+"""
+SpatialIndex module answers radius queries in time proportional to the
+area searched instead of the number of entities.
+"""
+
+from typing import Callable, Iterator, Sequence
+
+from seamaster.models.point import Point
+
+# (dx, dy) offsets at Manhattan distance k, indexed by k
+_RINGS: list[tuple[tuple[int, int], ...]] = [((0, 0),)]
+
+
+def ring(k: int) -> tuple[tuple[int, int], ...]:
+    """
+    Returns the (dx, dy) offsets at Manhattan distance exactly `k`, computed
+    once per distance.
+    """
+    while len(_RINGS) <= k:
+        n = len(_RINGS)
+        offsets = []
+        for dx in range(-n, n + 1):
+            dy = n - abs(dx)
+            offsets.append((dx, dy))
+            if dy:
+                offsets.append((dx, -dy))
+        _RINGS.append(tuple(offsets))
+    return _RINGS[k]
+
+
+class SpatialIndex:
+    """
+    Bucket grid mapping each cell to the entities standing on it.
+
+    Buckets hold indices into `entities`, so results can be returned in
+    the order of the source list.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        entities: Sequence,
+        location: Callable[[object], Point] = lambda e: e.location,
+    ):
+        """
+        Args:
+            width (int): Map width.
+            height (int): Map height.
+            entities (Sequence): Entities to index.
+            location (Callable): Returns an entity's position.
+        """
+        self.width = width
+        self.height = height
+        self.entities = entities
+        self.location = location
+        self.buckets: dict[int, list[int]] = {}
+        for i, e in enumerate(entities):
+            p = location(e)
+            if 0 <= p.x < width and 0 <= p.y < height:
+                self.buckets.setdefault(p.y * width + p.x, []).append(i)
+
+    def ring_indices(self, center: Point, k: int) -> Iterator[int]:
+        """
+        Yields the indices of the entities at Manhattan distance `k` from
+        `center`.
+        """
+        width, height, buckets = self.width, self.height, self.buckets
+        cx, cy = center.x, center.y
+        for dx, dy in ring(k):
+            x, y = cx + dx, cy + dy
+            if 0 <= x < width and 0 <= y < height:
+                bucket = buckets.get(y * width + x)
+                if bucket:
+                    yield from bucket
+
+    def within(self, center: Point, radius: int) -> list:
+        """
+        Returns the entities within Manhattan distance `radius` of `center`,
+        in the order of the source list.
+        """
+        if radius < 0:
+            return []
+        # the diamond has 2r(r+1)+1 cells; past the entity count a scan wins
+        if 2 * radius * (radius + 1) + 1 > len(self.entities):
+            cx, cy, location = center.x, center.y, self.location
+            return [
+                e
+                for e in self.entities
+                if abs(location(e).x - cx) + abs(location(e).y - cy) <= radius
+            ]
+        found = []
+        for k in range(radius + 1):
+            found.extend(self.ring_indices(center, k))
+        found.sort()
+        return [self.entities[i] for i in found]
+
+    def first_hit(
+        self,
+        center: Point,
+        max_radius: int,
+        distance: Callable[[object], int | None] | None = None,
+        min_radius: int = 0,
+    ):
+        """
+        Searches outwards from `center` for the closest entity.
+
+        Args:
+            center (Point): Search origin.
+            max_radius (int): Largest distance accepted.
+            distance (Callable | None): True distance of an entity from
+                `center`, never below the Manhattan one (e.g. the path
+                distance), or None when unreachable. Defaults to Manhattan.
+            min_radius (int): Smallest distance accepted.
+
+        Returns:
+            The entity with the smallest distance in range, ties going to
+            the earliest in the source list, or None.
+        """
+        best = None
+        for k in range(max_radius + 1):
+            if best is not None and k > best[0]:
+                break
+            for i in self.ring_indices(center, k):
+                d = k if distance is None else distance(self.entities[i])
+                if d is None or not min_radius <= d <= max_radius:
+                    continue
+                if best is None or (d, i) < best:
+                    best = (d, i)
+        return None if best is None else self.entities[best[1]]
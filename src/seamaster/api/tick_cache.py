@@ -0,0 +1,95 @@
+"""
+TickCache module memoizes per-tick queries so that work shared by every
+bot of a tick is done once.
+"""
+
+import functools
+from typing import Callable
+
+_MISSING = object()
+
+
+class TickCache:
+    """
+    Results keyed by query, valid for one tick.
+
+    The cache is stamped with the view's revision and tick, and clears
+    itself as soon as either changes. The revision tells apart two views
+    that carry the same tick number (the wrapper linearizes ticks, so two
+    engine ticks can share one) and a long-lived view patched by a delta.
+    """
+
+    def __init__(self):
+        self.stamp: tuple | None = None
+        self.entries: dict = {}
+        self.hits: dict[str, int] = {}
+        self.misses: dict[str, int] = {}
+
+    def sync(self, view) -> None:
+        """
+        Drops every entry if `view` is not the one the cache was filled from.
+        """
+        stamp = (view.revision, view.tick)
+        if stamp != self.stamp:
+            self.stamp = stamp
+            self.entries.clear()
+
+    def get(self, name: str, key, compute: Callable[[], object]):
+        """
+        Returns the cached result for `key`, calling `compute` on a miss.
+
+        Args:
+            name (str): Query name the counters are kept under.
+            key: Hashable key of the query, including `name`.
+            compute (Callable): Produces the result.
+        """
+        value = self.entries.get(key, _MISSING)
+        if value is _MISSING:
+            self.misses[name] = self.misses.get(name, 0) + 1
+            value = self.entries[key] = compute()
+        else:
+            self.hits[name] = self.hits.get(name, 0) + 1
+        return value
+
+    def stats(self) -> dict[str, tuple[int, int]]:
+        """
+        Returns (hits, misses) per query name.
+        """
+        names = self.hits.keys() | self.misses.keys()
+        return {n: (self.hits.get(n, 0), self.misses.get(n, 0)) for n in sorted(names)}
+
+
+def _api_of(owner):
+    # GameAPI itself, a BotContext (.api) or a BotController (.ctx.api)
+    if isinstance(getattr(owner, "cache", None), TickCache):
+        return owner
+    api = getattr(owner, "api", None)
+    if api is None:
+        api = owner.ctx.api
+    return api
+
+
+def tick_cached(method: Callable) -> Callable:
+    """
+    Memoizes a method for the rest of the tick, shared by every bot.
+
+    Works on GameAPI, BotContext and BotController methods. The result
+    must depend only on the arguments and the tick, not on which bot asks.
+    Results are shared, so callers must not mutate them. Calls with
+    unhashable arguments are not cached.
+    """
+    name = method.__qualname__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        api = _api_of(self)
+        cache = api.cache
+        cache.sync(api.view)
+        key = (name, args, tuple(sorted(kwargs.items()))) if kwargs else (name, args)
+        try:
+            hash(key)
+        except TypeError:
+            return method(self, *args, **kwargs)
+        return cache.get(name, key, lambda: method(self, *args, **kwargs))
+
+    return wrapper
@@ -0,0 +1,29 @@
+"""
+Benchmarks of the SDK hot paths and the template bots on synthetic views.
+
+Run with `python -m seamaster.bench --help`.
+"""
+
+from seamaster.bench.runner import (
+    HELPERS,
+    POPULATIONS,
+    bench_import,
+    bench_scenario,
+    compare,
+    measure,
+    run,
+)
+from seamaster.bench.views import SCENARIOS, Scenario, synthetic_view
+
+__all__ = [
+    "HELPERS",
+    "POPULATIONS",
+    "SCENARIOS",
+    "Scenario",
+    "bench_import",
+    "bench_scenario",
+    "compare",
+    "measure",
+    "run",
+    "synthetic_view",
+]
@@ -0,0 +1,107 @@
+"""
+Command line of the benchmark suite.
+
+    python -m seamaster.bench -o results.json
+    python -m seamaster.bench --compare baseline.json
+    python -m seamaster.bench --scenario custom --width 60 --height 60 --bots 80
+"""
+
+import argparse
+import json
+import sys
+
+from seamaster.bench.runner import compare, run
+from seamaster.bench.views import SCENARIOS, Scenario
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m seamaster.bench")
+    parser.add_argument(
+        "--scenario",
+        default=",".join(SCENARIOS),
+        help="comma separated presets, or 'custom' to use the size options "
+        f"(presets: {', '.join(SCENARIOS)})",
+    )
+    parser.add_argument("--width", type=int, default=20)
+    parser.add_argument("--height", type=int, default=20)
+    parser.add_argument("--bots", type=int, default=20)
+    parser.add_argument("--enemies", type=int, default=20)
+    parser.add_argument("--algae", type=int, default=60)
+    parser.add_argument("--scraps", type=int, default=15)
+    parser.add_argument(
+        "--walls", type=int, default=None, help="random walls (default: packaged map)"
+    )
+    parser.add_argument("--repeat", type=int, default=200, help="samples per case")
+    parser.add_argument("--only", help="run only cases whose key contains this")
+    parser.add_argument("--no-import", action="store_true", help="skip import time")
+    parser.add_argument("-o", "--output", help="write the results here")
+    parser.add_argument("--compare", help="baseline results to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.15,
+        help="relative median slowdown that counts as a regression",
+    )
+    args = parser.parse_args(argv)
+
+    scenarios = []
+    for name in args.scenario.split(","):
+        if name == "custom":
+            scenarios.append(
+                Scenario(
+                    "custom",
+                    width=args.width,
+                    height=args.height,
+                    bots=args.bots,
+                    enemies=args.enemies,
+                    algae=args.algae,
+                    scraps=args.scraps,
+                    walls=args.walls,
+                )
+            )
+        elif name in SCENARIOS:
+            scenarios.append(SCENARIOS[name])
+        else:
+            parser.error(f"unknown scenario: {name}")
+
+    results = run(
+        scenarios,
+        repeat=args.repeat,
+        only=args.only,
+        include_import=not args.no_import,
+    )
+    text = json.dumps(results, indent=1)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    elif not args.compare:
+        print(text)
+
+    if not args.compare:
+        return 0
+    with open(args.compare) as f:
+        baseline = json.load(f)
+    # cases left out on purpose are not missing
+    baseline["results"] = {
+        key: result
+        for key, result in baseline.get("results", {}).items()
+        if (args.only is None or args.only in key)
+        and (key != "import" or not args.no_import)
+        and key.split("/")[0] in {s.name for s in scenarios} | {"import"}
+    }
+    rows = compare(results, baseline, args.threshold)
+    for row in rows:
+        print(json.dumps(row, separators=(",", ":")))
+    failed = {
+        status: [r["case"] for r in rows if r["status"] == status]
+        for status in ("regressed", "error", "missing")
+    }
+    print(
+        json.dumps({"compared": len(rows), **failed}, separators=(",", ":")),
+        file=sys.stderr,
+    )
+    return 1 if any(failed.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
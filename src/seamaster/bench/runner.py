@@ -0,0 +1,293 @@
+"""
+Benchmark cases, timing and baseline comparison.
+"""
+
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable, Iterable
+
+from seamaster.api.game_api import GameAPI
+from seamaster.bench.views import SCENARIOS, Scenario, synthetic_view
+from seamaster.context.bot_context import BotContext
+from seamaster.models.player_view import PlayerView
+from seamaster.templates.forager import Forager
+from seamaster.templates.lurker import Lurker
+from seamaster.templates.saboteur import Saboteur
+from seamaster.templates.scout import Scout
+from seamaster.wrapper import WrapperState
+
+# BotContext helpers, called on the first own bot; `far` is a distant cell
+HELPERS: dict[str, Callable] = {
+    "sense_enemies_in_radius": lambda c, loc, far: c.sense_enemies_in_radius(loc, 4),
+    "sense_first_enemy": lambda c, loc, far: c.sense_first_enemy(loc, 10),
+    "sense_own_bots_in_radius": lambda c, loc, far: c.sense_own_bots_in_radius(loc, 4),
+    "sense_unknown_algae": lambda c, loc, far: c.sense_unknown_algae(loc),
+    "sense_unknown_algae_k1": lambda c, loc, far: c.sense_unknown_algae(loc, k=1),
+    "sense_non_poisionous_algae": lambda c, loc, far: c.sense_non_poisionous_algae(loc),
+    "sense_scraps_in_radius": lambda c, loc, far: c.sense_scraps_in_radius(loc, 4),
+    "sense_walls_in_radius": lambda c, loc, far: c.sense_walls_in_radius(loc, 3),
+    "sense_objects": lambda c, loc, far: c.sense_objects(),
+    "get_depositing_banks_sorted": lambda c, loc, far: c.get_depositing_banks_sorted(),
+    "get_my_banks": lambda c, loc, far: c.get_my_banks(loc),
+    "get_opponent_banks": lambda c, loc, far: c.get_opponent_banks(loc),
+    "get_nearest_algae": lambda c, loc, far: c.get_nearest_algae(),
+    "get_nearest_enemy": lambda c, loc, far: c.get_nearest_enemy(),
+    "get_nearest_scrap": lambda c, loc, far: c.get_nearest_scrap(),
+    "get_nearest_energy_pad": lambda c, loc, far: c.get_nearest_energy_pad(),
+    "check_blocked_point": lambda c, loc, far: c.check_blocked_point(far),
+    "can_reach_and_recharge": lambda c, loc, far: c.can_reach_and_recharge(far, 1),
+    "move_target": lambda c, loc, far: c.move_target(loc, far),
+    "move_target_speed": lambda c, loc, far: c.move_target_speed(loc, far),
+    "nearest_remembered": lambda c, loc, far: c.nearest_remembered("algae"),
+    "assigned_target": lambda c, loc, far: c.assigned_target("unknown_algae"),
+}
+
+POPULATIONS: dict[str, tuple] = {
+    "forager": (Forager,),
+    "scout": (Scout,),
+    "lurker": (Lurker,),
+    "saboteur": (Saboteur,),
+    "mixed": (Forager, Scout, Lurker, Saboteur),
+}
+
+
+def measure(setup: Callable[[], Callable], repeat: int, warmup: int = 3) -> dict:
+    """
+    Times a case.
+
+    Args:
+        setup (Callable[[], Callable]): Returns the call to time; runs
+            before every sample and is not timed.
+        repeat (int): Samples taken.
+        warmup (int): Untimed runs first.
+
+    Returns:
+        dict: Sample count and min, median, mean and p90 in microseconds,
+        or the error the case raised.
+    """
+    try:
+        for _ in range(warmup):
+            setup()()
+        samples = []
+        for _ in range(repeat):
+            fn = setup()
+            started = time.perf_counter_ns()
+            fn()
+            samples.append(time.perf_counter_ns() - started)
+    except Exception as exc:
+        return {"error": f"{type(exc).__name__}: {exc}"}
+    samples.sort()
+    return {
+        "n": len(samples),
+        "min_us": round(samples[0] / 1000, 3),
+        "median_us": round(statistics.median(samples) / 1000, 3),
+        "mean_us": round(statistics.fmean(samples) / 1000, 3),
+        "p90_us": round(samples[int(0.9 * (len(samples) - 1))] / 1000, 3),
+    }
+
+
+def bench_import(repeat: int = 5) -> dict:
+    """
+    Times `import seamaster` in fresh interpreters.
+    """
+    code = (
+        "import time; t = time.perf_counter_ns(); import seamaster; "
+        "print(time.perf_counter_ns() - t)"
+    )
+    samples = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        samples.append(int(out.stdout.strip()))
+    samples.sort()
+    return {
+        "n": len(samples),
+        "min_us": round(samples[0] / 1000, 3),
+        "median_us": round(statistics.median(samples) / 1000, 3),
+        "mean_us": round(statistics.fmean(samples) / 1000, 3),
+        "p90_us": round(samples[int(0.9 * (len(samples) - 1))] / 1000, 3),
+    }
+
+
+def bench_scenario(
+    scenario: Scenario, repeat: int, only: str | None = None
+) -> dict[str, dict]:
+    """
+    Runs the view, helper and tick cases on one scenario.
+
+    Args:
+        scenario (Scenario): View sizes.
+        repeat (int): Samples per case.
+        only (str | None): Run only cases whose key contains this.
+
+    Returns:
+        dict[str, dict]: Result per "<scenario>/<group>/<case>" key.
+    """
+    data = synthetic_view(scenario)
+    line = json.dumps(data)
+    results: dict[str, dict] = {}
+
+    def run(key: str, setup: Callable[[], Callable], n: int = repeat) -> None:
+        key = f"{scenario.name}/{key}"
+        if only is None or only in key:
+            results[key] = measure(setup, n)
+
+    run("view/from_dict", lambda: lambda: PlayerView.from_dict(json.loads(line)))
+    run(
+        "view/from_dict_full",
+        lambda: lambda: _decode_all(PlayerView.from_dict(json.loads(line))),
+    )
+    run("view/json_loads", lambda: lambda: json.loads(line))
+
+    view = PlayerView.from_dict(json.loads(line))
+    _decode_all(view)
+    bot = next(iter(view.bots.values()))
+    far = max(
+        (a.location for a in view.visible_entities.algae),
+        key=lambda p: abs(p.x - bot.location.x) + abs(p.y - bot.location.y),
+    )
+
+    def helper_setup(helper: Callable) -> Callable[[], Callable]:
+        def setup():
+            # a fresh api per sample, so tick caches start cold
+            ctx = BotContext(GameAPI(view), bot)
+            return lambda: helper(ctx, bot.location, far)
+
+        return setup
+
+    for name, helper in HELPERS.items():
+        run(f"helper/{name}", helper_setup(helper))
+
+    for name, classes in POPULATIONS.items():
+        run(
+            f"tick/{name}",
+            _tick_setup(line, list(view.bots), classes),
+            max(5, repeat // 10),
+        )
+    return results
+
+
+def run(
+    scenarios: Iterable[Scenario] | None = None,
+    repeat: int = 200,
+    only: str | None = None,
+    include_import: bool = True,
+) -> dict:
+    """
+    Runs the suite.
+
+    Args:
+        scenarios (Iterable[Scenario] | None): Defaults to SCENARIOS.
+        repeat (int): Samples per case.
+        only (str | None): Run only cases whose key contains this.
+        include_import (bool): Also time `import seamaster`.
+
+    Returns:
+        dict: {"meta": ..., "results": {key: result}}.
+    """
+    scenarios = list(scenarios or SCENARIOS.values())
+    results: dict[str, dict] = {}
+    if include_import and (only is None or only in "import"):
+        results["import"] = bench_import()
+    for scenario in scenarios:
+        results.update(bench_scenario(scenario, repeat, only))
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "scenarios": [s.to_dict() for s in scenarios],
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(
+    current: dict, baseline: dict, threshold: float = 0.15, min_delta_us: float = 1.0
+) -> list[dict]:
+    """
+    Compares the medians of two runs.
+
+    Args:
+        current (dict): Output of `run`.
+        baseline (dict): A stored output of `run`.
+        threshold (float): Relative slowdown counted as a regression.
+        min_delta_us (float): Smaller absolute changes are noise.
+
+    Returns:
+        list[dict]: One row per case timed in the baseline or failing now,
+        with "status" "regressed", "improved" or "ok"; "error" when the
+        case raised in the current run and "missing" when the current run
+        lacks it. Both of these count as regressions.
+    """
+    rows = []
+    base_results = baseline.get("results", {})
+    results = current.get("results", {})
+    for key in {**base_results, **results}:
+        base = base_results.get(key) or {}
+        result = results.get(key)
+        old = base.get("median_us")
+        if result is None or "median_us" not in result:
+            if result is None and old is None:
+                continue
+            rows.append(
+                {
+                    "case": key,
+                    "baseline_us": old,
+                    "current_us": None,
+                    "ratio": None,
+                    "status": "missing" if result is None else "error",
+                    **({"error": result["error"]} if result else {}),
+                }
+            )
+            continue
+        if old is None:
+            # new case, or one the baseline failed: nothing to compare to
+            continue
+        new = result["median_us"]
+        ratio = new / old if old else float("inf")
+        status = "ok"
+        if abs(new - old) >= min_delta_us:
+            if ratio > 1 + threshold:
+                status = "regressed"
+            elif ratio < 1 / (1 + threshold):
+                status = "improved"
+        rows.append(
+            {
+                "case": key,
+                "baseline_us": old,
+                "current_us": new,
+                "ratio": round(ratio, 3),
+                "status": status,
+            }
+        )
+    return rows
+
+
+def _decode_all(view: PlayerView) -> PlayerView:
+    # reading a lazy collection decodes it; every property of the entity
+    # groups is read, so collections made lazy later are covered too
+    for group in (view.visible_entities, view.permanent_entities):
+        for name, attr in vars(type(group)).items():
+            if isinstance(attr, property):
+                getattr(group, name)
+    return view
+
+
+def _tick_setup(line: str, bot_ids: list[int], classes: tuple) -> Callable:
+    state = WrapperState(lambda api: [])
+    for i, bot_id in enumerate(bot_ids):
+        state.lifecycle.register(bot_id, classes[i % len(classes)])
+
+    def setup():
+        data = json.loads(line)
+        return lambda: state.step(data)
+
+    return setup
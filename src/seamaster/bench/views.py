@@ -0,0 +1,182 @@
+"""
+Synthetic views for the benchmarks.
+"""
+
+import random
+
+from seamaster.simulator import DEFAULT_WALLS
+
+
+class Scenario:
+    """
+    Size parameters of a synthetic view.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        width: int = 20,
+        height: int = 20,
+        bots: int = 20,
+        enemies: int = 20,
+        algae: int = 60,
+        scraps: int = 15,
+        walls: int | None = None,
+    ):
+        """
+        Args:
+            name (str): Name used in the result keys.
+            width (int): Map width.
+            height (int): Map height.
+            bots (int): Own bots; the first one also has SPEEDBOOST.
+            enemies (int): Visible enemy bots.
+            algae (int): Visible algae, a third of each AlgaeType.
+            scraps (int): Visible scraps.
+            walls (int | None): Random walls, None for the packaged map's
+                walls (20x20 only).
+        """
+        self.name = name
+        self.width = width
+        self.height = height
+        self.bots = bots
+        self.enemies = enemies
+        self.algae = algae
+        self.scraps = scraps
+        self.walls = walls
+
+    def to_dict(self) -> dict:
+        return dict(self.__dict__)
+
+
+SCENARIOS = {
+    "default": Scenario("default"),
+    "crowded": Scenario("crowded", bots=50, enemies=50, algae=120, scraps=30),
+    "large": Scenario(
+        "large",
+        width=40,
+        height=40,
+        bots=60,
+        enemies=60,
+        algae=300,
+        scraps=40,
+        walls=120,
+    ),
+}
+
+
+def synthetic_view(scenario: Scenario, seed: int = 0, tick: int = 1) -> dict:
+    """
+    Builds a PlayerView-shaped dict with entities on random free cells.
+
+    Args:
+        scenario (Scenario): Sizes of the view.
+        seed (int): Seeds the placement.
+        tick (int): Raw tick of the view.
+
+    Returns:
+        dict: The view.
+
+    Raises:
+        ValueError: If the entities do not fit on the map.
+    """
+    rng = random.Random(seed)
+    width, height = scenario.width, scenario.height
+    if scenario.walls is None:
+        walls = set(DEFAULT_WALLS)
+    else:
+        walls = set()
+        while len(walls) < min(scenario.walls, width * height // 4):
+            walls.add((rng.randrange(1, width - 1), rng.randrange(height)))
+
+    banks = [(1, height // 4), (1, 3 * height // 4)]
+    banks += [(width - 2, y) for _, y in banks]
+    pads = [(width // 2, height // 2), (width // 2 - 1, height // 2 - 1)]
+    walls -= set(banks) | set(pads)
+
+    free = [
+        (x, y)
+        for y in range(height)
+        for x in range(width)
+        if (x, y) not in walls and (x, y) not in banks and (x, y) not in pads
+    ]
+    needed = scenario.bots + scenario.enemies + scenario.algae + scenario.scraps
+    if needed > len(free):
+        raise ValueError(f"{needed} entities do not fit in {len(free)} free cells")
+    rng.shuffle(free)
+    cells = iter(free)
+
+    bots = {}
+    for i in range(scenario.bots):
+        x, y = next(cells)
+        bots[str(1000 + i)] = {
+            "id": 1000 + i,
+            "location": {"x": x, "y": y},
+            "energy": rng.randint(5, 50),
+            "scraps": 0,
+            # the first bot, used by the helper cases, can also speed boost
+            "abilities": ["HARVEST", "DEPOSIT"] + (["SPEEDBOOST"] if i == 0 else []),
+            "algae_held": rng.randint(0, 6),
+            "traversal_cost": 1.0,
+            "status": "ACTIVE",
+        }
+    enemies = [
+        {
+            "id": 200000 + i,
+            "location": _loc(next(cells)),
+            "scraps": 0,
+            "abilities": ["HARVEST"],
+        }
+        for i in range(scenario.enemies)
+    ]
+    kinds = ("UNKNOWN", "TRUE", "FALSE")
+    algae = [
+        {"location": _loc(next(cells)), "is_poison": kinds[i % 3]}
+        for i in range(scenario.algae)
+    ]
+    scraps = [
+        {"location": _loc(next(cells)), "amount": 3} for _ in range(scenario.scraps)
+    ]
+
+    return {
+        "side": 0,
+        "tick": tick,
+        "scraps": 100,
+        "algae": 0,
+        "bot_id_seed": 1000,
+        "max_bots": 100,
+        "width": width,
+        "height": height,
+        "bots": bots,
+        "visible_entities": {"enemies": enemies, "scraps": scraps, "algae": algae},
+        "permanent_entities": {
+            "banks": {
+                str(i): {
+                    "id": i,
+                    "location": _loc(pos),
+                    "deposit_occuring": i % 2 == 1,
+                    "deposit_amount": 4 if i % 2 else 0,
+                    "is_deposit_owner": False,
+                    "is_bank_owner": i < 2,
+                    "deposit_ticks_left": 3 if i % 2 else 0,
+                    "lockpick_occuring": False,
+                    "lockpick_ticks_left": 0,
+                    "lockpick_botid": -1,
+                }
+                for i, pos in enumerate(banks)
+            },
+            "energy_pads": {
+                str(i): {
+                    "id": i,
+                    "location": _loc(pos),
+                    "available": 1,
+                    "ticks_left": 0,
+                }
+                for i, pos in enumerate(pads)
+            },
+            "walls": [_loc(w) for w in sorted(walls)],
+        },
+    }
+
+
+def _loc(pos: tuple[int, int]) -> dict:
+    return {"x": pos[0], "y": pos[1]}
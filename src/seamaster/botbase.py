@@ -21,6 +21,26 @@ class BotController(ABC):
     def act(self) -> Action | None:
         pass
 
+    def fallback(self) -> Action | None:
+        """
+        Action used instead of `act()` when the tick is running out of time.
+        Must be cheap; the default idles.
+        """
+        return None
+
+    def on_spawn(self) -> None:
+        """
+        Called once, right before the first `act()` of the bot, with `ctx`
+        already set.
+        """
+
+    def on_death(self) -> None:
+        """
+        Called once after the bot disappeared from the view. `ctx` still
+        refers to the last tick the bot was alive. The controller is freed
+        afterwards and may be recycled for a new bot.
+        """
+
     @classmethod
     def spawn(cls, location: int = 0, args: dict | None = None) -> dict:
         """
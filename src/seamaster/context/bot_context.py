@@ -4,7 +4,13 @@ BotContext module provides a read-only interface for bot strategies
 to interact with the game engine state safely.
 """
 
+import heapq
+from typing import Callable, Iterator
+
+from seamaster import shortest_distances
+from seamaster.api.energy import EnergyOracle, loadout_traversal_cost
 from seamaster.api.game_api import GameAPI
+from seamaster.api.occupancy import BLOCKING
 from seamaster.constants import Direction, Ability, SCRAP_COSTS
 from seamaster.models.algae import Algae
 from seamaster.models.bank import Bank
@@ -13,7 +19,15 @@ from seamaster.models.enemy_bot import EnemyBot
 from seamaster.models.energy_pad import EnergyPad
 from seamaster.models.point import Point
 from seamaster.models.scrap import Scrap
-from seamaster.utils import get_shortest_distance_between_points, get_optimal_next_hops
+from seamaster.utils import (
+    cell_of,
+    get_direction_in_one_radius,
+    get_optimal_next_hops_between_cells,
+    get_optimal_speed_hops_between_cells,
+    get_shortest_distance_between_cells,
+    get_shortest_distance_between_points,
+    point_of_cell,
+)
 
 
 class BotContext:
@@ -43,6 +57,16 @@ class BotContext:
 
     # ==================== ROBOT STATUS ====================
 
+    def time_remaining(self) -> float:
+        """
+        Get the time left before the tick's deadline. Anytime strategies
+        can poll this and return their best answer so far once it runs low.
+
+        Returns:
+            float: Seconds left, inf when the tick has no limit.
+        """
+        return self.api.time_remaining()
+
     def get_id(self) -> int:
         """
         Get the unique identifier of this bot.
@@ -120,6 +144,49 @@ class BotContext:
 
         return total_scrap
 
+    # ==================== ENERGY ====================
+
+    def get_traversal_cost(self) -> float:
+        """
+        Get the energy this bot spends per cell moved.
+
+        Returns:
+            float: Traversal cost reported by the engine, or the sum of the
+            loadout's ABILITY_COSTS when the engine did not report one.
+        """
+        cost = getattr(self.bot, "traversal_cost", None)
+        if cost is None:
+            return loadout_traversal_cost(self.bot.abilities)
+        return cost
+
+    def energy_oracle(self) -> EnergyOracle:
+        """
+        Get the energy oracle for this bot's loadout.
+
+        Returns:
+            EnergyOracle: Travel energy costs for this tick.
+        """
+        return self.api.energy_oracle(self.get_traversal_cost())
+
+    def can_reach_and_recharge(self, target: Point, action_cost: float = 0) -> bool:
+        """
+        Check whether the bot can move to `target`, spend `action_cost`
+        there, and still reach the energy pad nearest to `target` on its
+        current energy.
+
+        Args:
+            target (Point): Position the bot wants to go to.
+            action_cost (float): Energy spent at the target, e.g. the
+                HARVEST action cost.
+
+        Returns:
+            bool: False if the trip cannot be afforded or has no path.
+        """
+        needed = self.energy_oracle().round_trip(self.bot.location, target)
+        if needed is None:
+            return False
+        return self.bot.energy >= needed + action_cost
+
     # ==================== SENSING ====================
 
     def sense_enemies(self):
@@ -142,11 +209,30 @@ class BotContext:
         Returns:
             list[EnemyBot]: Enemies within radius.
         """
-        return [
-            b
-            for b in self.api.visible_enemies()
-            if get_shortest_distance_between_points(b.location, bot) <= radius
-        ]
+        return self._within("enemies", bot, radius)
+
+    def sense_first_enemy(
+        self, bot: Point, max_radius: int, min_radius: int = 0
+    ) -> EnemyBot | None:
+        """
+        Find the closest enemy within a distance range, searching outwards
+        from a point ring by ring.
+
+        Args:
+            bot (Point): Center position.
+            max_radius (int): Largest distance searched.
+            min_radius (int): Smallest distance accepted.
+
+        Returns:
+            EnemyBot | None: Closest enemy in range, or None.
+        """
+        center = cell_of(bot)
+        return self.api.spatial_index("enemies").first_hit(
+            bot,
+            max_radius,
+            lambda e: get_shortest_distance_between_cells(cell_of(e.location), center),
+            min_radius,
+        )
 
     def sense_own_bots(self) -> list[Bot]:
         """
@@ -168,47 +254,111 @@ class BotContext:
         Returns:
             list[Bot]: Friendly bots within radius.
         """
-        return [
-            b
-            for b in self.api.get_my_bots()
-            if b.id != self.bot.id
-            and get_shortest_distance_between_points(b.location, bot) <= radius
-        ]
+        return [b for b in self._within("own_bots", bot, radius) if b.id != self.bot.id]
 
-    def sense_unknown_algae(self, bot: Point) -> list[tuple[int, Algae]]:
+    def iter_by_distance(
+        self,
+        bot: Point,
+        entities: list,
+        predicate: Callable[[object], bool] | None = None,
+    ) -> Iterator[tuple[int, object]]:
         """
-        Detect algae within a Manhattan radius of a point.
+        Yield entities in increasing path distance from a point, computing
+        the order lazily. Ties keep the order of `entities`; unreachable
+        entities are skipped.
 
         Args:
             bot (Point): Center position.
-            radius (int): Manhattan distance radius.
+            entities (list): Entities with a `location`.
+            predicate (Callable | None): Keeps only entities it accepts.
 
         Returns:
-            list[Algae]: Algae within radius.
+            Iterator[tuple[int, object]]: (distance, entity) pairs.
         """
-        result = []
+        heap = self._distances(bot, entities, predicate)
+        heapq.heapify(heap)
+        while heap:
+            d, i = heapq.heappop(heap)
+            yield d, entities[i]
+
+    def nearest_k(
+        self,
+        bot: Point,
+        entities: list,
+        k: int,
+        predicate: Callable[[object], bool] | None = None,
+    ) -> list[tuple[int, object]]:
+        """
+        Return the `k` entities closest to a point, nearest first, with the
+        same ordering as `iter_by_distance`.
+
+        Args:
+            bot (Point): Center position.
+            entities (list): Entities with a `location`.
+            k (int): Number of entities wanted.
+            predicate (Callable | None): Keeps only entities it accepts.
+
+        Returns:
+            list[tuple[int, object]]: (distance, entity) pairs.
+        """
+        pairs = self._distances(bot, entities, predicate)
+        if k == 1 and pairs:
+            # a single linear pass covers the common "nearest one" case
+            d, i = min(pairs)
+            return [(d, entities[i])]
+        return [(d, entities[i]) for d, i in heapq.nsmallest(k, pairs)]
+
+    def _distances(
+        self,
+        bot: Point,
+        entities: list,
+        predicate: Callable[[object], bool] | None,
+    ) -> list[tuple[int, int]]:
+        center = cell_of(bot)
+        pairs = []
+        for i, e in enumerate(entities):
+            if predicate is not None and not predicate(e):
+                continue
+            d = get_shortest_distance_between_cells(cell_of(e.location), center)
+            if d is not None:
+                pairs.append((d, i))
+        return pairs
 
-        for a in self.api.visible_algae():
-            d = get_shortest_distance_between_points(bot, a.location)
+    def sense_unknown_algae(
+        self, bot: Point, k: int | None = None
+    ) -> list[tuple[int, Algae]]:
+        """
+        Detect algae whose poison status is unknown, nearest first.
 
-            if d is not None and a.is_poison == "UNKNOWN":
-                result.append((d, a))
+        Args:
+            bot (Point): Center position.
+            k (int | None): Return at most this many, None for all.
 
-        return sorted(result, key=lambda x: x[0])
+        Returns:
+            list[tuple[int, Algae]]: (distance, algae) pairs.
+        """
+        return self._sense_algae(bot, "UNKNOWN", k)
 
-    def sense_non_poisionous_algae(self, bot: Point) -> list[tuple[int, Algae]]:
+    def sense_non_poisionous_algae(
+        self, bot: Point, k: int | None = None
+    ) -> list[tuple[int, Algae]]:
         """
-        Returns List of non_poisonous algae
+        Returns List of non_poisonous algae, nearest first, at most `k` of
+        them when given.
         """
-        result = []
+        return self._sense_algae(bot, "FALSE", k)
 
-        for a in self.api.visible_algae():
-            d = get_shortest_distance_between_points(bot, a.location)
+    def _sense_algae(
+        self, bot: Point, is_poison: str, k: int | None
+    ) -> list[tuple[int, Algae]]:
+        algae = self.api.visible_algae()
 
-            if d is not None and a.is_poison == "FALSE":
-                result.append((d, a))
-        sorted_result = sorted(result, key=lambda x: x[0])
-        return sorted_result
+        def predicate(a: Algae) -> bool:
+            return a.is_poison == is_poison
+
+        if k is None:
+            return list(self.iter_by_distance(bot, algae, predicate))
+        return self.nearest_k(bot, algae, k, predicate)
 
     def sense_scraps_in_radius(self, bot: Point, radius: int = 0) -> list[Scrap]:
         """
@@ -221,11 +371,7 @@ class BotContext:
         Returns:
             list[Scrap]: Scraps within radius.
         """
-        return [
-            s
-            for s in self.api.visible_scraps()
-            if get_shortest_distance_between_points(s.location, bot) == radius
-        ]
+        return self._within("scraps", bot, radius, exact=True)
 
     def sense_objects(self) -> dict[str, list]:
         """
@@ -260,11 +406,24 @@ class BotContext:
         Returns:
             list[Wall]: Walls within radius.
         """
-        return [
-            w
-            for w in self.api.visible_walls()
-            if get_shortest_distance_between_points(w, bot) <= radius
-        ]
+        # walls have no path distance, so they are measured in Manhattan
+        return self.api.spatial_index("walls").within(bot, radius)
+
+    def _within(
+        self, category: str, bot: Point, radius: int, exact: bool = False
+    ) -> list:
+        """
+        Entities of a spatial index category whose path distance from `bot`
+        is at most (or, with `exact`, exactly) `radius`. Path distance is
+        never below Manhattan, so only the Manhattan diamond is searched.
+        """
+        center = cell_of(bot)
+        result = []
+        for e in self.api.spatial_index(category).within(bot, radius):
+            d = get_shortest_distance_between_cells(cell_of(e.location), center)
+            if d is not None and (d == radius if exact else d <= radius):
+                result.append(e)
+        return result
 
     # ============= REACTING TO GAME STATE =============
 
@@ -275,10 +434,10 @@ class BotContext:
         Returns:
             list[Bank]: Depositing banks sorted by distance.
         """
-        pos = self.bot.location
+        pos = cell_of(self.bot.location)
         return sorted(
             (b for b in self.api.banks() if b.deposit_occuring),
-            key=lambda b: get_shortest_distance_between_points(b.location, pos),
+            key=lambda b: get_shortest_distance_between_cells(cell_of(b.location), pos),
         )
 
     # ==================== PATHING ====================
@@ -300,7 +459,7 @@ class BotContext:
 
         if x < 0 or y < 0 or x >= self.api.view.width or y >= self.api.view.height:
             return None
-        return Point(x, y)
+        return Point.at(x, y)
 
     def next_point_speed(
         self, pos: Point, direction: Direction, step: int
@@ -324,7 +483,7 @@ class BotContext:
 
         if x < 0 or y < 0 or x >= self.api.view.width or y >= self.api.view.height:
             return None
-        return Point(x, y)
+        return Point.at(x, y)
 
     def can_move(self, direction: Direction) -> bool:
         """
@@ -352,25 +511,7 @@ class BotContext:
         Returns:
             bool: True if blocked.
         """
-
-        if (
-            pos.x < 0
-            or pos.y < 0
-            or pos.x >= self.api.view.width
-            or pos.y >= self.api.view.height
-        ):
-            return True
-
-        if any(w == pos for w in self.api.visible_walls()):
-            return True
-
-        if any(e.location == pos for e in self.api.visible_enemies()):
-            return True
-
-        if any(b.location == pos for b in self.api.get_my_bots()):
-            return True
-
-        return False
+        return self.api.occupancy().is_blocked(pos)
 
     def check_blocked_direction(self, direction: Direction) -> bool:
         """
@@ -414,16 +555,27 @@ class BotContext:
 
     # ==================== NEAREST OBJECT HELPERS ====================
 
+    def _nearest(self, category: str, entities: Callable[[], list]):
+        """
+        Nearest entity of a category, read from the tick's distance field.
+        Falls back to scanning `entities` when none is reachable from the
+        bot's cell.
+        """
+        pos = cell_of(self.bot.location)
+        nearest = self.api.distance_field(category).nearest(pos)
+        if nearest is not None:
+            return nearest
+        return min(
+            entities(),
+            key=lambda e: get_shortest_distance_between_cells(cell_of(e.location), pos),
+        )
+
     def get_nearest_bank(self) -> Bank:
         """
         Returns:
             Bank: Nearest bank.
         """
-        pos = self.bot.location
-        return min(
-            self.api.banks(),
-            key=lambda b: get_shortest_distance_between_points(b.location, pos),
-        )
+        return self._nearest("banks", self.api.banks)
 
     def get_energy_pads(self) -> list[EnergyPad]:
         """
@@ -432,16 +584,14 @@ class BotContext:
         """
         return self.api.energypads()
 
-    def get_nearest_energy_pad(self) -> EnergyPad:
+    def get_nearest_energy_pad(self) -> EnergyPad | None:
         """
         Return:
-            EnergyPad: Nearest energy pad.
+            EnergyPad | None: Nearest energy pad, None if there is none.
         """
-        pos = self.bot.location
-        return min(
-            self.api.energypads(),
-            key=lambda p: get_shortest_distance_between_points(p.location, pos),
-        )
+        if not self.api.energypads():
+            return None
+        return self._nearest("energypads", self.api.energypads)
 
     def get_my_banks(self, bot: Point) -> list[Bank] | None:
         """
@@ -449,17 +599,14 @@ class BotContext:
         (distance is min distance to any adjacent cell of the bank)
         """
 
-        my_banks = [b for b in self.api.banks() if b.is_bank_owner]
+        my_banks = list(self.api.my_banks())
 
         if not my_banks:
             return None
 
-        dirs = [(1, 0), (0, 1), (-1, 0), (0, -1)]
-
         def min_adjacent_distance(bank: Bank) -> int:
             distances = []
-            for dx, dy in dirs:
-                adj = Point(bank.location.x + dx, bank.location.y + dy)
+            for adj in _bank_sides(bank):
                 if not self.check_blocked_point(adj):
                     dist = get_shortest_distance_between_points(bot, adj)
                     if dist is not None:
@@ -483,11 +630,7 @@ class BotContext:
         min_dist = float("inf")
         min_point: Point | None = None
 
-        dirs = [(1, 0), (0, 1), (-1, 0), (0, -1)]
-
-        for dx, dy in dirs:
-            adj = Point(bank.location.x + dx, bank.location.y + dy)
-
+        for adj in _bank_sides(bank):
             if self.check_blocked_point(adj):
                 continue
 
@@ -503,7 +646,7 @@ class BotContext:
         """
         Returns a list of opponents banks sorted in ascending order of distance
         """
-        opp_banks = [b for b in self.api.banks() if not b.is_bank_owner]
+        opp_banks = list(self.api.opponent_banks())
         if not opp_banks:
             return None
         dist1 = get_shortest_distance_between_points(bot, opp_banks[0].location)
@@ -520,64 +663,179 @@ class BotContext:
         Return:
             Scrap: Nearest scrap.
         """
-        pos = self.bot.location
-        return min(
-            self.api.visible_scraps(),
-            key=lambda s: get_shortest_distance_between_points(s.location, pos),
-        )
+        return self._nearest("scraps", self.api.visible_scraps)
 
     def get_nearest_algae(self) -> Algae:
         """
         Return:
             Algae: Nearest algae.
         """
-        pos = self.bot.location
-        return min(
-            self.api.visible_algae(),
-            key=lambda a: get_shortest_distance_between_points(a.location, pos),
-        )
+        return self._nearest("algae", self.api.visible_algae)
 
     def get_nearest_enemy(self) -> EnemyBot:
         """
         Return:
             Bot: Nearest enemy.
         """
-        pos = self.bot.location
-        return min(
-            self.api.visible_enemies(),
-            key=lambda e: get_shortest_distance_between_points(e.location, pos),
-        )
+        return self._nearest("enemies", self.api.visible_enemies)
+
+    def recall(
+        self, category: str, max_age: int | None = None
+    ) -> list[tuple[Point, int, object]]:
+        """
+        Entities seen on this or earlier ticks, including those out of
+        sight now. Earlier ticks are only remembered with
+        SEAMASTER_MEMORY=1.
+
+        Args:
+            category (str): "algae", "enemies" or "scraps".
+            max_age (int | None): Drop sightings older than this many ticks.
+
+        Return:
+            list[tuple[Point, int, object]]: (position, age, detail) as in
+            WorldMemory.recall.
+        """
+        return self.api.memory().recall(category, max_age)
+
+    def nearest_remembered(
+        self, category: str, detail=None, max_age: int | None = None
+    ) -> Point | None:
+        """
+        Closest remembered position of a category by path distance.
+
+        Args:
+            category (str): "algae", "enemies" or "scraps".
+            detail: Only consider sightings with this detail, e.g.
+                AlgaeType.FALSE for algae known to be safe.
+            max_age (int | None): Drop sightings older than this many ticks.
+
+        Return:
+            Point | None: Closest position, or None.
+        """
+        center = cell_of(self.bot.location)
+        best = None
+        for pos, _, d in self.recall(category, max_age):
+            if detail is not None and d != detail:
+                continue
+            dist = get_shortest_distance_between_cells(cell_of(pos), center)
+            if dist is not None and (best is None or dist < best[0]):
+                best = (dist, pos)
+        return None if best is None else best[1]
+
+    def assigned_target(self, kind: str):
+        """
+        Target of a kind shared out to this bot, so that bots asking for
+        the same kind do not chase the same target.
+
+        Args:
+            kind (str): "unknown_algae" or "non_poisonous_algae".
+
+        Return:
+            Algae | None: Assigned target, or None if there is none left.
+        """
+        return self.api.assigned_target(self.bot.id, kind)
 
     # ==================== COLLISION AVOIDANCE ====================
 
-    def move_target(self, bot: Point, target: Point) -> Direction | None:
+    def move_target(
+        self, bot: Point, target: Point, avoid_obstacles: bool = True
+    ) -> Direction | None:
         """
         High-performance movement with collision and edge protection.
 
+        Follows the precomputed shortest path while one of its next hops is
+        free. When every hop is blocked by bots, an A* route around them is
+        planned and cached for this bot, and followed on later ticks until
+        the target changes or a hop of the shorter precomputed path is free
+        again; the route is repaired if it becomes blocked.
+
         Args:
             bot (Point): Current bot position.
             target (Point): Target position.
+            avoid_obstacles (bool): Plan around blocking bots instead of
+                giving up when every optimal hop is blocked.
 
         Returns:
             Direction | None: Preferred movement direction or None if blocked.
         """
-        priority = get_optimal_next_hops(bot, target)
+        src = cell_of(bot)
+        dst = cell_of(target)
+        priority = get_optimal_next_hops_between_cells(src, dst)
         if not priority:
             return None
+        self.api.move_targets[self.bot.id] = dst
+
+        planner = self.api.planner
+        plan = planner.plans.get(self.bot.id)
+        if avoid_obstacles and plan is not None and plan.target == dst:
+            left = plan.remaining(src)
+            direct = get_shortest_distance_between_cells(src, dst)
+            if left is not None and left <= direct:
+                # as short as the precomputed path, keep to it
+                return self._plan_direction(bot, src, dst)
+            # a detour: back to the precomputed path once one of its hops
+            # is free, else on along the plan below
 
         for direction in priority:
             if not self.check_blocked_direction(direction):
+                planner.forget(self.bot.id)
                 return direction
 
-        return None
+        if not avoid_obstacles:
+            return None
+        return self._plan_direction(bot, src, dst)
+
+    def _plan_direction(self, bot: Point, src: int, dst: int) -> Direction | None:
+        """
+        Next direction on this bot's planned route from `src` to `dst`.
+        """
+        occupancy = self.api.occupancy()
+        nxt = self.api.planner.next_cell(
+            self.bot.id,
+            shortest_distances.TABLES,
+            occupancy.grid,
+            BLOCKING,
+            src,
+            dst,
+        )
+        if nxt is None or occupancy.grid[nxt] & BLOCKING:
+            return None
+        return get_direction_in_one_radius(bot, point_of_cell(nxt))
 
     def move_target_speed(
         self, bot: Point, target: Point
     ) -> tuple[Direction | None, int]:
+        """
+        Movement for SPEED_BOOST bots, which cover one or two cells per move.
+
+        Takes the first free move of a minimum-tick route from the speed
+        tables. If all of those are blocked, falls back to the best free
+        move along the one-step shortest path.
+
+        Args:
+            bot (Point): Current bot position.
+            target (Point): Target position.
+
+        Returns:
+            tuple[Direction | None, int]: Direction and step size, or
+            (None, 0) if blocked.
+        """
         if Ability.SPEED_BOOST.value not in self.bot.abilities:
             raise ValueError("Bot does not have SPEED ability equipped.")
 
-        priority = get_optimal_next_hops(bot, target)
+        src = cell_of(bot)
+        dst = cell_of(target)
+        for direction, step in get_optimal_speed_hops_between_cells(src, dst):
+            p1 = self.next_point_speed(bot, direction, 1)
+            if p1 is None or self.check_blocked_point(p1):
+                continue
+            if step == 2:
+                p2 = self.next_point_speed(bot, direction, 2)
+                if p2 is None or self.check_blocked_point(p2):
+                    continue
+            return direction, step
+
+        priority = get_optimal_next_hops_between_cells(src, dst)
         if not priority:
             return None, 0
 
@@ -603,3 +861,13 @@ class BotContext:
             return one_step_fallback, 1
 
         return None, 0
+
+
+# cells around a bank in the order ties between them have always been
+# broken in: E, S, W, N
+_BANK_SIDES = ((1, 0), (0, 1), (-1, 0), (0, -1))
+
+
+def _bank_sides(bank: Bank) -> list[Point]:
+    x, y = bank.location.x, bank.location.y
+    return [Point.at(x + dx, y + dy) for dx, dy in _BANK_SIDES]
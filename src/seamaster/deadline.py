@@ -0,0 +1,128 @@
+"""
+Deadline module bounds the time the wrapper spends on one tick.
+
+Environment:
+    SEAMASTER_TICK_BUDGET_MS: Time allowed per tick, measured from the
+        moment the view is read from stdin (1000). 0 disables the limit.
+    SEAMASTER_TICK_RESERVE_MS: Part of the budget kept for resolving and
+        writing the response (50). Once only this much is left, the
+        remaining bots get their fallback action instead of `act()`.
+
+A value that is not a number is reported on stderr and the default used.
+"""
+
+import os
+import sys
+import time
+
+DEFAULT_BUDGET_MS = 1000
+DEFAULT_RESERVE_MS = 50
+
+
+class BotTiming:
+    """
+    Time spent in one bot's strategy across ticks.
+    """
+
+    __slots__ = ("calls", "total", "worst", "overruns", "fallbacks")
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.worst = 0.0
+        # act() calls that ended past the deadline
+        self.overruns = 0
+        # ticks the bot got its fallback action because time was up
+        self.fallbacks = 0
+
+
+class TickDeadline:
+    """
+    Deadline of the current tick plus per-bot timing statistics, kept by
+    the wrapper across ticks.
+    """
+
+    def __init__(self, budget: float | None, reserve: float = 0.0):
+        """
+        Args:
+            budget (float | None): Seconds per tick, None for no limit.
+            reserve (float): Seconds kept back for the response.
+        """
+        self.budget = budget
+        self.reserve = reserve
+        self.expires = float("inf")
+        self.stats: dict[int, BotTiming] = {}
+
+    @classmethod
+    def from_env(cls) -> "TickDeadline":
+        budget = _env_ms("SEAMASTER_TICK_BUDGET_MS", DEFAULT_BUDGET_MS)
+        reserve = _env_ms("SEAMASTER_TICK_RESERVE_MS", DEFAULT_RESERVE_MS)
+        return cls(budget / 1000 if budget > 0 else None, reserve / 1000)
+
+    def start(self, started: float | None = None) -> None:
+        """
+        Starts a tick.
+
+        Args:
+            started (float | None): time.perf_counter() value the tick
+                began at, e.g. when its view was read. Defaults to now.
+        """
+        if self.budget is None:
+            self.expires = float("inf")
+            return
+        if started is None:
+            started = time.perf_counter()
+        self.expires = started + self.budget
+
+    def remaining(self) -> float:
+        """
+        Returns the seconds left in the tick, negative once it is over.
+        """
+        return self.expires - time.perf_counter()
+
+    def exhausted(self) -> bool:
+        """
+        Returns whether only the reserve is left.
+        """
+        return self.remaining() <= self.reserve
+
+    def record(self, bot_id: int, elapsed: float, fallback: bool = False) -> None:
+        """
+        Accounts one strategy call of a bot.
+        """
+        timing = self.stats.get(bot_id)
+        if timing is None:
+            timing = self.stats[bot_id] = BotTiming()
+        if fallback:
+            timing.fallbacks += 1
+            return
+        timing.calls += 1
+        timing.total += elapsed
+        if elapsed > timing.worst:
+            timing.worst = elapsed
+        if self.remaining() < 0:
+            timing.overruns += 1
+
+    def forget(self, bot_id: int) -> None:
+        """
+        Drops the statistics of a bot that is gone.
+        """
+        self.stats.pop(bot_id, None)
+
+
+def _env_ms(name: str, default: float) -> float:
+    raw = os.environ.get(name)
+    if not raw:
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        value = float("nan")
+    if value != value:
+        # malformed or NaN: keep the bot alive with the default
+        print(
+            f"[WRAPPER] {name}={raw!r} is not a number, using {default}",
+            file=sys.stderr,
+        )
+        return default
+    return value
@@ -0,0 +1,171 @@
+"""
+Lifecycle module tracks which bot controllers are alive, runs their spawn
+and death hooks and frees them when their bot is gone.
+"""
+
+import sys
+import traceback
+from typing import Callable, Iterable
+
+from seamaster.botbase import BotController
+
+
+def user_call(bot_id: int, fn: Callable):
+    """
+    Runs a strategy method, logging and swallowing its errors.
+    """
+    try:
+        return fn()
+    except Exception as exc:
+        print(
+            f"[USER_CODE] Error in bot {bot_id}: {exc}\n{traceback.format_exc()}",
+            file=sys.stderr,
+        )
+        return None
+
+
+class ControllerPool:
+    """
+    Recycles controllers of bots that died, per strategy class, so that a
+    respawn of the same class reuses an instance instead of allocating one.
+    """
+
+    def __init__(self, max_per_class: int = 32):
+        """
+        Args:
+            max_per_class (int): Idle controllers kept per class.
+        """
+        self.max_per_class = max_per_class
+        self._idle: dict[type, list[BotController]] = {}
+        self.reused = 0
+
+    def acquire(self, strategy_cls: type) -> BotController:
+        """
+        Returns a freshly initialized controller of `strategy_cls`.
+
+        A recycled controller loses every instance attribute before
+        `__init__(None)` runs again, so nothing set by its previous bot
+        outside `__init__` carries over. Class attributes and `__slots__`
+        are not reset.
+        """
+        idle = self._idle.get(strategy_cls)
+        if idle:
+            controller = idle.pop()
+            controller.__dict__.clear()
+            controller.__init__(None)
+            self.reused += 1
+            return controller
+        return strategy_cls(None)
+
+    def release(self, controller: BotController) -> None:
+        """
+        Takes back the controller of a bot that is gone.
+        """
+        controller.ctx = None
+        idle = self._idle.setdefault(type(controller), [])
+        if len(idle) < self.max_per_class:
+            idle.append(controller)
+
+
+class Lifecycle:
+    """
+    Registry of the controllers of our bots.
+
+    A controller is registered when its bot is requested. It goes live
+    (and `on_spawn` runs) the first time the bot shows up in a view. A live
+    bot missing from a view has died: `on_death` runs and the controller is
+    dropped. A spawn that never shows up within `spawn_grace` ticks, e.g.
+    one the engine refused, is dropped without hooks; its class is kept so
+    that `revive` can register it again if the bot shows up later.
+    """
+
+    def __init__(self, pool: ControllerPool | None = None, spawn_grace: int = 2):
+        """
+        Args:
+            pool (ControllerPool | None): Recycles freed controllers.
+            spawn_grace (int): Ticks a requested bot may take to appear.
+        """
+        self.pool = pool
+        self.spawn_grace = spawn_grace
+        self.controllers: dict[int, BotController] = {}
+        # requested bots not seen yet -> ticks waited
+        self._pending: dict[int, int] = {}
+        # spawns dropped after spawn_grace -> their strategy class
+        self._dropped: dict[int, type] = {}
+        self.spawned = 0
+        self.died = 0
+        self.dropped = 0
+
+    def register(self, bot_id: int, strategy_cls: type) -> BotController:
+        """
+        Creates the controller of a bot requested this tick.
+        """
+        if self.pool is not None:
+            controller = self.pool.acquire(strategy_cls)
+        else:
+            controller = strategy_cls(None)
+        self.controllers[bot_id] = controller
+        self._pending[bot_id] = 0
+        return controller
+
+    def is_new(self, bot_id: int) -> bool:
+        """
+        Returns True the first time a registered bot is seen alive, after
+        which its controller is live.
+        """
+        if self._pending.pop(bot_id, None) is None:
+            return False
+        self.spawned += 1
+        return True
+
+    def reap(self, alive_ids: Iterable[int]) -> list[tuple[int, BotController]]:
+        """
+        Removes the controllers of bots that are gone.
+
+        Args:
+            alive_ids (Iterable[int]): Ids of our bots in the current view.
+
+        Returns:
+            list[tuple[int, BotController]]: Bots that died this tick, whose
+            `on_death` hook is still to be run.
+        """
+        alive = set(alive_ids)
+        dead = []
+        for bot_id in [b for b in self.controllers if b not in alive]:
+            if bot_id in self._pending:
+                self._pending[bot_id] += 1
+                if self._pending[bot_id] <= self.spawn_grace:
+                    continue
+                del self._pending[bot_id]
+                self.dropped += 1
+                self._dropped[bot_id] = type(self.controllers[bot_id])
+                self._free(bot_id)
+                continue
+            self.died += 1
+            dead.append((bot_id, self.controllers[bot_id]))
+        return dead
+
+    def revive(self, bot_id: int) -> BotController | None:
+        """
+        Registers again a dropped spawn that showed up late.
+
+        Returns:
+            BotController | None: Its new controller, None if the bot was
+            never dropped.
+        """
+        strategy_cls = self._dropped.pop(bot_id, None)
+        if strategy_cls is None:
+            return None
+        self.dropped -= 1
+        return self.register(bot_id, strategy_cls)
+
+    def release(self, bot_id: int) -> None:
+        """
+        Frees a dead bot's controller once its `on_death` hook has run.
+        """
+        self._free(bot_id)
+
+    def _free(self, bot_id: int) -> None:
+        controller = self.controllers.pop(bot_id, None)
+        if controller is not None and self.pool is not None:
+            self.pool.release(controller)
@@ -3,7 +3,7 @@ Initialization of Action model.
 """
 
 from typing import Dict, Any
-from seamaster.constants import Ability
+from seamaster.constants import Ability, Direction
 
 
 class Action:
@@ -22,3 +22,18 @@ class Action:
         out = {"action": self.action_type.value}
         out.update(self.payload)
         return out
+
+    def as_move(self) -> tuple[Direction, int] | None:
+        """
+        Returns the direction and step of a move, None for any other action
+        or a move whose payload the engine would reject.
+        """
+        if self.action_type != Ability.MOVE or not isinstance(self.payload, dict):
+            return None
+        step = self.payload.get("step", 1)
+        if not isinstance(step, int) or step < 1:
+            return None
+        try:
+            return Direction(self.payload.get("direction")), step
+        except ValueError:
+            return None
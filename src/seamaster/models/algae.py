@@ -11,12 +11,14 @@ class Algae:
     Represents an algae entity in the game.
     """
 
+    __slots__ = ("location", "is_poison")
+
     location: Point
     is_poison: AlgaeType
 
     @classmethod
     def from_dict(cls, data: dict):
         a = cls()
-        a.location = Point(**data["location"])
+        a.location = Point.at(data["location"]["x"], data["location"]["y"])
         a.is_poison = data["is_poison"]
         return a
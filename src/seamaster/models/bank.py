@@ -6,6 +6,19 @@ class Bank:
     Represents a bank in the game.
     """
 
+    __slots__ = (
+        "id",
+        "location",
+        "deposit_occuring",
+        "deposit_amount",
+        "is_deposit_owner",
+        "is_bank_owner",
+        "deposit_ticks_left",
+        "lockpick_occuring",
+        "lockpick_ticks_left",
+        "lockpick_botid",
+    )
+
     id: int
     location: Point
     deposit_occuring: bool
@@ -21,7 +34,7 @@ class Bank:
     def from_dict(cls, data: dict):
         b = cls()
         b.id = data["id"]
-        b.location = Point(**data["location"])
+        b.location = Point.at(data["location"]["x"], data["location"]["y"])
         b.deposit_occuring = data["deposit_occuring"]
         b.deposit_amount = data["deposit_amount"]
         b.is_deposit_owner = data["is_deposit_owner"]
@@ -31,3 +44,12 @@ class Bank:
         b.lockpick_ticks_left = data["lockpick_ticks_left"]
         b.lockpick_botid = data["lockpick_botid"]
         return b
+
+    def apply_delta(self, data: dict):
+        """
+        Updates the fields present in a partial bank dict.
+        """
+        for key, value in data.items():
+            if key == "location":
+                value = Point.at(value["x"], value["y"])
+            setattr(self, key, value)
@@ -12,6 +12,17 @@ class Bot:
     Represents a bot in the game.
     """
 
+    __slots__ = (
+        "id",
+        "location",
+        "energy",
+        "scraps",
+        "abilities",
+        "algae_held",
+        "traversal_cost",
+        "status",
+    )
+
     id: int
     location: Point
     energy: float
@@ -25,7 +36,7 @@ class Bot:
     def from_dict(cls, data: dict):
         b = cls()
         b.id = data["id"]
-        b.location = Point(**data["location"])
+        b.location = Point.at(data["location"]["x"], data["location"]["y"])
         b.energy = data["energy"]
         b.scraps = data["scraps"]
         b.abilities = data["abilities"]
@@ -33,3 +44,12 @@ class Bot:
         b.traversal_cost = data["traversal_cost"]
         b.status = data["status"]
         return b
+
+    def apply_delta(self, data: dict):
+        """
+        Updates the fields present in a partial bot dict.
+        """
+        for key, value in data.items():
+            if key == "location":
+                value = Point.at(value["x"], value["y"])
+            setattr(self, key, value)
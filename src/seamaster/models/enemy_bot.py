@@ -12,6 +12,8 @@ class EnemyBot:
     Represents an enemy bot in the game.
     """
 
+    __slots__ = ("id", "location", "scraps", "abilities")
+
     id: int
     location: Point
     # energy: float
@@ -26,7 +28,7 @@ class EnemyBot:
     def from_dict(cls, data: dict):
         b = cls()
         b.id = data["id"]
-        b.location = Point(**data["location"])
+        b.location = Point.at(data["location"]["x"], data["location"]["y"])
         b.scraps = data["scraps"]
         b.abilities = data["abilities"]
         return b
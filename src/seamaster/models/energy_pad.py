@@ -10,6 +10,8 @@ class EnergyPad:
     Represents an energy pad in the game.
     """
 
+    __slots__ = ("id", "location", "available", "ticksleft")
+
     id: int
     location: Point
     available: int
@@ -19,7 +21,18 @@ class EnergyPad:
     def from_dict(cls, data: dict):
         e = cls()
         e.id = data["id"]
-        e.location = Point(**data["location"])
+        e.location = Point.at(data["location"]["x"], data["location"]["y"])
         e.available = data["available"]
         e.ticksleft = data["ticks_left"]
         return e
+
+    def apply_delta(self, data: dict):
+        """
+        Updates the fields present in a partial energy pad dict.
+        """
+        for key, value in data.items():
+            if key == "location":
+                value = Point.at(value["x"], value["y"])
+            elif key == "ticks_left":
+                key = "ticksleft"
+            setattr(self, key, value)
@@ -1,20 +1,86 @@
 from seamaster.models.bank import Bank
 from seamaster.models.energy_pad import EnergyPad
 from typing import List
-from seamaster.models.point import Point
+from seamaster.models.point import Point, grid_size
+
+# raw walls of the last decoded tick, the grid they were pooled on and their
+# Points; walls never change during a match, so later ticks reuse the list
+_walls_cache: tuple[list, tuple, List[Point]] = ([], (0, 0), [])
+
+
+def _decode_walls(raw: list) -> List[Point]:
+    global _walls_cache
+    raw_walls, grid, walls = _walls_cache
+    if raw != raw_walls or grid != grid_size():
+        walls = [Point.at(wall["x"], wall["y"]) for wall in raw]
+        _walls_cache = (raw, grid_size(), walls)
+    return walls
+
+
+def _patch(current: dict, changes: dict, model) -> None:
+    for k, v in changes.items():
+        entity_id = int(k)
+        if v is None:
+            current.pop(entity_id, None)
+        elif entity_id in current:
+            current[entity_id].apply_delta(v)
+        else:
+            current[entity_id] = model.from_dict(v)
 
 
 class PermanentEntities:
-    banks: dict[int, Bank]
-    energypads: dict[int, EnergyPad]
-    walls: List[Point]
+    """
+    Represents banks, energy pads and walls.
+
+    Banks and energy pads are decoded on first access. Walls are decoded
+    once per match and the same list is shared by every tick.
+    """
+
+    __slots__ = ("_data", "_banks", "_energypads", "walls")
 
     @classmethod
     def from_dict(cls, data: dict):
         pe = cls()
-        pe.banks = {int(k): Bank.from_dict(v) for k, v in data["banks"].items()}
-        pe.energypads = {
-            int(k): EnergyPad.from_dict(v) for k, v in data["energy_pads"].items()
-        }
-        pe.walls = [Point(**wall) for wall in data["walls"]]
+        pe._data = data
+        pe._banks = None
+        pe._energypads = None
+        pe.walls = _decode_walls(data["walls"])
         return pe
+
+    def apply_delta(self, data: dict):
+        """
+        Applies a partial update. "banks" and "energy_pads" map ids to the
+        changed fields, or to null for entities that are gone; "walls", when
+        present, replaces the walls.
+        """
+        if "banks" in data:
+            _patch(self.banks, data["banks"], Bank)
+        if "energy_pads" in data:
+            _patch(self.energypads, data["energy_pads"], EnergyPad)
+        if "walls" in data:
+            self.walls = _decode_walls(data["walls"])
+
+    @property
+    def banks(self) -> dict[int, Bank]:
+        if self._banks is None:
+            self._banks = {
+                int(k): Bank.from_dict(v) for k, v in self._data["banks"].items()
+            }
+        return self._banks
+
+    @banks.setter
+    def banks(self, value: dict[int, Bank]):
+        self._banks = value
+
+    @property
+    def energypads(self) -> dict[int, EnergyPad]:
+        if self._energypads is None:
+            self._energypads = {
+                int(k): EnergyPad.from_dict(v)
+                for k, v in self._data["energy_pads"].items()
+            }
+        return self._energypads
+
+    @energypads.setter
+    def energypads(self, value: dict[int, EnergyPad]):
+        self._energypads = value
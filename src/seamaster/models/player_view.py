@@ -1,9 +1,43 @@
+import itertools
+
 from seamaster.models.bot import Bot
 from seamaster.models.visible_entities import VisibleEntities
 from seamaster.models.permanent_entities import PermanentEntities
+from seamaster.models.point import use_grid
+
+
+# source of PlayerView.revision, unique across every view of the process
+_revisions = itertools.count(1)
 
 
 class PlayerView:
+    __slots__ = (
+        "revision",
+        "side",
+        "tick",
+        "scraps",
+        "algae",
+        "bot_id_seed",
+        "max_bots",
+        "width",
+        "height",
+        "bots",
+        "visible_entities",
+        "permanent_entities",
+    )
+
+    _SCALARS = (
+        "side",
+        "tick",
+        "scraps",
+        "algae",
+        "bot_id_seed",
+        "max_bots",
+        "width",
+        "height",
+    )
+
+    revision: int  # changes whenever the view is decoded or patched
     side: int  # 0 for left, 1 for right
     tick: int
     scraps: int
@@ -18,7 +52,10 @@ class PlayerView:
 
     @classmethod
     def from_dict(cls, data: dict):
+        # pool the points of this map before any entity is decoded
+        use_grid(data["width"], data["height"])
         view = cls()
+        view.revision = next(_revisions)
         view.side = data["side"]
         view.tick = data["tick"]
         view.scraps = data["scraps"]
@@ -37,3 +74,36 @@ class PlayerView:
         )
 
         return view
+
+    def apply_delta(self, data: dict):
+        """
+        Updates the view in place from a delta message of the wrapper's
+        delta protocol.
+
+        A delta carries only what changed since the previous tick:
+        - top-level scalars ("tick", "scraps", ...) that changed;
+        - "bots": id -> changed fields, a full bot for new bots, or null
+          for bots that are gone;
+        - "visible_entities": the lists that changed, replaced wholesale;
+        - "permanent_entities": "banks"/"energy_pads" as id -> changed
+          fields (or null), and "walls" only if they changed.
+        """
+        self.revision = next(_revisions)
+        for key in self._SCALARS:
+            if key in data:
+                setattr(self, key, data[key])
+        use_grid(self.width, self.height)
+
+        for k, v in data.get("bots", {}).items():
+            bot_id = int(k)
+            if v is None:
+                self.bots.pop(bot_id, None)
+            elif bot_id in self.bots:
+                self.bots[bot_id].apply_delta(v)
+            else:
+                self.bots[bot_id] = Bot.from_dict(v)
+
+        if "visible_entities" in data:
+            self.visible_entities.apply_delta(data["visible_entities"])
+        if "permanent_entities" in data:
+            self.permanent_entities.apply_delta(data["permanent_entities"])
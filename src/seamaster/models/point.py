@@ -1,7 +1,107 @@
+"""
+Grid coordinate model.
+
+Points inside the active grid are interned: `Point.at` returns the single
+shared instance of a cell, which carries its cell index and neighbours, so
+decoding entities and walking neighbours allocate nothing and equal pooled
+points are the same object. `Point(x, y)` still builds a standalone point
+for any coordinate.
+
+The cell index and neighbours are plain attributes set on the pooled
+instances, not dataclass fields, so `dataclasses.asdict` and `replace`
+only see the coordinates.
+"""
+
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class Point:
     x: int
     y: int
+
+    # Overridden on pooled points by use_grid. Not annotated, so that they
+    # stay out of the dataclass fields.
+    # dense cell index of a pooled point in its grid, -1 for the others
+    cell = -1
+    # in-map neighbours of a pooled point in Direction order (N, E, S, W)
+    neighbours = ()
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, Point):
+            return NotImplemented
+        return self.x == other.x and self.y == other.y
+
+    def __hash__(self):
+        return hash((self.x, self.y))
+
+    def __reduce__(self):
+        # by coordinates: pickling the neighbour links would walk the grid
+        return (Point.at, (self.x, self.y))
+
+    @staticmethod
+    def at(x: int, y: int) -> "Point":
+        """
+        Returns the pooled point of (x, y), or a new point if it lies
+        outside the active grid.
+        """
+        if 0 <= x < _width and 0 <= y < _height:
+            return _pool[y * _width + x]
+        return Point(x, y)
+
+
+# pool of the active grid, indexed by cell
+_pool: list[Point] = []
+_width = 0
+_height = 0
+
+
+def pooled_cell(p: Point) -> int:
+    """
+    Returns the cell index of `p` if it is the pooled point of its cell in
+    the active grid, -1 otherwise.
+    """
+    cell = p.cell
+    if 0 <= cell < len(_pool) and _pool[cell] is p:
+        return cell
+    return -1
+
+
+def grid_size() -> tuple[int, int]:
+    """
+    Returns the (width, height) served by the pool.
+    """
+    return _width, _height
+
+
+def use_grid(width: int, height: int) -> None:
+    """
+    Makes `Point.at` serve a `width` x `height` grid, rebuilding the pool if
+    the size changed.
+    """
+    global _pool, _width, _height
+    if (width, height) == (_width, _height):
+        return
+
+    pool = [Point(c % width, c // width) for c in range(width * height)]
+    for c, p in enumerate(pool):
+        object.__setattr__(p, "cell", c)
+    for p in pool:
+        x, y = p.x, p.y
+        neighbours = []
+        if y > 0:
+            neighbours.append(pool[p.cell - width])
+        if x + 1 < width:
+            neighbours.append(pool[p.cell + 1])
+        if y + 1 < height:
+            neighbours.append(pool[p.cell + width])
+        if x > 0:
+            neighbours.append(pool[p.cell - 1])
+        object.__setattr__(p, "neighbours", tuple(neighbours))
+    _pool, _width, _height = pool, width, height
+
+
+# the default map, so points decoded before the first view are pooled too
+use_grid(20, 20)
@@ -10,12 +10,14 @@ class Scrap:
     Represents a scrap that is visible to the bot.
     """
 
+    __slots__ = ("location", "amount")
+
     location: Point
     amount: int
 
     @classmethod
     def from_dict(cls, data: dict):
         s = cls()
-        s.location = Point(**data["location"])
+        s.location = Point.at(data["location"]["x"], data["location"]["y"])
         s.amount = data["amount"]
         return s
@@ -11,16 +11,69 @@ from seamaster.models.algae import Algae
 class VisibleEntities:
     """
     Represents entities visible to the player.
+
+    Each list is decoded from the raw tick data on first access, so a tick
+    only pays for the entities its strategies actually look at.
     """
 
-    enemies: List[EnemyBot]
-    scraps: List[Scrap]
-    algae: List[Algae]
+    __slots__ = ("_data", "_enemies", "_scraps", "_algae")
 
     @classmethod
     def from_dict(cls, data: dict):
         v = cls()
-        v.enemies = [EnemyBot.from_dict(bot) for bot in data["enemies"]]
-        v.scraps = [Scrap.from_dict(scrap) for scrap in data["scraps"]]
-        v.algae = [Algae.from_dict(algae) for algae in data["algae"]]
+        v._data = data
+        v._enemies = None
+        v._scraps = None
+        v._algae = None
         return v
+
+    def apply_delta(self, data: dict):
+        """
+        Replaces the lists present in `data`; they are decoded on next access.
+        """
+        self._data = {**self._data, **data}
+        if "enemies" in data:
+            self._enemies = None
+        if "scraps" in data:
+            self._scraps = None
+        if "algae" in data:
+            self._algae = None
+
+    def raw(self, kind: str) -> list[dict] | None:
+        """
+        Returns the undecoded entries of "enemies", "scraps" or "algae", or
+        None once that list has been decoded or set.
+        """
+        if getattr(self, "_" + kind) is not None:
+            return None
+        return self._data[kind]
+
+    @property
+    def enemies(self) -> List[EnemyBot]:
+        if self._enemies is None:
+            self._enemies = [EnemyBot.from_dict(bot) for bot in self._data["enemies"]]
+        return self._enemies
+
+    @enemies.setter
+    def enemies(self, value: List[EnemyBot]):
+        self._enemies = value
+
+    @property
+    def scraps(self) -> List[Scrap]:
+        if self._scraps is None:
+            self._scraps = [Scrap.from_dict(scrap) for scrap in self._data["scraps"]]
+        return self._scraps
+
+    @scraps.setter
+    def scraps(self, value: List[Scrap]):
+        self._scraps = value
+
+    @property
+    def algae(self) -> List[Algae]:
+        if self._algae is None:
+            self._algae = [Algae.from_dict(algae) for algae in self._data["algae"]]
+        return self._algae
+
+    @algae.setter
+    def algae(self, value: List[Algae]):
+        self._algae = value
@@ -0,0 +1,316 @@
+"""
+Parallel module runs the bots' `act()` calls on a pool of worker processes.
+
+The pool forks once the path tables of the map are loaded, so every worker
+shares them copy-on-write. Each tick the wrapper ships the raw input line,
+which is the most compact form of the view (a delta once the engine sends
+deltas), and each worker keeps its own view, planner and memory in step
+with it. A bot always runs on worker `bot_id % workers`, so its controller
+and its state stay in that process from spawn to death.
+
+The wrapper waits for the workers until the tick's deadline. A worker
+that misses it is late: its bots send no action that tick, and the lines
+it has not been sent yet are queued and sent together once it answers,
+so its view catches up. The strategy classes of bots that spawned in the
+meantime are held back with them, so their controllers are still built.
+
+Workers commit actions only against their own share of the bots; the
+wrapper merges the results in the view's bot order and commits them
+again, so the response does not depend on which worker answered first.
+Strategies that rely on seeing moves of bots on other workers should
+enable the MoveCoordinator. Target assignment is solved by the wrapper for
+all bots and sent with the tick, see AssignmentService.
+"""
+
+import json
+import multiprocessing
+import os
+import sys
+import time
+from typing import Iterable
+
+from seamaster.api.assignment import AssignmentService
+from seamaster.api.game_api import GameAPI
+from seamaster.api.memory import WorldMemory
+from seamaster.api.tick_cache import TickCache
+from seamaster.botbase import BotController
+from seamaster.context.bot_context import BotContext
+from seamaster.deadline import TickDeadline
+from seamaster.lifecycle import user_call
+from seamaster.models.action import Action
+from seamaster.models.player_view import PlayerView
+from seamaster.shortest_distances import PathPlanner
+
+# (bot_id, action, move target cell, act() seconds or None for a fallback)
+ActResult = tuple[int, Action | None, int | None, float | None]
+
+
+def can_fork() -> bool:
+    """
+    Returns whether the platform supports the fork start method.
+    """
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+class ActPool:
+    """
+    Worker processes holding the controllers of our bots.
+    """
+
+    def __init__(self, workers: int):
+        """
+        Args:
+            workers (int): Number of processes to fork.
+
+        Raises:
+            ValueError: If workers is below 1.
+            RuntimeError: If the platform cannot fork.
+        """
+        if workers < 1:
+            raise ValueError("ActPool needs at least one worker")
+        if not can_fork():
+            raise RuntimeError("ActPool needs the fork start method")
+        mp = multiprocessing.get_context("fork")
+        self._conns = []
+        self._procs = []
+        for _ in range(workers):
+            parent, child = mp.Pipe()
+            proc = mp.Process(target=_worker_main, args=(child,), daemon=True)
+            proc.start()
+            child.close()
+            self._conns.append(parent)
+            self._procs.append(proc)
+        # workers that crashed, whose bots idle from then on
+        self._dead: set[int] = set()
+        # workers that missed a deadline and still owe that tick's answer
+        self._late: set[int] = set()
+        # lines not sent yet to each worker, delivered with its next tick
+        self._backlog: list[list[str]] = [[] for _ in range(workers)]
+        # strategy classes of new bots not sent yet to each worker
+        self._unsent: list[dict[int, type]] = [{} for _ in range(workers)]
+        # bots that asked for an assigned target per kind, last tick
+        self.asked: dict[str, set[int]] = {}
+
+    @property
+    def workers(self) -> int:
+        return len(self._conns)
+
+    def shard(self, bot_id: int) -> int:
+        """
+        Returns the worker a bot runs on.
+        """
+        return bot_id % len(self._conns)
+
+    def act(
+        self,
+        line: str,
+        tick: int,
+        expires: float,
+        bots: Iterable[tuple[int, type[BotController] | None]],
+        assignments: dict[str, dict[int, int]] | None = None,
+    ) -> dict[int, ActResult]:
+        """
+        Runs one tick on every worker.
+
+        Args:
+            line (str): Raw input line of the tick.
+            tick (int): Tick shown to the strategies.
+            expires (float): time.perf_counter() deadline of the tick.
+            bots (Iterable[tuple[int, type | None]]): Our live bots, with
+                their strategy class on the tick they first appear.
+            assignments (dict | None): Target assignment of the tick, from
+                AssignmentService.solve_all. The bots that asked for one
+                are in `asked` afterwards.
+
+        Returns:
+            dict[int, ActResult]: Result per bot id. Bots of a worker that
+            crashed or missed the deadline get (bot_id, None, None, None).
+        """
+        shares: list[list] = [[] for _ in self._conns]
+        for bot_id, strategy_cls in bots:
+            shares[self.shard(bot_id)].append((bot_id, strategy_cls))
+
+        # every worker gets every line, so its view stays in step; a late
+        # one gets them once it is free
+        waiting = []
+        for i in range(len(self._conns)):
+            if i in self._dead:
+                continue
+            self._backlog[i].append(line)
+            unsent = self._unsent[i]
+            if i in self._late and not self._catch_up(i):
+                unsent.update((b, cls) for b, cls in shares[i] if cls is not None)
+                continue
+            # classes held back go with the bot's next tick; those of bots
+            # that died meanwhile are dropped
+            share = [(b, cls or unsent.get(b)) for b, cls in shares[i]]
+            unsent.clear()
+            lines, self._backlog[i] = self._backlog[i], []
+            msg = ("tick", lines, tick, expires, share, assignments or {})
+            if self._send(i, msg):
+                waiting.append(i)
+
+        results: dict[int, ActResult] = {}
+        self.asked = {}
+        for i in waiting:
+            conn = self._conns[i]
+            left = expires - time.perf_counter()
+            try:
+                if conn.poll(None if left == float("inf") else max(0.0, left)):
+                    answers, asked = conn.recv()
+                    for result in answers:
+                        results[result[0]] = result
+                    for kind, bot_ids in asked.items():
+                        self.asked.setdefault(kind, set()).update(bot_ids)
+                else:
+                    self._late.add(i)
+                    print(
+                        f"[WRAPPER] act() worker {i} missed the deadline",
+                        file=sys.stderr,
+                    )
+            except (EOFError, OSError):
+                self._lost(i)
+
+        for share in shares:
+            for bot_id, _ in share:
+                if bot_id not in results:
+                    results[bot_id] = (bot_id, None, None, None)
+        return results
+
+    def bury(self, bot_ids: Iterable[int]) -> None:
+        """
+        Runs the death hooks of bots that are gone and frees their
+        controllers.
+        """
+        shares: dict[int, list[int]] = {}
+        for bot_id in bot_ids:
+            shares.setdefault(self.shard(bot_id), []).append(bot_id)
+        for i, ids in shares.items():
+            if i not in self._dead:
+                self._send(i, ("death", ids))
+
+    def close(self) -> None:
+        """
+        Stops the workers.
+        """
+        for i in range(len(self._conns)):
+            if i not in self._dead:
+                self._send(i, ("stop",))
+        for proc in self._procs:
+            proc.join(timeout=1)
+            if proc.is_alive():
+                # still stuck in a strategy
+                proc.terminate()
+
+    def _catch_up(self, i: int) -> bool:
+        """
+        Drops the overdue answer of a late worker if it has arrived, and
+        returns whether the worker is free again.
+        """
+        try:
+            if not self._conns[i].poll(0):
+                return False
+            self._conns[i].recv()
+        except (EOFError, OSError):
+            self._lost(i)
+            return False
+        self._late.discard(i)
+        return True
+
+    def _send(self, i: int, msg: tuple) -> bool:
+        try:
+            self._conns[i].send(msg)
+        except (BrokenPipeError, OSError):
+            self._lost(i)
+            return False
+        return True
+
+    def _lost(self, i: int) -> None:
+        if i not in self._dead:
+            self._dead.add(i)
+            print(f"[WRAPPER] act() worker {i} died", file=sys.stderr)
+
+
+def _worker_main(conn) -> None:
+    controllers: dict[int, BotController] = {}
+    planner = PathPlanner()
+    cache = TickCache()
+    assignments = AssignmentService()
+    memory = WorldMemory() if os.environ.get("SEAMASTER_MEMORY") == "1" else None
+    # same environment as the wrapper, so the same reserve
+    deadline = TickDeadline.from_env()
+    view: PlayerView | None = None
+
+    while True:
+        try:
+            msg = conn.recv()
+        except EOFError:
+            return
+        kind = msg[0]
+
+        if kind == "stop":
+            return
+
+        if kind == "death":
+            for bot_id in msg[1]:
+                controller = controllers.pop(bot_id, None)
+                if controller is not None:
+                    user_call(bot_id, controller.on_death)
+                planner.forget(bot_id)
+            continue
+
+        # lines missed while late come first, only to update the view
+        _, lines, tick, expires, share, solution = msg
+        for line in lines:
+            data = json.loads(line)
+            if data.get("delta") and view is not None:
+                view.apply_delta(data)
+            else:
+                view = PlayerView.from_dict(data)
+            if memory is not None:
+                memory.observe(view)
+
+        raw_tick = view.tick
+        view.tick = tick
+        deadline.expires = expires
+        assignments.use(solution)
+        api = GameAPI(
+            view,
+            planner=planner,
+            cache=cache,
+            assignments=assignments,
+            memory=memory,
+            deadline=deadline,
+        )
+        mine = {bot.id: bot for bot in api.get_my_bots()}
+
+        results: list[ActResult] = []
+        for bot_id, strategy_cls in share:
+            bot = mine.get(bot_id)
+            if strategy_cls is not None:
+                controller = user_call(bot_id, lambda: strategy_cls(None))
+                if controller is not None:
+                    controllers[bot_id] = controller
+            controller = controllers.get(bot_id)
+            if bot is None or controller is None:
+                results.append((bot_id, None, None, None))
+                continue
+
+            controller.ctx = BotContext(api, bot)
+            if strategy_cls is not None:
+                user_call(bot_id, controller.on_spawn)
+
+            if deadline.exhausted():
+                action = user_call(bot_id, controller.fallback)
+                elapsed = None
+            else:
+                started = time.perf_counter()
+                action = user_call(bot_id, controller.act)
+                elapsed = time.perf_counter() - started
+
+            if action is not None:
+                api.commit_action(bot, action)
+            results.append((bot_id, action, api.move_targets.get(bot_id), elapsed))
+
+        view.tick = raw_tick
+        conn.send((results, assignments.asked))
@@ -0,0 +1,335 @@
+"""
+Profiling module records where the wrapper spends each tick.
+
+Enabled with SEAMASTER_PROFILE, set to "stderr" or to a file path. Every
+tick writes one compact JSON line with the time of each phase, the act()
+time per strategy class and the slowest bot, and the calls made to the hot
+helpers in HOT_HELPERS. Every SEAMASTER_PROFILE_MEMORY ticks (10, 0 turns
+it off) the tick runs under tracemalloc and the line also holds the blocks
+and bytes it left allocated, its peak and the top allocating lines. A
+summary line closes the game.
+
+Each helper is wrapped once per process and its calls go to a shared
+counter, so two players profiled in one process (the simulator) both see
+the calls of either. They are counted in the wrapper process only, so with
+SEAMASTER_WORKERS they miss the calls made by act() on the workers.
+"""
+
+import functools
+import importlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import TextIO
+
+# (module, attribute path) of the helpers whose calls are counted
+HOT_HELPERS = (
+    ("seamaster.context.bot_context", "BotContext.check_blocked_point"),
+    ("seamaster.context.bot_context", "BotContext.move_target"),
+    ("seamaster.utils", "get_shortest_distance_between_points"),
+    ("seamaster.utils", "get_shortest_distance_between_cells"),
+    ("seamaster.utils", "get_direction_in_one_radius"),
+)
+
+# dead bots kept in the summary's slowest_bots
+SLOWEST_BOTS = 5
+
+# calls per helper name since the helper was wrapped, shared by profilers
+_calls: dict[str, int] = {}
+# (module, attribute path) already wrapped in this process
+_wrapped: set[tuple[str, str]] = set()
+
+
+class _Stat:
+    __slots__ = ("calls", "total", "worst")
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.worst = 0.0
+
+    def add(self, elapsed: float) -> None:
+        self.calls += 1
+        self.total += elapsed
+        if elapsed > self.worst:
+            self.worst = elapsed
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "total_ms": _ms(self.total),
+            "mean_ms": _ms(self.total / self.calls) if self.calls else 0.0,
+            "max_ms": _ms(self.worst),
+        }
+
+
+class Profiler:
+    """
+    Per-tick timings, written as JSON lines.
+
+    The wrapper calls `begin_tick` when a line arrives and `lap(phase)` at
+    the end of each phase; a phase lasts from the previous lap. `end_tick`
+    writes the tick's line and `close` the summary.
+    """
+
+    def __init__(
+        self,
+        out: TextIO,
+        memory_every: int = 10,
+        helpers: tuple = HOT_HELPERS,
+        player: str | None = None,
+    ):
+        """
+        Args:
+            out (TextIO): Where the JSON lines go.
+            memory_every (int): Run every n-th tick under tracemalloc,
+                0 or less for never.
+            helpers (tuple): (module, attribute path) of functions whose
+                calls are counted.
+            player (str | None): Added to every line, for players that
+                share a process.
+        """
+        self.out = out
+        self.memory_every = max(0, memory_every)
+        self.player = player
+        self.ticks = 0
+        self._phases: dict[str, _Stat] = {}
+        self._classes: dict[str, _Stat] = {}
+        # live bots, and the slowest ones that died
+        self._bots: dict[int, tuple[str, _Stat]] = {}
+        self._dead: list[tuple[int, tuple[str, _Stat]]] = []
+        self._memory: list[dict] = []
+        self._tick: dict = {}
+        self._last = 0.0
+        self._helpers_before: dict[str, int] = {}
+        self._tracing = False
+        self._names = []
+        for module, path in helpers:
+            _count_calls(module, path)
+            self._names.append(path.rpartition(".")[2])
+        # the shared counters when this profiler started
+        self._helpers_start = {name: _calls[name] for name in self._names}
+
+    @classmethod
+    def from_env(cls, player: str | None = None) -> "Profiler | None":
+        """
+        Args:
+            player (str | None): Name of a player sharing the process with
+                others; a file target then becomes `<root>.<player><ext>`.
+        """
+        target = os.environ.get("SEAMASTER_PROFILE")
+        if not target:
+            return None
+        if target == "stderr":
+            out = sys.stderr
+        else:
+            if player is not None:
+                root, ext = os.path.splitext(target)
+                target = f"{root}.{player}{ext}"
+            out = open(target, "w")
+        raw = os.environ.get("SEAMASTER_PROFILE_MEMORY")
+        try:
+            every = int(raw) if raw else 10
+        except ValueError:
+            print(
+                f"[WRAPPER] SEAMASTER_PROFILE_MEMORY={raw!r} is not an integer, "
+                "using 10",
+                file=sys.stderr,
+            )
+            every = 10
+        return cls(out, memory_every=every, player=player)
+
+    def begin_tick(self, started: float | None = None) -> None:
+        """
+        Starts a tick.
+
+        Args:
+            started (float | None): time.perf_counter() value the tick
+                began at. Defaults to now.
+        """
+        self.ticks += 1
+        self._last = started if started is not None else time.perf_counter()
+        self._tick = {"phases": {}, "classes": {}, "slowest": None}
+        self._helpers_before = dict(self.helper_calls)
+        if (
+            self.memory_every
+            and self.ticks % self.memory_every == 0
+            and not tracemalloc.is_tracing()
+        ):
+            tracemalloc.start()
+            self._tracing = True
+
+    def lap(self, phase: str) -> None:
+        """
+        Ends a phase of the current tick.
+        """
+        now = time.perf_counter()
+        elapsed = now - self._last
+        self._last = now
+        phases = self._tick["phases"]
+        phases[phase] = phases.get(phase, 0.0) + elapsed
+        stat = self._phases.get(phase)
+        if stat is None:
+            stat = self._phases[phase] = _Stat()
+        stat.add(elapsed)
+
+    def bot(self, bot_id: int, strategy: str, elapsed: float) -> None:
+        """
+        Records the act() time of a bot.
+        """
+        classes = self._tick["classes"]
+        calls, total = classes.get(strategy, (0, 0.0))
+        classes[strategy] = (calls + 1, total + elapsed)
+        slowest = self._tick["slowest"]
+        if slowest is None or elapsed > slowest[2]:
+            self._tick["slowest"] = (bot_id, strategy, elapsed)
+
+        stat = self._classes.get(strategy)
+        if stat is None:
+            stat = self._classes[strategy] = _Stat()
+        stat.add(elapsed)
+        entry = self._bots.get(bot_id)
+        if entry is None:
+            entry = self._bots[bot_id] = (strategy, _Stat())
+        entry[1].add(elapsed)
+
+    def forget(self, bot_id: int) -> None:
+        """
+        Drops a dead bot, keeping it for the summary only if it is among
+        the slowest that died.
+        """
+        entry = self._bots.pop(bot_id, None)
+        if entry is None:
+            return
+        self._dead.append((bot_id, entry))
+        if len(self._dead) > SLOWEST_BOTS:
+            self._dead.sort(key=lambda kv: -kv[1][1].total)
+            del self._dead[SLOWEST_BOTS:]
+
+    @property
+    def helper_calls(self) -> dict[str, int]:
+        """
+        Calls made to each helper since this profiler started.
+        """
+        return {name: _calls[name] - self._helpers_start[name] for name in self._names}
+
+    def end_tick(self, tick: int) -> None:
+        """
+        Writes the line of the current tick.
+        """
+        record = {
+            "tick": tick,
+            "phases": {k: _ms(v) for k, v in self._tick["phases"].items()},
+            "classes": {
+                k: {"calls": c, "ms": _ms(t)}
+                for k, (c, t) in self._tick["classes"].items()
+            },
+        }
+        slowest = self._tick["slowest"]
+        if slowest is not None:
+            record["slowest"] = {
+                "bot": slowest[0],
+                "class": slowest[1],
+                "ms": _ms(slowest[2]),
+            }
+        before = self._helpers_before
+        helpers = {
+            k: n - before.get(k, 0)
+            for k, n in self.helper_calls.items()
+            if n != before.get(k, 0)
+        }
+        if helpers:
+            record["helpers"] = helpers
+        if self._tracing:
+            record["memory"] = self._sample_memory()
+            self._memory.append(record["memory"])
+        self._write(record)
+
+    def close(self) -> None:
+        """
+        Writes the summary of the game.
+        """
+        slowest = sorted(
+            [*self._bots.items(), *self._dead], key=lambda kv: -kv[1][1].total
+        )[:SLOWEST_BOTS]
+        memory = {}
+        if self._memory:
+            memory = {
+                "samples": len(self._memory),
+                "max_peak_kb": max(m["peak_kb"] for m in self._memory),
+                "mean_blocks": round(
+                    sum(m["blocks"] for m in self._memory) / len(self._memory)
+                ),
+            }
+        self._write(
+            {
+                "summary": True,
+                "ticks": self.ticks,
+                "phases": {k: v.to_dict() for k, v in self._phases.items()},
+                "classes": {k: v.to_dict() for k, v in self._classes.items()},
+                "slowest_bots": [
+                    {"bot": bot_id, "class": strategy, **stat.to_dict()}
+                    for bot_id, (strategy, stat) in slowest
+                ],
+                "helpers": dict(self.helper_calls),
+                "memory": memory,
+            }
+        )
+        if self.out is not sys.stderr:
+            self.out.close()
+
+    def _sample_memory(self) -> dict:
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self._tracing = False
+        lines = snapshot.statistics("lineno")
+        return {
+            "blocks": sum(s.count for s in lines),
+            "kb": round(sum(s.size for s in lines) / 1024, 1),
+            "peak_kb": round(peak / 1024, 1),
+            "top": [
+                f"{os.path.basename(s.traceback[0].filename)}:"
+                f"{s.traceback[0].lineno}={s.count}"
+                for s in lines[:3]
+            ],
+        }
+
+    def _write(self, record: dict) -> None:
+        if self.player is not None:
+            record["player"] = self.player
+        self.out.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self.out.flush()
+
+
+def _count_calls(module_name: str, path: str) -> None:
+    # wraps a helper so its calls add to _calls; once per process, so
+    # profilers share the wrapper instead of stacking their own
+    if (module_name, path) in _wrapped:
+        return
+    module = importlib.import_module(module_name)
+    owner_name, _, name = path.rpartition(".")
+    owner = getattr(module, owner_name) if owner_name else module
+    original = getattr(owner, name)
+    _calls.setdefault(name, 0)
+
+    @functools.wraps(original)
+    def counted(*args, **kwargs):
+        _calls[name] += 1
+        return original(*args, **kwargs)
+
+    setattr(owner, name, counted)
+    _wrapped.add((module_name, path))
+    if owner_name:
+        return
+    # rebind the copies made by `from module import name`
+    for other in list(sys.modules.values()):
+        namespace = getattr(other, "__dict__", None)
+        if namespace is not None and namespace.get(name) is original:
+            setattr(other, name, counted)
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
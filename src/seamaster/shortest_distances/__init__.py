@@ -1,14 +1,130 @@
-import json
+"""
+Shortest-path tables for the Seawars map.
+
+The tables for the default layout ship as ``paths.bin`` (see ``tables.py``
+for the layout) and are memory-mapped on import. Any other layout is
+derived from its walls by the BFS engine in ``bfs.py`` when first seen and
+kept in the on-disk cache of ``cache.py`` for later matches; on large maps
+the engine computes rows on demand instead and nothing is cached. Tables for
+SPEED_BOOST movement are built the same way on first use.
+"""
+
 import importlib.resources as resources
-import sys
+from pathlib import Path
+from typing import Iterable
+
+from seamaster.models.point import Point, use_grid
+
+from .bfs import LazyPathTables, build_tables
+from .cache import TableCache, fingerprint
+from .planner import PathPlanner
+from .tables import OFFSETS, PathTables
+
+
+def _load_packaged(name: str) -> PathTables:
+    ref = resources.files(__name__).joinpath(name)
+    if isinstance(ref, Path):
+        return PathTables.load(ref)
+    # zipped installs cannot be mapped, fall back to an in-memory copy
+    return PathTables.from_buffer(ref.read_bytes())
+
+
+TABLES = _load_packaged("paths.bin")
+DIST = TABLES.dist
+GUIDE = TABLES.guide
+
+CACHE = TableCache.from_env()
+
+# (width, height, wall cells) of TABLES, computed on first use_map call
+_layout: tuple | None = None
+# walls list last checked against _layout, to skip re-checking every tick
+_checked_walls: list | None = None
+# SPEED_BOOST tables of the active layout, built by speed_tables()
+_speed: PathTables | None = None
+
+
+def use_map(width: int, height: int, walls: Iterable[Point]) -> PathTables:
+    """
+    Makes the tables for a map layout the active ones, building them if
+    the layout differs from the current tables.
+
+    Called by GameAPI every tick; after the first tick of a match this is
+    a cheap check.
+
+    Args:
+        width (int): Map width.
+        height (int): Map height.
+        walls (Iterable[Point]): Wall positions.
+
+    Returns:
+        PathTables: The active tables.
+    """
+    global TABLES, DIST, GUIDE, _layout, _checked_walls, _speed
+
+    use_grid(width, height)
+    if walls is _checked_walls and (width, height) == (TABLES.width, TABLES.height):
+        return TABLES
+
+    layout = (
+        width,
+        height,
+        frozenset(
+            w.y * width + w.x for w in walls if 0 <= w.x < width and 0 <= w.y < height
+        ),
+    )
+    if layout != _active_layout():
+        TABLES = _cached_tables("walk", layout, 1)
+        DIST = TABLES.dist
+        GUIDE = TABLES.guide
+        _layout = layout
+        _speed = None
+
+    _checked_walls = walls
+    return TABLES
+
+
+def speed_tables() -> PathTables:
+    """
+    Returns the SPEED_BOOST tables of the active layout, where one move
+    covers one or two cells. They are built (or read from the cache) on
+    first use.
+    """
+    global _speed
+    if _speed is None:
+        _speed = _cached_tables("speed", _active_layout(), 2)
+    return _speed
+
 
-_pkg = sys.modules[__name__]
+def _active_layout() -> tuple:
+    global _layout
+    if _layout is None:
+        _layout = (TABLES.width, TABLES.height, TABLES.wall_cells())
+    return _layout
 
 
-def _load_json(name: str):
-    with resources.files(_pkg).joinpath(name).open("r") as f:
-        return json.load(f)
+def _cached_tables(kind: str, layout: tuple, max_step: int) -> PathTables:
+    key = fingerprint(kind, *layout)
+    tables = CACHE.load(key)
+    if tables is None:
+        width, height, walls = layout
+        points = [Point(c % width, c // width) for c in walls]
+        tables = build_tables(width, height, points, max_step)
+        if not isinstance(tables, LazyPathTables):
+            CACHE.store(key, tables)
+    return tables
 
 
-GUIDE = _load_json("directions.json")
-DIST = _load_json("dist.json")
+__all__ = [
+    "CACHE",
+    "DIST",
+    "GUIDE",
+    "LazyPathTables",
+    "OFFSETS",
+    "PathPlanner",
+    "PathTables",
+    "TABLES",
+    "TableCache",
+    "build_tables",
+    "speed_tables",
+    "use_map",
+]
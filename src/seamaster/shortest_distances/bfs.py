@@ -0,0 +1,215 @@
+"""
+Breadth-first search engine that derives PathTables from a map layout.
+
+Every non-wall cell is the root of one BFS. Walking outwards from the
+target, a cell ``v`` reached from ``u`` gets ``u``'s direction added to its
+next-hop mask, which yields the distance row and the GUIDE row of that
+target in a single pass.
+
+With ``max_step=2`` the graph is the SPEED_BOOST one, where a move covers
+one or two cells; distances then count ticks, and bit ``4 + i`` of a
+next-hop mask marks a two-cell move in direction ``i``.
+
+All-pairs tables grow with the square of the cell count, so maps above
+EAGER_MAX_CELLS get LazyPathTables instead, which run the BFS of a target
+the first time a distance or next hop towards it is read.
+"""
+
+from array import array
+from typing import Iterable
+
+from seamaster.models.point import Point
+
+from .tables import OFFSETS, PathTables
+
+# unreachable marker per distance item type
+_UNSET = {"B": 0xFF, "H": 0xFFFF}
+
+# largest map, in cells, whose all-pairs tables are built up front
+# (30x30 builds in about 0.4 s; the cost grows with the square of the cells)
+EAGER_MAX_CELLS = 900
+
+
+def blocked_cells(width: int, height: int, walls: Iterable[Point]) -> bytearray:
+    """
+    Returns a per-cell flag array with 1 for every wall inside the map.
+    """
+    blocked = bytearray(width * height)
+    for w in walls:
+        if 0 <= w.x < width and 0 <= w.y < height:
+            blocked[w.y * width + w.x] = 1
+    return blocked
+
+
+def incoming_edges(
+    width: int, height: int, blocked: bytearray, max_step: int = 1
+) -> list[tuple]:
+    """
+    For each cell ``u``, lists ``(v, bit)`` for every open cell ``v`` that
+    can move into ``u``, where ``bit`` is the GUIDE bit of that move.
+    """
+    edges: list[tuple] = []
+    for u in range(width * height):
+        x, y = u % width, u // width
+        into = []
+        for i, (dx, dy) in enumerate(OFFSETS):
+            # v sits on the opposite side of u, so moving from v uses `i`
+            for step in range(1, max_step + 1):
+                vx, vy = x - dx * step, y - dy * step
+                if not (0 <= vx < width and 0 <= vy < height):
+                    break
+                v = vy * width + vx
+                if blocked[v]:
+                    # nothing can be jumped over
+                    break
+                into.append((v, 1 << (i + 4 * (step - 1))))
+        edges.append(tuple(into))
+    return edges
+
+
+def single_source(
+    edges: list[tuple], cells: int, target: int, unset: int = 0xFFFF
+) -> tuple[list[int], bytearray]:
+    """
+    Runs one BFS rooted at `target`.
+
+    Returns:
+        tuple: Distances to `target` (`unset` when unreachable) and the
+        next-hop mask of every cell towards `target`.
+
+    Raises:
+        OverflowError: If a distance does not fit below `unset`.
+    """
+    dist = [unset] * cells
+    guide = bytearray(cells)
+    dist[target] = 0
+    frontier = [target]
+    d = 0
+    while frontier:
+        d += 1
+        if d >= unset:
+            raise OverflowError("Distance does not fit the table item size.")
+        nxt = []
+        for u in frontier:
+            for v, bit in edges[u]:
+                dv = dist[v]
+                if dv == unset:
+                    dist[v] = d
+                    guide[v] = bit
+                    nxt.append(v)
+                elif dv == d:
+                    guide[v] |= bit
+        frontier = nxt
+    return dist, guide
+
+
+def build_tables(
+    width: int, height: int, walls: Iterable[Point], max_step: int = 1
+) -> PathTables:
+    """
+    Computes the distance and next-hop tables for a map layout.
+
+    Args:
+        width (int): Map width.
+        height (int): Map height.
+        walls (Iterable[Point]): Wall positions.
+        max_step (int): Cells covered by one move, 2 for SPEED_BOOST bots.
+
+    Returns:
+        PathTables: Tables for the layout, LazyPathTables above
+        EAGER_MAX_CELLS cells. Walls are unreachable from everywhere,
+        including themselves.
+    """
+    blocked = blocked_cells(width, height, walls)
+    edges = incoming_edges(width, height, blocked, max_step)
+    if width * height > EAGER_MAX_CELLS:
+        return LazyPathTables(width, height, blocked, edges)
+    # most maps fit in a byte per entry, which halves the table
+    try:
+        return _fill(width, height, blocked, edges, "B")
+    except OverflowError:
+        return _fill(width, height, blocked, edges, "H")
+
+
+def _fill(
+    width: int, height: int, blocked: bytearray, edges: list[tuple], typecode: str
+) -> PathTables:
+    cells = width * height
+    unset = _UNSET[typecode]
+    dist = array(typecode, [unset]) * (cells * cells)
+    guide = bytearray(cells * cells)
+    for target in range(cells):
+        if blocked[target]:
+            continue
+        row, hops = single_source(edges, cells, target, unset)
+        base = target * cells
+        dist[base : base + cells] = array(typecode, row)
+        guide[base : base + cells] = hops
+    return PathTables(width, height, memoryview(dist), memoryview(guide))
+
+
+class _LazyRows:
+    """
+    Flat, target-major table whose rows are filled in on first read.
+    """
+
+    def __init__(self, tables: "LazyPathTables", cells: int, part: int, itemsize: int):
+        self.tables = tables
+        self.cells = cells
+        self.part = part
+        self.itemsize = itemsize
+
+    def __len__(self) -> int:
+        return self.cells * self.cells
+
+    def __getitem__(self, index: int) -> int:
+        target, src = divmod(index, self.cells)
+        row = self.tables.rows.get(target)
+        if row is None:
+            row = self.tables.solve(target)
+        return row[self.part][src]
+
+
+class LazyPathTables(PathTables):
+    """
+    PathTables whose rows are computed one target at a time, on demand.
+
+    Reads cost a method call more than with packed tables, and the tables
+    cannot be serialized, so they are not kept in the on-disk cache.
+    """
+
+    def __init__(self, width: int, height: int, blocked: bytearray, edges: list):
+        """
+        Args:
+            width (int): Map width.
+            height (int): Map height.
+            blocked (bytearray): Wall flag per cell, see `blocked_cells`.
+            edges (list): Incoming moves per cell, see `incoming_edges`.
+        """
+        self.blocked = blocked
+        self.edges = edges
+        # target -> (distances, next-hop masks)
+        self.rows: dict[int, tuple] = {}
+        cells = width * height
+        super().__init__(
+            width, height, _LazyRows(self, cells, 0, 2), _LazyRows(self, cells, 1, 1)
+        )
+        self._blocked_row = (array("H", [self.unreachable]) * cells, bytes(cells))
+
+    def solve(self, target: int) -> tuple:
+        """
+        Runs the BFS of `target` and keeps its rows.
+        """
+        if self.blocked[target]:
+            row = self._blocked_row
+        else:
+            dist, guide = single_source(self.edges, self.cells, target, 0xFFFF)
+            row = (array("H", dist), guide)
+        self.rows[target] = row
+        return row
+
+    def wall_cells(self) -> frozenset[int]:
+        return frozenset(c for c, wall in enumerate(self.blocked) if wall)
+
+    def to_bytes(self) -> bytes:
+        raise TypeError("Lazy path tables cannot be serialized.")
@@ -0,0 +1,148 @@
+"""
+On-disk cache of generated path tables.
+
+Tables are stored as ``<fingerprint>.bin`` files in the packed format of
+``tables.py`` and memory-mapped on load, so a map that has been seen before
+costs a page-in instead of a rebuild. The fingerprint hashes the table kind,
+map size and wall cells. Files are written atomically and evicted least
+recently used first once the directory outgrows its size budget.
+
+Environment:
+    SEAMASTER_CACHE_DIR: Cache directory. Defaults to
+        ``$XDG_CACHE_HOME/seamaster/paths`` (``~/.cache`` when unset).
+        Set it to an empty string to disable the cache.
+    SEAMASTER_CACHE_MAX_BYTES: Size budget of the directory (256 MiB).
+"""
+
+import hashlib
+import os
+import struct
+import tempfile
+from pathlib import Path
+
+from .tables import PathTables
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_SUFFIX = ".bin"
+
+
+def default_cache_dir() -> Path | None:
+    """
+    Returns the cache directory selected by the environment, or None when
+    caching is disabled.
+    """
+    configured = os.environ.get("SEAMASTER_CACHE_DIR")
+    if configured is not None:
+        return Path(configured) if configured else None
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join("~", ".cache")
+    return Path(base).expanduser() / "seamaster" / "paths"
+
+
+def fingerprint(kind: str, width: int, height: int, walls: frozenset[int]) -> str:
+    """
+    Returns the cache key of a table kind for a map layout.
+
+    Args:
+        kind (str): Table kind, e.g. ``"walk"``.
+        width (int): Map width.
+        height (int): Map height.
+        walls (frozenset[int]): Wall cell indices.
+    """
+    h = hashlib.sha256(kind.encode())
+    h.update(struct.pack("<HH", width, height))
+    h.update(struct.pack(f"<{len(walls)}I", *sorted(walls)))
+    return h.hexdigest()
+
+
+class TableCache:
+    """
+    Directory of memory-mapped path tables keyed by layout fingerprint.
+
+    Every filesystem error is swallowed: a cache that cannot be read or
+    written simply behaves as empty.
+    """
+
+    def __init__(self, directory: Path | None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            directory (Path | None): Cache directory, None to disable.
+            max_bytes (int): Total size the directory may grow to.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    @classmethod
+    def from_env(cls) -> "TableCache":
+        try:
+            max_bytes = int(os.environ.get("SEAMASTER_CACHE_MAX_BYTES", ""))
+        except ValueError:
+            # unset or malformed
+            max_bytes = DEFAULT_MAX_BYTES
+        return cls(default_cache_dir(), max_bytes)
+
+    def load(self, key: str) -> PathTables | None:
+        """
+        Returns the cached tables for `key`, or None on a miss.
+        """
+        if self.directory is None:
+            return None
+        path = self.directory / (key + _SUFFIX)
+        try:
+            tables = PathTables.load(path)
+            # mtime records the last use, which drives LRU eviction
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            # unreadable or corrupt entry, rebuild it
+            self._remove(path)
+            return None
+        return tables
+
+    def store(self, key: str, tables: PathTables) -> None:
+        """
+        Writes `tables` under `key` atomically and evicts old entries.
+        """
+        if self.directory is None:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(tables.to_bytes())
+                os.replace(tmp, self.directory / (key + _SUFFIX))
+            except BaseException:
+                self._remove(Path(tmp))
+                raise
+            self.evict()
+        except OSError:
+            pass
+
+    def evict(self) -> None:
+        """
+        Deletes least recently used entries until the directory fits
+        `max_bytes`.
+        """
+        entries = []
+        for path in self.directory.glob("*" + _SUFFIX):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
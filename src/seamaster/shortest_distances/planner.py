@@ -0,0 +1,179 @@
+"""
+A* planner that routes bots around the obstacles of the current tick.
+
+The static distance table is an exact heuristic for the empty map, and
+dynamic obstacles (bots) can only lengthen a route, so it stays admissible
+and A* expands little more than the detour itself. Plans are kept per bot
+and, when a cell on the route becomes blocked, repaired by searching only
+until the route can be rejoined behind the blockage.
+"""
+
+import heapq
+
+from .tables import OFFSETS, PathTables
+
+
+class Plan:
+    """
+    A cached route, stored as the cells from the bot's position to `target`.
+    """
+
+    def __init__(self, target: int, cells: list[int]):
+        self.target = target
+        self.cells = cells
+        self.index = {c: i for i, c in enumerate(cells)}
+
+    def remaining(self, src: int) -> int | None:
+        """
+        Returns the steps left from `src` to the target, None if `src` is
+        not on the route.
+        """
+        i = self.index.get(src)
+        return None if i is None else len(self.cells) - 1 - i
+
+
+class PathPlanner:
+    """
+    Keeps one Plan per bot across ticks.
+
+    Dynamic obstacles are only honoured within `horizon` steps of the bot:
+    bots further away will have moved by the time it gets there, so the
+    rest of the route follows the static table.
+    """
+
+    def __init__(self, horizon: int = 4, max_expansions: int = 2000):
+        """
+        Args:
+            horizon (int): Steps ahead in which blocked cells are avoided.
+            max_expansions (int): Search budget per plan or repair.
+        """
+        self.horizon = horizon
+        self.max_expansions = max_expansions
+        self.plans: dict[int, Plan] = {}
+        self.searches = 0
+        self.repairs = 0
+
+    def forget(self, key: int) -> None:
+        """
+        Drops the plan stored for `key`.
+        """
+        self.plans.pop(key, None)
+
+    def next_cell(
+        self,
+        key: int,
+        tables: PathTables,
+        grid,
+        mask: int,
+        src: int,
+        dst: int,
+    ) -> int | None:
+        """
+        Returns the next cell on a route from `src` to `dst`, following,
+        repairing or replacing the plan stored for `key`.
+
+        Args:
+            key (int): Plan owner, usually the bot id.
+            tables (PathTables): Static tables used as heuristic.
+            grid: Per-cell flags of the tick (Occupancy.grid).
+            mask (int): Flags that make a cell blocked.
+            src (int): Current cell.
+            dst (int): Target cell. It is never treated as blocked.
+
+        Returns:
+            int | None: Next cell, or None if no route exists within budget.
+        """
+        if src == dst:
+            return None
+
+        plan = self.plans.get(key)
+        if plan is not None and plan.target == dst and src in plan.index:
+            cells = plan.cells
+            i = plan.index[src]
+            blocked_at = -1
+            for j in range(i + 1, min(i + 1 + self.horizon, len(cells))):
+                c = cells[j]
+                if grid[c] & mask and c != dst:
+                    blocked_at = j
+                    break
+            if blocked_at < 0:
+                return cells[i + 1]
+
+            rejoin = {c: k for k, c in enumerate(cells) if k > blocked_at}
+            route = self._search(tables, grid, mask, src, dst, rejoin)
+            if route is not None:
+                self.repairs += 1
+                plan = Plan(dst, route + cells[rejoin[route[-1]] + 1 :])
+                self.plans[key] = plan
+                return plan.cells[1]
+
+        route = self._search(tables, grid, mask, src, dst, None)
+        if route is None:
+            self.forget(key)
+            return None
+        self.plans[key] = Plan(dst, route)
+        return route[1]
+
+    def _search(
+        self,
+        tables: PathTables,
+        grid,
+        mask: int,
+        src: int,
+        dst: int,
+        rejoin: dict[int, int] | None,
+    ) -> list[int] | None:
+        """
+        A* from `src` to `dst`, or to any cell of `rejoin` when given.
+        """
+        self.searches += 1
+        width, height, cells = tables.width, tables.height, tables.cells
+        dist, unreachable = tables.dist, tables.unreachable
+        base = dst * cells
+        horizon = self.horizon
+
+        h = dist[base + src]
+        if h == unreachable:
+            return None
+
+        best = {src: 0}
+        parent = {src: -1}
+        # ties go to the deeper node, which walks straight down the table
+        heap = [(h, 0, src)]
+        expansions = 0
+
+        while heap:
+            _, neg_g, u = heapq.heappop(heap)
+            g = -neg_g
+            if g > best[u]:
+                continue
+            if u == dst or (rejoin is not None and u in rejoin and u != src):
+                route = []
+                while u != -1:
+                    route.append(u)
+                    u = parent[u]
+                route.reverse()
+                return route
+
+            expansions += 1
+            if expansions > self.max_expansions:
+                return None
+
+            x, y = u % width, u // width
+            ng = g + 1
+            for dx, dy in OFFSETS:
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                v = ny * width + nx
+                hv = dist[base + v]
+                if hv == unreachable:
+                    continue
+                if g < horizon and grid[v] & mask and v != dst:
+                    continue
+                if ng < best.get(v, ng + 1):
+                    best[v] = ng
+                    parent[v] = u
+                    heapq.heappush(heap, (ng + hv, -ng, v))
+
+        return None
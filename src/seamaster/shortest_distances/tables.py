@@ -0,0 +1,214 @@
+"""
+Packed shortest-path tables.
+
+A table file holds, for one map layout, the shortest distance and the set of
+optimal first moves between every pair of grid cells:
+
+    header   16 bytes  magic, version, width, height, distance item size
+    dist     N * N     distances, the item maximum when no path exists
+    guide    N * N     next-hop bitmasks (bit i -> ``Direction`` member i)
+
+Cells use a dense row-major index, ``cell = y * width + x``, so ``N`` is
+``width * height``. Both blocks are target-major: the entry for a move from
+``src`` towards ``dst`` lives at ``dst * N + src``. The file is meant to be
+memory-mapped, so every process reading it shares the same pages.
+"""
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+
+MAGIC = b"SMPT"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHHHBxI")
+
+# (dx, dy) for NORTH, EAST, SOUTH, WEST, in ``Direction`` declaration order.
+OFFSETS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+
+class PathTables:
+    """
+    Distance and next-hop tables for a single map layout.
+    """
+
+    def __init__(self, width: int, height: int, dist, guide, buffer=None):
+        """
+        Args:
+            width (int): Map width.
+            height (int): Map height.
+            dist: Flat, target-major distances (memoryview or array).
+            guide: Flat, target-major next-hop bitmasks.
+            buffer: Object owning the memory behind ``dist``/``guide``.
+        """
+        self.width = width
+        self.height = height
+        self.cells = width * height
+        self.dist = dist
+        self.guide = guide
+        self.unreachable = (1 << (8 * dist.itemsize)) - 1
+        self._buffer = buffer
+        self._walls: frozenset[int] | None = None
+        self._neighbours: list[tuple[int, ...]] | None = None
+
+    def cell(self, x: int, y: int) -> int:
+        """
+        Returns the cell index of (x, y), or -1 when it lies off the map.
+        """
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return y * self.width + x
+        return -1
+
+    def distance(self, src: int, dst: int) -> int | None:
+        """
+        Returns the shortest distance between two cells, or None if unreachable.
+        """
+        d = self.dist[dst * self.cells + src]
+        if d == self.unreachable:
+            return None
+        return d
+
+    def hops(self, src: int, dst: int) -> int:
+        """
+        Returns the bitmask of optimal first moves from `src` towards `dst`.
+        """
+        return self.guide[dst * self.cells + src]
+
+    def wall_cells(self) -> frozenset[int]:
+        """
+        Returns the cells that cannot be entered, i.e. the map's walls.
+        """
+        cells, dist, unreachable = self.cells, self.dist, self.unreachable
+        return frozenset(c for c in range(cells) if dist[c * cells + c] == unreachable)
+
+    def neighbours(self) -> list[tuple[int, ...]]:
+        """
+        Returns the open neighbour cells of every cell, computed on first use.
+        """
+        if self._neighbours is None:
+            width, height = self.width, self.height
+            walls = self.wall_cells()
+            neighbours = []
+            for c in range(self.cells):
+                x, y = c % width, c // width
+                neighbours.append(
+                    tuple(
+                        (y + dy) * width + x + dx
+                        for dx, dy in OFFSETS
+                        if 0 <= x + dx < width
+                        and 0 <= y + dy < height
+                        and (y + dy) * width + x + dx not in walls
+                    )
+                )
+            self._neighbours = neighbours
+        return self._neighbours
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the tables in the packed file format.
+        """
+        dist = array("B" if self.dist.itemsize == 1 else "H", self.dist)
+        if sys.byteorder == "big":
+            dist.byteswap()
+        header = _HEADER.pack(
+            MAGIC, VERSION, self.width, self.height, self.dist.itemsize, 0
+        )
+        return header + dist.tobytes() + bytes(self.guide)
+
+    def dump(self, path) -> None:
+        """
+        Writes the tables to `path`.
+        """
+        Path(path).write_bytes(self.to_bytes())
+
+    @classmethod
+    def from_buffer(cls, buffer) -> "PathTables":
+        """
+        Builds tables that read directly from a bytes-like `buffer`.
+
+        Raises:
+            ValueError: If the buffer is not a valid table file.
+        """
+        view = memoryview(buffer)
+        if len(view) < _HEADER.size:
+            raise ValueError("Path table buffer is truncated.")
+
+        magic, version, width, height, itemsize, _ = _HEADER.unpack_from(view)
+        if magic != MAGIC or version != VERSION or itemsize not in (1, 2):
+            raise ValueError("Unsupported path table format.")
+
+        cells = width * height
+        start = _HEADER.size
+        middle = start + cells * cells * itemsize
+        end = middle + cells * cells
+        if len(view) != end:
+            raise ValueError("Path table buffer has the wrong size.")
+
+        dist = view[start:middle]
+        if itemsize == 2:
+            if sys.byteorder == "big":
+                dist = array("H", dist)
+                dist.byteswap()
+                dist = memoryview(dist)
+            else:
+                dist = dist.cast("H")
+
+        return cls(width, height, dist, view[middle:end], buffer)
+
+    @classmethod
+    def load(cls, path) -> "PathTables":
+        """
+        Memory-maps a table file.
+        """
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls.from_buffer(mapped)
+
+
+def pack_dist_json(data: dict, width: int, height: int) -> PathTables:
+    """
+    Converts a legacy ``{"x,y": {"x,y": distance}}`` table into PathTables,
+    deriving the next hops from the distances.
+    """
+    cells = width * height
+    largest = max((max(row.values()) for row in data.values()), default=0)
+    typecode = "B" if largest < 0xFF else "H"
+    unreachable = 0xFF if typecode == "B" else 0xFFFF
+    dist = array(typecode, [unreachable]) * (cells * cells)
+    guide = bytearray(cells * cells)
+
+    def index(key: str) -> int:
+        x, y = key.split(",")
+        return int(y) * width + int(x)
+
+    for src_key, row in data.items():
+        src = index(src_key)
+        for dst_key, d in row.items():
+            dist[index(dst_key) * cells + src] = d
+
+    for dst in range(cells):
+        base = dst * cells
+        for src in range(cells):
+            d = dist[base + src]
+            if d == unreachable or d == 0:
+                continue
+            x, y = src % width, src // width
+            mask = 0
+            for bit, (dx, dy) in enumerate(OFFSETS):
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < width and 0 <= ny < height:
+                    if dist[base + ny * width + nx] == d - 1:
+                        mask |= 1 << bit
+            guide[base + src] = mask
+
+    return PathTables(width, height, memoryview(dist), memoryview(guide))
+
+
+if __name__ == "__main__":
+    # python -m seamaster.shortest_distances.tables dist.json paths.bin 20 20
+    with open(sys.argv[1]) as f:
+        legacy = json.load(f)
+    pack_dist_json(legacy, int(sys.argv[3]), int(sys.argv[4])).dump(sys.argv[2])
@@ -0,0 +1,679 @@
+"""
+Simulator module is a headless stand-in for the game engine.
+
+It produces PlayerView-shaped dicts and applies the wrapper's
+{"tick", "spawns", "actions"} responses, so whole matches run in-process
+with no network. The rules are a reference model written from the SDK's
+point of view and are good enough for realistic load, not a replica of
+the engine:
+
+- The players alternate: raw tick 2r-1 is player 0's turn of round r, raw
+  tick 2r player 1's, matching the wrapper's tick linearization. Upkeep
+  (deposits, pads, regrowth) runs once both players moved.
+- Player 1 gets the map rotated by 180 degrees: its spawn column is the
+  last one and its banks and pads are the rotations of player 0's.
+- Moving costs `traversal_cost` energy per cell: BASE_TRAVERSAL plus the
+  loadout's ABILITY_COSTS. Actions cost the ABILITY_COSTS action energy.
+  Actions a bot cannot afford or perform are ignored.
+- HARVEST takes the algae on the bot's cell or the adjacent one in the
+  given direction. Poisonous algae kill the harvester.
+- DEPOSIT within DEPOSIT_RANGE of an own idle bank starts a deposit of
+  everything held (2, like the Forager template, which deposits once it
+  is a step from a free cell next to the bank). It is scored after
+  DEPOSIT_TICKS rounds unless an enemy LOCKPICK bot next to the bank
+  lockpicks it LOCKPICK_TICKS turns in a row, which steals it.
+- Bots on or next to an available energy pad recharge PAD_CHARGE per
+  round. Pads are available for PAD_ACTIVE rounds, then rest PAD_REST.
+- SELFDESTRUCT removes the bot and every unshielded bot next to it.
+  POISON turns the adjacent algae poisonous.
+- A bot ending its move on scraps collects them for its player.
+- Players see within VISION of their bots, SCOUT_VISION for scouts, and
+  scouts learn which algae in their sight are poisonous.
+
+The match ends after the given number of rounds; the player with more
+algae banked wins.
+"""
+
+import random
+import time
+from typing import Callable
+
+from seamaster.api.energy import loadout_traversal_cost
+from seamaster.api.spatial import ring
+from seamaster.constants import ABILITY_COSTS, SCRAP_COSTS, Ability, Direction
+from seamaster.shortest_distances import OFFSETS
+from seamaster.wrapper import WrapperState
+
+# walls of the packaged 20x20 map
+DEFAULT_WALLS = (
+    (3, 6), (3, 13), (4, 4), (4, 6), (4, 13), (4, 15), (5, 6),
+    (5, 13), (6, 3), (6, 4), (6, 5), (6, 14), (6, 15), (6, 16),
+    (13, 3), (13, 4), (13, 5), (13, 14), (13, 15), (13, 16), (14, 6),
+    (14, 13), (15, 4), (15, 6), (15, 13), (15, 15), (16, 6), (16, 13),
+)  # fmt: skip
+# player 0's banks and the energy pads; player 1 gets their rotations
+DEFAULT_BANKS = ((1, 4), (1, 15))
+DEFAULT_PADS = ((9, 9),)
+
+MAX_ENERGY = 50
+MAX_BOTS = 50
+START_SCRAPS = 100
+SCRAP_INCOME = 1
+BASE_TRAVERSAL = 1.0
+ALGAE_CAPACITY = 10
+VISION = 4
+SCOUT_VISION = 7
+PAD_CHARGE = 10
+PAD_ACTIVE = 30
+PAD_REST = 10
+DEPOSIT_RANGE = 2
+DEPOSIT_TICKS = 5
+LOCKPICK_TICKS = 3
+ALGAE_TARGET = 40
+POISON_SHARE = 0.3
+SCRAP_TARGET = 10
+SCRAP_AMOUNT = 3
+
+_STEP = {d.value: OFFSETS[i] for i, d in enumerate(Direction)}
+_ABILITY_NAMES = {a.value: a.name for a in Ability}
+
+
+class _SimBot:
+    __slots__ = (
+        "id",
+        "side",
+        "x",
+        "y",
+        "energy",
+        "abilities",
+        "algae_held",
+        "traversal_cost",
+    )
+
+    def __init__(self, bot_id: int, side: int, x: int, y: int, abilities: list):
+        self.id = bot_id
+        self.side = side
+        self.x = x
+        self.y = y
+        self.energy = MAX_ENERGY
+        self.abilities = abilities
+        self.algae_held = 0
+        self.traversal_cost = BASE_TRAVERSAL + loadout_traversal_cost(abilities)
+
+
+class _SimBank:
+    __slots__ = (
+        "id",
+        "x",
+        "y",
+        "owner",
+        "deposit_amount",
+        "deposit_ticks_left",
+        "lockpick_botid",
+        "lockpick_ticks_left",
+        "lockpicked",
+    )
+
+    def __init__(self, bank_id: int, x: int, y: int, owner: int):
+        self.id = bank_id
+        self.x = x
+        self.y = y
+        self.owner = owner
+        self.deposit_amount = 0
+        self.deposit_ticks_left = 0
+        self.lockpick_botid = -1
+        self.lockpick_ticks_left = 0
+        # whether the lockpicker kept at it this round
+        self.lockpicked = False
+
+
+class _SimPad:
+    __slots__ = ("id", "x", "y", "available", "ticks_left")
+
+    def __init__(self, pad_id: int, x: int, y: int):
+        self.id = pad_id
+        self.x = x
+        self.y = y
+        self.available = 1
+        self.ticks_left = PAD_ACTIVE
+
+
+class Simulator:
+    """
+    Game state of one match, advanced one player turn at a time.
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        width: int = 20,
+        height: int = 20,
+        walls=DEFAULT_WALLS,
+        banks=DEFAULT_BANKS,
+        pads=DEFAULT_PADS,
+    ):
+        """
+        Args:
+            seed (int): Seed of the algae and scrap placement.
+            width (int): Map width.
+            height (int): Map height.
+            walls (Iterable[tuple[int, int]]): Wall cells.
+            banks (Iterable[tuple[int, int]]): Player 0's banks.
+            pads (Iterable[tuple[int, int]]): Energy pads, each added
+                together with its rotation unless it is its own.
+        """
+        self.rng = random.Random(seed)
+        self.width = width
+        self.height = height
+        self.walls = {y * width + x for x, y in walls}
+        self.round = 1
+        self.tick = 1
+        self.scraps = [START_SCRAPS, START_SCRAPS]
+        self.banked = [0, 0]
+        self.stats = [_new_stats(), _new_stats()]
+
+        self.bots: dict[int, _SimBot] = {}
+        self.occupied: dict[int, _SimBot] = {}
+        # cell -> poisonous
+        self.algae: dict[int, bool] = {}
+        # cell -> amount
+        self.scrap_cells: dict[int, int] = {}
+        # algae cells each player knows the poison status of
+        self.revealed: tuple[set[int], set[int]] = (set(), set())
+
+        self.banks: list[_SimBank] = []
+        for x, y in banks:
+            self.banks.append(_SimBank(len(self.banks), x, y, 0))
+        for x, y in banks:
+            rx, ry = self._rotate(x, y)
+            self.banks.append(_SimBank(len(self.banks), rx, ry, 1))
+        self.pads: list[_SimPad] = []
+        for x, y in pads:
+            self.pads.append(_SimPad(len(self.pads), x, y))
+            if self._rotate(x, y) != (x, y):
+                self.pads.append(_SimPad(len(self.pads), *self._rotate(x, y)))
+
+        # like the SDK's occupancy, only walls block; banks and pads do not
+        self._blocked = set(self.walls)
+
+        # wall dicts never change, the decoders cache them by identity
+        self._wall_dicts = [
+            {"x": c % width, "y": c // width} for c in sorted(self.walls)
+        ]
+        self._vision = {
+            r: [o for k in range(r + 1) for o in ring(k)]
+            for r in (1, VISION, SCOUT_VISION)
+        }
+        self._regrow(initial=True)
+
+    # ---- VIEWS ----
+    def side_to_move(self) -> int:
+        """
+        Returns the player whose turn the current tick is.
+        """
+        return (self.tick - 1) % 2
+
+    def view(self, side: int) -> dict:
+        """
+        Builds the view of a player for the current tick.
+        """
+        width, height = self.width, self.height
+        visible = bytearray(width * height)
+        revealed = self.revealed[side]
+        for bot in self.bots.values():
+            if bot.side != side:
+                continue
+            scout = Ability.SCOUT.value in bot.abilities
+            for dx, dy in self._vision[SCOUT_VISION if scout else VISION]:
+                x, y = bot.x + dx, bot.y + dy
+                if 0 <= x < width and 0 <= y < height:
+                    cell = y * width + x
+                    visible[cell] = 1
+                    if scout and cell in self.algae:
+                        revealed.add(cell)
+
+        bots = {}
+        enemies = []
+        for bot in self.bots.values():
+            if bot.side == side:
+                bots[str(bot.id)] = {
+                    "id": bot.id,
+                    "location": {"x": bot.x, "y": bot.y},
+                    "energy": bot.energy,
+                    "scraps": 0,
+                    "abilities": list(bot.abilities),
+                    "algae_held": bot.algae_held,
+                    "traversal_cost": bot.traversal_cost,
+                    "status": "ACTIVE",
+                }
+            elif visible[bot.y * width + bot.x]:
+                enemies.append(
+                    {
+                        "id": bot.id,
+                        "location": {"x": bot.x, "y": bot.y},
+                        "scraps": 0,
+                        "abilities": list(bot.abilities),
+                    }
+                )
+
+        algae = []
+        for cell, poisonous in self.algae.items():
+            if visible[cell]:
+                if cell in revealed:
+                    status = "TRUE" if poisonous else "FALSE"
+                else:
+                    status = "UNKNOWN"
+                algae.append(
+                    {
+                        "location": {"x": cell % width, "y": cell // width},
+                        "is_poison": status,
+                    }
+                )
+        scraps = [
+            {"location": {"x": cell % width, "y": cell // width}, "amount": amount}
+            for cell, amount in self.scrap_cells.items()
+            if visible[cell]
+        ]
+
+        banks = {}
+        for b in self.banks:
+            depositing = b.deposit_ticks_left > 0
+            banks[str(b.id)] = {
+                "id": b.id,
+                "location": {"x": b.x, "y": b.y},
+                "deposit_occuring": depositing,
+                "deposit_amount": b.deposit_amount,
+                "is_deposit_owner": depositing and b.owner == side,
+                "is_bank_owner": b.owner == side,
+                "deposit_ticks_left": b.deposit_ticks_left,
+                "lockpick_occuring": b.lockpick_botid != -1,
+                "lockpick_ticks_left": b.lockpick_ticks_left,
+                "lockpick_botid": b.lockpick_botid,
+            }
+        pads = {
+            str(p.id): {
+                "id": p.id,
+                "location": {"x": p.x, "y": p.y},
+                "available": p.available,
+                "ticks_left": p.ticks_left,
+            }
+            for p in self.pads
+        }
+
+        return {
+            "side": side,
+            "tick": self.tick,
+            "scraps": self.scraps[side],
+            "algae": self.banked[side],
+            "bot_id_seed": 1000 + side * 100000,
+            "max_bots": MAX_BOTS,
+            "width": width,
+            "height": height,
+            "bots": bots,
+            "visible_entities": {
+                "enemies": enemies,
+                "scraps": scraps,
+                "algae": algae,
+            },
+            "permanent_entities": {
+                "banks": banks,
+                "energy_pads": pads,
+                "walls": self._wall_dicts,
+            },
+        }
+
+    # ---- TURNS ----
+    def apply(self, side: int, response: dict) -> None:
+        """
+        Applies a player's response and advances to the next tick.
+
+        Args:
+            side (int): Player who answered, the one to move.
+            response (dict): The wrapper's {"tick", "spawns", "actions"}.
+
+        Raises:
+            ValueError: If it is not `side`'s turn.
+        """
+        if side != self.side_to_move():
+            raise ValueError(f"Player {side} answered on the other player's turn")
+
+        for key, spec in (response.get("spawns") or {}).items():
+            self._spawn(side, int(key), spec)
+
+        actions = response.get("actions") or {}
+        for key in sorted(actions, key=int):
+            bot = self.bots.get(int(key))
+            if bot is not None and bot.side == side:
+                self._act(bot, actions[key])
+
+        if side == 1:
+            self._upkeep()
+            self.round += 1
+        self.tick += 1
+
+    def winner(self) -> int | None:
+        """
+        Returns the player with more algae banked, None on a draw.
+        """
+        if self.banked[0] == self.banked[1]:
+            return None
+        return 0 if self.banked[0] > self.banked[1] else 1
+
+    def _spawn(self, side: int, bot_id: int, spec: dict) -> None:
+        abilities = [_value(a) for a in spec.get("abilities") or []]
+        cost = sum(SCRAP_COSTS.get(_ABILITY_NAMES.get(a, a), 0) for a in abilities)
+        count = sum(1 for b in self.bots.values() if b.side == side)
+        row = spec.get("location", {}).get("y", 0)
+        x, y = (0, row) if side == 0 else self._rotate(0, row)
+        if (
+            bot_id in self.bots
+            or count >= MAX_BOTS
+            or cost > self.scraps[side]
+            or not self._free(x, y)
+        ):
+            return
+        self.scraps[side] -= cost
+        bot = _SimBot(bot_id, side, x, y, abilities)
+        self.bots[bot_id] = bot
+        self.occupied[y * self.width + x] = bot
+        self.stats[side]["spawned"] += 1
+
+    def _act(self, bot: _SimBot, action: dict) -> None:
+        kind = _value(action.get("action"))
+        if kind == Ability.MOVE.value:
+            self._move(bot, action.get("direction"), action.get("step") or 1)
+            return
+        if kind not in bot.abilities:
+            return
+        cost = ABILITY_COSTS.get(_ABILITY_NAMES.get(kind, ""), {}).get("action", 0)
+        if bot.energy < cost:
+            return
+
+        if kind == Ability.HARVEST.value:
+            self._harvest(bot, action.get("direction"), cost)
+        elif kind == Ability.DEPOSIT.value:
+            self._deposit(bot, cost)
+        elif kind == Ability.LOCKPICK.value:
+            self._lockpick(bot, action.get("location"), cost)
+        elif kind == Ability.SELF_DESTRUCT.value:
+            self._self_destruct(bot)
+        elif kind == Ability.POISON.value:
+            cell = self._target_cell(bot, action.get("direction"))
+            if cell in self.algae:
+                bot.energy -= cost
+                self.algae[cell] = True
+
+    def _move(self, bot: _SimBot, direction, step: int) -> None:
+        offset = _STEP.get(_value(direction))
+        if offset is None or step not in (1, 2):
+            return
+        if step == 2 and Ability.SPEED_BOOST.value not in bot.abilities:
+            return
+        cost = bot.traversal_cost * step
+        if bot.energy < cost:
+            return
+        x, y = bot.x, bot.y
+        for _ in range(step):
+            x, y = x + offset[0], y + offset[1]
+            if not self._free(x, y):
+                return
+        width = self.width
+        del self.occupied[bot.y * width + bot.x]
+        bot.x, bot.y = x, y
+        cell = y * width + x
+        self.occupied[cell] = bot
+        bot.energy -= cost
+        amount = self.scrap_cells.pop(cell, 0)
+        if amount:
+            self.scraps[bot.side] += amount
+            self.stats[bot.side]["scraps_collected"] += amount
+
+    def _harvest(self, bot: _SimBot, direction, cost: float) -> None:
+        cell = self._target_cell(bot, direction)
+        if cell not in self.algae or bot.algae_held >= ALGAE_CAPACITY:
+            return
+        bot.energy -= cost
+        poisonous = self.algae.pop(cell)
+        for known in self.revealed:
+            known.discard(cell)
+        if poisonous:
+            self._kill(bot)
+            return
+        bot.algae_held += 1
+        self.stats[bot.side]["harvested"] += 1
+
+    def _deposit(self, bot: _SimBot, cost: float) -> None:
+        if bot.algae_held == 0:
+            return
+        for bank in self.banks:
+            if (
+                bank.owner == bot.side
+                and bank.deposit_ticks_left == 0
+                and abs(bank.x - bot.x) + abs(bank.y - bot.y) <= DEPOSIT_RANGE
+            ):
+                bot.energy -= cost
+                bank.deposit_amount = bot.algae_held
+                bank.deposit_ticks_left = DEPOSIT_TICKS
+                bot.algae_held = 0
+                return
+
+    def _lockpick(self, bot: _SimBot, location, cost: float) -> None:
+        x, y = _xy(location)
+        for bank in self.banks:
+            if (
+                (bank.x, bank.y) != (x, y)
+                or bank.owner == bot.side
+                or bank.deposit_ticks_left == 0
+                or abs(bank.x - bot.x) + abs(bank.y - bot.y) != 1
+            ):
+                continue
+            bot.energy -= cost
+            if bank.lockpick_botid != bot.id:
+                bank.lockpick_botid = bot.id
+                bank.lockpick_ticks_left = LOCKPICK_TICKS
+            bank.lockpick_ticks_left -= 1
+            bank.lockpicked = True
+            if bank.lockpick_ticks_left == 0:
+                self.banked[bot.side] += bank.deposit_amount
+                self.stats[bot.side]["stolen"] += bank.deposit_amount
+                _clear_deposit(bank)
+            return
+
+    def _self_destruct(self, bot: _SimBot) -> None:
+        for other in self._bots_near(bot.x, bot.y):
+            if other is not bot and Ability.SHIELD.value not in other.abilities:
+                self._kill(other)
+        self._kill(bot)
+
+    def _kill(self, bot: _SimBot) -> None:
+        if self.bots.pop(bot.id, None) is None:
+            return
+        self.occupied.pop(bot.y * self.width + bot.x, None)
+        self.stats[bot.side]["lost"] += 1
+
+    def _upkeep(self) -> None:
+        for side in (0, 1):
+            self.scraps[side] += SCRAP_INCOME
+
+        for bank in self.banks:
+            if bank.lockpick_botid != -1 and not bank.lockpicked:
+                bank.lockpick_botid = -1
+                bank.lockpick_ticks_left = 0
+            bank.lockpicked = False
+            if bank.deposit_ticks_left > 0:
+                bank.deposit_ticks_left -= 1
+                if bank.deposit_ticks_left == 0:
+                    self.banked[bank.owner] += bank.deposit_amount
+                    self.stats[bank.owner]["deposited"] += bank.deposit_amount
+                    _clear_deposit(bank)
+
+        for pad in self.pads:
+            if pad.available:
+                for bot in self._bots_near(pad.x, pad.y):
+                    bot.energy = min(MAX_ENERGY, bot.energy + PAD_CHARGE)
+            pad.ticks_left -= 1
+            if pad.ticks_left <= 0:
+                pad.available = 1 - pad.available
+                pad.ticks_left = PAD_ACTIVE if pad.available else PAD_REST
+
+        self._regrow()
+
+    def _regrow(self, initial: bool = False) -> None:
+        # one of each per round, the whole stock at the start
+        rng = self.rng
+        algae_missing = ALGAE_TARGET - len(self.algae)
+        scrap_missing = SCRAP_TARGET - len(self.scrap_cells)
+        if not initial:
+            algae_missing = min(algae_missing, 1)
+            scrap_missing = min(scrap_missing, 1)
+        for _ in range(max(0, algae_missing)):
+            cell = self._random_free_cell()
+            if cell is not None:
+                self.algae[cell] = rng.random() < POISON_SHARE
+        for _ in range(max(0, scrap_missing)):
+            cell = self._random_free_cell()
+            if cell is not None:
+                self.scrap_cells[cell] = SCRAP_AMOUNT
+
+    def _random_free_cell(self) -> int | None:
+        cells = self.width * self.height
+        for _ in range(20):
+            cell = self.rng.randrange(cells)
+            if (
+                cell not in self._blocked
+                and cell not in self.algae
+                and cell not in self.scrap_cells
+                and cell not in self.occupied
+                and cell % self.width not in (0, self.width - 1)
+            ):
+                return cell
+        return None
+
+    def _bots_near(self, x: int, y: int) -> list[_SimBot]:
+        # bots on (x, y) or next to it
+        near = []
+        for dx, dy in self._vision[1]:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < self.width and 0 <= ny < self.height:
+                bot = self.occupied.get(ny * self.width + nx)
+                if bot is not None:
+                    near.append(bot)
+        return near
+
+    def _free(self, x: int, y: int) -> bool:
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        cell = y * self.width + x
+        return cell not in self._blocked and cell not in self.occupied
+
+    def _target_cell(self, bot: _SimBot, direction) -> int | None:
+        direction = _value(direction)
+        if direction in (None, "NULL"):
+            return bot.y * self.width + bot.x
+        offset = _STEP.get(direction)
+        if offset is None:
+            return None
+        x, y = bot.x + offset[0], bot.y + offset[1]
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        return y * self.width + x
+
+    def _rotate(self, x: int, y: int) -> tuple[int, int]:
+        return self.width - 1 - x, self.height - 1 - y
+
+
+class MatchResult:
+    """
+    Outcome of a simulated match.
+    """
+
+    def __init__(self, seed: int, sim: Simulator, latencies: list[list[float]]):
+        self.seed = seed
+        self.rounds = sim.round - 1
+        self.banked = list(sim.banked)
+        self.winner = sim.winner()
+        self.stats = sim.stats
+        # seconds each player took per turn
+        self.latencies = latencies
+
+    def to_dict(self) -> dict:
+        return {
+            "seed": self.seed,
+            "rounds": self.rounds,
+            "banked": self.banked,
+            "winner": self.winner,
+            "stats": self.stats,
+        }
+
+
+def run_match(
+    spawn_policies: tuple[Callable, Callable],
+    seed: int = 0,
+    rounds: int = 300,
+    **sim_args,
+) -> MatchResult:
+    """
+    Plays a match between two submissions in-process, each with its own
+    WrapperState. With SEAMASTER_PROFILE set to a file, player 0 profiles
+    to `<root>.p0<ext>` and player 1 to `<root>.p1<ext>`.
+
+    Args:
+        spawn_policies (tuple[Callable, Callable]): Spawn policies of
+            player 0 and player 1.
+        seed (int): Seeds the simulator and Python's `random` module, which
+            strategies may use.
+        rounds (int): Rounds to play; each has one turn per player.
+        **sim_args: Passed on to Simulator.
+
+    Returns:
+        MatchResult: Banked algae, winner, per-player stats and latencies.
+    """
+    random.seed(seed)
+    sim = Simulator(seed=seed, **sim_args)
+    states = tuple(
+        WrapperState(policy, player=f"p{side}")
+        for side, policy in enumerate(spawn_policies)
+    )
+    latencies: list[list[float]] = [[], []]
+    try:
+        for _ in range(2 * rounds):
+            side = sim.side_to_move()
+            data = sim.view(side)
+            started = time.perf_counter()
+            response = states[side].step(data)
+            latencies[side].append(time.perf_counter() - started)
+            sim.apply(side, response)
+    finally:
+        for state in states:
+            state.close()
+    return MatchResult(seed, sim, latencies)
+
+
+def _new_stats() -> dict:
+    return {
+        "spawned": 0,
+        "lost": 0,
+        "harvested": 0,
+        "deposited": 0,
+        "stolen": 0,
+        "scraps_collected": 0,
+    }
+
+
+def _clear_deposit(bank: _SimBank) -> None:
+    bank.deposit_amount = 0
+    bank.deposit_ticks_left = 0
+    bank.lockpick_botid = -1
+    bank.lockpick_ticks_left = 0
+
+
+def _value(x):
+    # enum members and their values are both accepted
+    return getattr(x, "value", x)
+
+
+def _xy(location) -> tuple[int, int]:
+    # Point (in-process responses) or {"x", "y"} (JSON responses)
+    if isinstance(location, dict):
+        return location.get("x", -1), location.get("y", -1)
+    return getattr(location, "x", -1), getattr(location, "y", -1)
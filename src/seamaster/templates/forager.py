@@ -1,6 +1,6 @@
 from seamaster.botbase import BotController
 from seamaster.translate import deposit, harvest, move
-from seamaster.constants import Ability, BotStatus
+from seamaster.constants import ABILITY_COSTS, AlgaeType, Ability, BotStatus
 from seamaster.utils import get_direction_in_one_radius, manhattan_distance
 from seamaster.api import GameAPI
 
@@ -18,7 +18,9 @@ class Forager(BotController):
     High-level behavior:
     - Actively searches for algae and scraps and harvests them.
     - If carried algae exceeds a threshold, it moves near a bank and deposits.
-    - If energy drops below a threshold, it moves near an energy pad and recharges.
+    - If its energy cannot cover the trip to the next algae and on to an
+    energy pad, it moves to an energy pad and recharges until its energy
+    exceeds `energy_threshold` and covers that trip, or is full.
     """
 
     ABILITIES = [Ability.HARVEST, Ability.DEPOSIT]
@@ -50,31 +52,19 @@ class Forager(BotController):
 
         Priority order:
         1. Resolve charging or depositing states if already active
-        2. Check for low energy and initiate charging if needed
+        2. Initiate charging if the next trip cannot be afforded
         3. Check algae capacity and initiate depositing if needed
         4. Harvest nearby algae or scraps if within interaction range
-        5. Move toward the nearest unknown resource
+        5. Move toward the algae assigned to this forager
         """
         ctx = self.ctx
         loc = ctx.get_location()
 
         if self.status == BotStatus.CHARGING:
-            if ctx.get_energy() > self.energy_threshold:
-                self.status = BotStatus.ACTIVE
-                self.target_pad_id = None
-                return None
-
-            pads = ctx.api.energypads()
-            pad = next((p for p in pads if p.id == self.target_pad_id), None)
-
-            if pad:
-                if manhattan_distance(loc, pad.location) == 0:
-                    return None
-            if pad:
-                d = ctx.move_target(loc, pad.location)
-                if d:
-                    return move(d)
-            return None
+            if not self._charged():
+                return self._charge()
+            self.status = BotStatus.ACTIVE
+            self.target_pad_id = None
 
         if self.status == BotStatus.DEPOSITING:
             if ctx.get_algae_held() == 0:
@@ -96,11 +86,17 @@ class Forager(BotController):
                     return deposit(None)
                     # pass
 
-        if ctx.get_energy() <= self.energy_threshold:
+        algae = self._target_algae()
+        target = algae.location if algae else loc
+        harvest_cost = ABILITY_COSTS["HARVEST"]["action"]
+
+        can_afford = ctx.can_reach_and_recharge(target, harvest_cost)
+        if not can_afford and ctx.get_energy() < ctx.api.get_max_energy():
             pad = ctx.get_nearest_energy_pad()
-            self.status = BotStatus.CHARGING
-            self.target_pad_id = pad.id
-            return None
+            if pad is not None:
+                self.status = BotStatus.CHARGING
+                self.target_pad_id = pad.id
+                return self._charge()
 
         if ctx.get_algae_held() >= self.algae_threshold:
             bank = ctx.get_my_banks(loc)
@@ -109,25 +105,76 @@ class Forager(BotController):
                 self.target_bank_id = bank[0].id
             return None
 
-        non_poisonous = ctx.sense_non_poisionous_algae(loc)
-
-        if non_poisonous:
-            if manhattan_distance(non_poisonous[0][1].location, loc) == 0:
+        if algae:
+            if manhattan_distance(algae.location, loc) == 0:
                 return harvest(None)
 
-        if non_poisonous:
-            if manhattan_distance(non_poisonous[0][1].location, loc) == 1:
-                direction = get_direction_in_one_radius(
-                    loc, non_poisonous[0][1].location
-                )
+        if algae:
+            if manhattan_distance(algae.location, loc) == 1:
+                direction = get_direction_in_one_radius(loc, algae.location)
                 return harvest(direction)
 
-        if non_poisonous:
-            d = ctx.move_target(loc, non_poisonous[0][1].location)
+        if algae:
+            d = ctx.move_target(loc, algae.location)
+            if d:
+                return move(d)
+            return None
+
+        # nothing in sight: head for safe algae seen on earlier ticks
+        remembered = ctx.nearest_remembered("algae", AlgaeType.FALSE)
+        if remembered:
+            d = ctx.move_target(loc, remembered)
             if d:
                 return move(d)
         return None
 
+    def _target_algae(self):
+        ctx = self.ctx
+        # shared out so that foragers do not all chase the same algae
+        algae = ctx.assigned_target("non_poisonous_algae")
+        if algae is None:
+            non_poisonous = ctx.sense_non_poisionous_algae(ctx.get_location(), k=1)
+            algae = non_poisonous[0][1] if non_poisonous else None
+        return algae
+
+    def _charged(self) -> bool:
+        """
+        Charging ends once the energy is above `energy_threshold` and covers
+        the trip to the next algae and on to a pad, or is full.
+        """
+        ctx = self.ctx
+        energy = ctx.get_energy()
+        if energy >= ctx.api.get_max_energy():
+            return True
+        if energy <= self.energy_threshold:
+            return False
+        algae = self._target_algae()
+        target = algae.location if algae else ctx.get_location()
+        return ctx.can_reach_and_recharge(target, ABILITY_COSTS["HARVEST"]["action"])
+
+    def _charge(self):
+        """
+        Moves to the target pad, or waits on it.
+        """
+        ctx = self.ctx
+        loc = ctx.get_location()
+        pads = ctx.api.energypads()
+        pad = next((p for p in pads if p.id == self.target_pad_id), None)
+        if pad is None:
+            pad = ctx.get_nearest_energy_pad()
+            if pad is None:
+                self.status = BotStatus.ACTIVE
+                self.target_pad_id = None
+                return None
+            self.target_pad_id = pad.id
+
+        if manhattan_distance(loc, pad.location) == 0:
+            return None
+        d = ctx.move_target(loc, pad.location)
+        if d:
+            return move(d)
+        return None
+
     @classmethod
     def can_spawn(cls, api: GameAPI) -> bool:
         """
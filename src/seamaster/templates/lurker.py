@@ -19,7 +19,8 @@ class Lurker(BotController):
     High-level behavior:
     - Searches for the nearest depositing enemy bank.
     - Moves toward the bank and repeatedly lockpicks it.
-    - If energy is low, temporarily retreats to recharge at an energy pad.
+    - If its energy is below ENERGY_THRESHOLD or cannot cover the trip to
+      its target and on to an energy pad, temporarily retreats to recharge.
     """
 
     ABILITIES = [Ability.LOCKPICK]
@@ -53,7 +54,7 @@ class Lurker(BotController):
 
         Priority order:
         1. Resolve charging behavior if currently recharging
-        2. Initiate charging if energy falls below threshold
+        2. Initiate charging if the trip to the target cannot be afforded
         3. Acquire a depositing bank as a target if none is set
         4. Lockpick the target bank when within interaction range
         5. Move toward the target bank otherwise
@@ -78,8 +79,14 @@ class Lurker(BotController):
                 return move(d)
             return None
 
-        if ctx.get_energy() < self.ENERGY_THRESHOLD:
+        target = self.target_bank or bot_pos
+        can_afford = ctx.get_energy() >= self.ENERGY_THRESHOLD and (
+            ctx.can_reach_and_recharge(target)
+        )
+        pad = None
+        if not can_afford and ctx.get_energy() < ctx.api.get_max_energy():
             pad = ctx.get_nearest_energy_pad()
+        if pad is not None:
             self.status = "charging"
             self.target_pad_id = pad.id
             self.lockpick_ticks = 0
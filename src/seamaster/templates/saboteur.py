@@ -22,7 +22,8 @@ class Saboteur(BotController):
     - Actively searches for nearby enemies.
     - Moves toward the closest detected enemy.
     - Self-destructs immediately when an enemy is within blast radius.
-    - Retreats to recharge if energy drops below a threshold.
+    - Retreats to recharge if its energy is below ENERGY_THRESHOLD or cannot
+      cover the trip to its target and on to an energy pad.
     """
 
     ABILITIES = [Ability.SELF_DESTRUCT]
@@ -53,7 +54,7 @@ class Saboteur(BotController):
 
         Priority order:
         1. Resolve charging behavior if currently recharging
-        2. Initiate charging if energy falls below threshold
+        2. Initiate charging if the trip to the target cannot be afforded
         3. Self-destruct if an enemy is within blast radius
         4. Acquire and pursue the nearest enemy
         5. Default movement if no enemy is found
@@ -78,8 +79,14 @@ class Saboteur(BotController):
                 return move(d)
             return None
 
-        if ctx.get_energy() < self.ENERGY_THRESHOLD:
+        target = self.target or loc
+        can_afford = ctx.get_energy() >= self.ENERGY_THRESHOLD and (
+            ctx.can_reach_and_recharge(target)
+        )
+        pad = None
+        if not can_afford and ctx.get_energy() < ctx.api.get_max_energy():
             pad = ctx.get_nearest_energy_pad()
+        if pad is not None:
             self.status = "charging"
             self.target_pad_id = pad.id
             self.target = None
@@ -90,11 +97,9 @@ class Saboteur(BotController):
             return self_destruct()
 
         if self.target is None:
-            for r in range(2, 11):
-                enemies = ctx.sense_enemies_in_radius(loc, radius=r)
-                if enemies:
-                    self.target = enemies[0].location
-                    break
+            enemy = ctx.sense_first_enemy(loc, max_radius=10, min_radius=2)
+            if enemy:
+                self.target = enemy.location
 
         if self.target:
             d = ctx.move_target(loc, self.target)
@@ -22,10 +22,12 @@ class Scout(BotController):
         ctx = self.ctx
         loc = ctx.get_location()
 
-        unknown = ctx.sense_unknown_algae(loc)
+        algae = ctx.assigned_target("unknown_algae")
+        if algae is None:
+            unknown = ctx.sense_unknown_algae(loc, k=1)
+            algae = unknown[0][1] if unknown else None
 
-        if unknown:
-            d, algae = unknown[0]
+        if algae:
             direction = ctx.move_target(loc, algae.location)
             if direction:
                 return move(direction)
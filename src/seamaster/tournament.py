@@ -0,0 +1,248 @@
+"""
+Tournament module plays many simulated matches between two submissions.
+
+Each match runs `simulator.run_match` in a worker process with a fresh
+WrapperState per player and a seed of its own, so a tournament is
+reproducible and its matches share nothing: throughput grows with the
+worker count until the cores run out. Submissions swap sides every other
+match, since player 0 moves first.
+
+    python -m seamaster.tournament submission other_submission.py -n 64
+
+A submission is named as `module[:attr]` or `path/to/file.py[:attr]`,
+`attr` being its spawn policy (default `spawn_policy`). To tune a template,
+write a variant submission, e.g. one spawning a Forager subclass with other
+thresholds, and play it against the original.
+"""
+
+import argparse
+import importlib.util
+import json
+import multiprocessing
+import os
+import sys
+import time
+from typing import Callable
+
+from seamaster.simulator import run_match
+
+
+def load_policy(spec: str) -> Callable:
+    """
+    Loads the spawn policy of a submission from fresh copies of its module
+    and of the modules it imports from its own folder, so module-level state
+    is not shared between players or matches, as in the sandbox where each
+    player has its own process.
+
+    Args:
+        spec (str): `module[:attr]` or `path/to/file.py[:attr]`; attr
+            defaults to `spawn_policy`.
+
+    Returns:
+        Callable: The spawn policy.
+    """
+    target, _, attr = spec.partition(":")
+    if target.endswith(".py"):
+        module_spec = importlib.util.spec_from_file_location(
+            "_seamaster_submission", target
+        )
+    else:
+        module_spec = importlib.util.find_spec(target)
+    if module_spec is None or module_spec.loader is None or not module_spec.origin:
+        raise ImportError(f"Cannot load submission: {target}")
+
+    # submissions import their own helpers next to them
+    folder = os.path.dirname(os.path.abspath(module_spec.origin))
+    if folder not in sys.path:
+        sys.path.insert(0, folder)
+    before = set(sys.modules)
+    module = importlib.util.module_from_spec(module_spec)
+    try:
+        module_spec.loader.exec_module(module)
+    finally:
+        # the policy keeps its helpers alive; the next load imports new ones
+        for name in set(sys.modules) - before:
+            path = getattr(sys.modules[name], "__file__", None) or ""
+            if os.path.abspath(path).startswith(folder + os.sep):
+                del sys.modules[name]
+    return getattr(module, attr or "spawn_policy")
+
+
+def play_match(job: tuple) -> dict:
+    """
+    Plays one match of a tournament.
+
+    Args:
+        job (tuple): (submissions, seed, rounds, swap, sim_args); with
+            swap the second submission plays as player 0.
+
+    Returns:
+        dict: Match summary, its players as submission indexes, and the
+        turn latencies in milliseconds per submission.
+    """
+    specs, seed, rounds, swap, sim_args = job
+    players = (1, 0) if swap else (0, 1)
+    policies = tuple(load_policy(specs[i]) for i in players)
+    started = time.perf_counter()
+    result = run_match(policies, seed=seed, rounds=rounds, **sim_args)
+    summary = result.to_dict()
+    summary["players"] = list(players)
+    summary["seconds"] = round(time.perf_counter() - started, 4)
+    latencies: list[list[float]] = [[], []]
+    for side, index in enumerate(players):
+        latencies[index] = [round(s * 1000, 4) for s in result.latencies[side]]
+    summary["latencies_ms"] = latencies
+    return summary
+
+
+def run_tournament(
+    submissions: tuple[str, str],
+    matches: int = 16,
+    rounds: int = 300,
+    seed: int = 0,
+    workers: int | None = None,
+    **sim_args,
+) -> dict:
+    """
+    Plays `matches` matches between two submissions on a process pool.
+
+    Args:
+        submissions (tuple[str, str]): Specs of the two submissions, see
+            `load_policy`. They may be the same.
+        matches (int): Matches to play; match i uses seed `seed + i`.
+        rounds (int): Rounds per match.
+        seed (int): Seed of the first match.
+        workers (int | None): Processes, default one per core; 1 plays in
+            this process.
+        **sim_args: Passed on to Simulator.
+
+    Returns:
+        dict: {"meta": ..., "submissions": [...], "matches": [...]} with,
+        per submission, wins, losses and draws, win rate, banked and
+        resource totals, and turn latency percentiles.
+    """
+    # fail before starting workers on a bad spec
+    for spec in submissions:
+        load_policy(spec)
+    workers = max(1, min(workers or os.cpu_count() or 1, matches))
+    jobs = [
+        (tuple(submissions), seed + i, rounds, i % 2 == 1, sim_args)
+        for i in range(matches)
+    ]
+
+    started = time.perf_counter()
+    if workers == 1:
+        results = [play_match(job) for job in jobs]
+    else:
+        context = multiprocessing.get_context(
+            "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+        )
+        with context.Pool(workers, initializer=_init_worker) as pool:
+            results = list(pool.imap_unordered(play_match, jobs))
+    elapsed = time.perf_counter() - started
+    results.sort(key=lambda r: r["seed"])
+
+    turns = sum(len(r["latencies_ms"][0]) + len(r["latencies_ms"][1]) for r in results)
+    return {
+        "meta": {
+            "submissions": list(submissions),
+            "matches": matches,
+            "rounds": rounds,
+            "seed": seed,
+            "workers": workers,
+            "seconds": round(elapsed, 3),
+            "matches_per_s": round(matches / elapsed, 2) if elapsed else None,
+            "turns_per_s": round(turns / elapsed, 1) if elapsed else None,
+        },
+        "submissions": [
+            _aggregate(index, spec, results) for index, spec in enumerate(submissions)
+        ],
+        "matches": [
+            {k: v for k, v in r.items() if k != "latencies_ms"} for r in results
+        ],
+    }
+
+
+def _init_worker() -> None:
+    # one profile file and no nested pools per tournament worker
+    os.environ.pop("SEAMASTER_PROFILE", None)
+    os.environ.pop("SEAMASTER_WORKERS", None)
+
+
+def _aggregate(index: int, spec: str, results: list[dict]) -> dict:
+    wins = losses = draws = 0
+    banked = 0
+    totals: dict[str, int] = {}
+    latencies: list[float] = []
+    for r in results:
+        side = r["players"].index(index)
+        if r["winner"] is None:
+            draws += 1
+        elif r["winner"] == side:
+            wins += 1
+        else:
+            losses += 1
+        banked += r["banked"][side]
+        for key, value in r["stats"][side].items():
+            totals[key] = totals.get(key, 0) + value
+        latencies.extend(r["latencies_ms"][index])
+    played = len(results)
+    latencies.sort()
+    return {
+        "submission": spec,
+        "wins": wins,
+        "losses": losses,
+        "draws": draws,
+        "win_rate": round((wins + draws / 2) / played, 4) if played else 0.0,
+        "banked": banked,
+        "banked_mean": round(banked / played, 2) if played else 0.0,
+        "totals": totals,
+        "latency_ms": {
+            "p50": _percentile(latencies, 0.5),
+            "p90": _percentile(latencies, 0.9),
+            "p99": _percentile(latencies, 0.99),
+            "max": latencies[-1] if latencies else 0.0,
+        },
+    }
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m seamaster.tournament")
+    parser.add_argument("first", help="submission, module[:attr] or file.py[:attr]")
+    parser.add_argument("second", nargs="?", help="opponent (default: first)")
+    parser.add_argument("-n", "--matches", type=int, default=16)
+    parser.add_argument("--rounds", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first match")
+    parser.add_argument(
+        "-j", "--workers", type=int, default=None, help="processes (default: cores)"
+    )
+    parser.add_argument("--matches-out", action="store_true", help="list each match")
+    parser.add_argument("-o", "--output", help="write the results here")
+    args = parser.parse_args(argv)
+
+    results = run_tournament(
+        (args.first, args.second or args.first),
+        matches=args.matches,
+        rounds=args.rounds,
+        seed=args.seed,
+        workers=args.workers,
+    )
+    if not args.matches_out:
+        del results["matches"]
+    text = json.dumps(results, indent=1)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
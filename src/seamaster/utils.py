@@ -2,9 +2,9 @@
 Provides utility functions and classes for the SeaWars game.
 """
 
-from seamaster.models.point import Point
+from seamaster.models.point import Point, pooled_cell
 from seamaster.constants import Direction
-from seamaster.shortest_distances import GUIDE, DIST
+from seamaster import shortest_distances
 
 
 def manhattan_distance(p1: Point, p2: Point) -> int:
@@ -28,14 +28,16 @@ def next_point(p: Point, d: Direction):
     Returns:
         Point: The next point in the specified direction.
     """
-    if d == Direction.NORTH and p.y + 1 >= 0 and p.y + 1 < 20:
-        return Point(p.x, p.y + 1)
-    if d == Direction.SOUTH and p.y - 1 >= 0 and p.y - 1 < 20:
-        return Point(p.x, p.y - 1)
-    if d == Direction.EAST and p.x + 1 >= 0 and p.x + 1 < 20:
-        return Point(p.x + 1, p.y)
-    if d == Direction.WEST and p.x - 1 >= 0 and p.x - 1 < 20:
-        return Point(p.x - 1, p.y)
+    width = shortest_distances.TABLES.width
+    height = shortest_distances.TABLES.height
+    if d == Direction.NORTH and p.y + 1 >= 0 and p.y + 1 < height:
+        return Point.at(p.x, p.y + 1)
+    if d == Direction.SOUTH and p.y - 1 >= 0 and p.y - 1 < height:
+        return Point.at(p.x, p.y - 1)
+    if d == Direction.EAST and p.x + 1 >= 0 and p.x + 1 < width:
+        return Point.at(p.x + 1, p.y)
+    if d == Direction.WEST and p.x - 1 >= 0 and p.x - 1 < width:
+        return Point.at(p.x - 1, p.y)
 
 
 def direction_from_point(p1: Point, p2: Point) -> Direction:
@@ -49,18 +51,21 @@ def direction_from_point(p1: Point, p2: Point) -> Direction:
     Raises:
         ValueError: If either point is out of bounds.
     """
+    width = shortest_distances.TABLES.width
+    height = shortest_distances.TABLES.height
     if (
-        p1.x > 20
+        p1.x >= width
         or p1.x < 0
-        or p1.y > 20
+        or p1.y >= height
         or p1.y < 0
-        or p2.x > 20
+        or p2.x >= width
         or p2.x < 0
-        or p2.y > 20
+        or p2.y >= height
         or p2.y < 0
     ):
         raise ValueError(
-            "Points must be within the grid bounds (0-19 for both x and y)"
+            f"Points must be within the grid bounds (0-{width - 1} for x, "
+            f"0-{height - 1} for y)"
         )
     dx = p2.x - p1.x
     dy = p2.y - p1.y
@@ -110,16 +115,7 @@ def get_optimal_next_hops(start: Point, end: Point) -> list[Direction]:
         list[Direction]: A list of directions representing optimal next hops along a
         shortest path. Returns an empty list if no path information is available.
     """
-    src = f"{start.x},{start.y}"
-    trg = f"{end.x},{end.y}"
-    priority = GUIDE.get(src, {}).get(trg)
-    if not priority:
-        return []
-    directions = []
-    for d in priority.split(","):
-        direction = Direction[d]
-        directions.append(direction)
-    return directions
+    return list(get_optimal_next_hops_between_cells(cell_of(start), cell_of(end)))
 
 
 def get_shortest_distance_between_points(start: Point, end: Point) -> int:
@@ -136,10 +132,151 @@ def get_shortest_distance_between_points(start: Point, end: Point) -> int:
         int: The shortest distance between start and end.
             Returns None if no distance information is available.
     """
-    src = f"{start.x},{start.y}"
-    trg = f"{end.x},{end.y}"
-    distance = DIST.get(src, {}).get(trg)
-    return distance
+    return get_shortest_distance_between_cells(cell_of(start), cell_of(end))
+
+
+# ==================== CELL INDEX FAST PATH ====================
+
+# Next-hop tuples for every GUIDE bitmask, shared by all lookups.
+_HOPS: tuple[tuple[Direction, ...], ...] = tuple(
+    tuple(d for i, d in enumerate(Direction) if mask >> i & 1) for mask in range(16)
+)
+
+
+# (direction, step) moves for every SPEED_BOOST bitmask, two-cell moves first.
+_SPEED_HOPS: tuple[tuple[tuple[Direction, int], ...], ...] = tuple(
+    tuple((d, 2) for i, d in enumerate(Direction) if mask >> (4 + i) & 1)
+    + tuple((d, 1) for i, d in enumerate(Direction) if mask >> i & 1)
+    for mask in range(256)
+)
+
+
+def cell_of(p: Point) -> int:
+    """
+    Get the dense cell index of a point (``y * width + x``).
+
+    Pooled points carry their index, so lookups for entity locations cost
+    an attribute read and an identity check. Other points, including
+    copies of pooled ones, are looked up every time.
+
+    Args:
+        p (Point): Grid coordinate.
+
+    Returns:
+        int: Cell index, or -1 if the point lies outside the map.
+    """
+    cell = pooled_cell(p)
+    if cell < 0:
+        return shortest_distances.TABLES.cell(p.x, p.y)
+    return cell
+
+
+def point_of_cell(cell: int) -> Point:
+    """
+    Get the grid coordinate of a cell index.
+
+    Args:
+        cell (int): Cell index returned by `cell_of`.
+
+    Returns:
+        Point: Coordinate of the cell.
+    """
+    y, x = divmod(cell, shortest_distances.TABLES.width)
+    return Point.at(x, y)
+
+
+def get_shortest_distance_between_cells(src: int, dst: int) -> int | None:
+    """
+    Cell-index variant of `get_shortest_distance_between_points`.
+
+    Args:
+        src (int): Starting cell index.
+        dst (int): Ending cell index.
+
+    Returns:
+        int | None: The shortest distance, or None if either cell is invalid
+        or no path exists.
+    """
+    if src < 0 or dst < 0:
+        return None
+    tables = shortest_distances.TABLES
+    d = tables.dist[dst * tables.cells + src]
+    if d == tables.unreachable:
+        return None
+    return d
+
+
+def get_optimal_next_hops_between_cells(src: int, dst: int) -> tuple[Direction, ...]:
+    """
+    Cell-index variant of `get_optimal_next_hops`.
+
+    Args:
+        src (int): Current cell index.
+        dst (int): Target cell index.
+
+    Returns:
+        tuple[Direction, ...]: Optimal next hops, empty if no path information
+        is available.
+    """
+    if src < 0 or dst < 0:
+        return ()
+    tables = shortest_distances.TABLES
+    return _HOPS[tables.guide[dst * tables.cells + src]]
+
+
+def get_optimal_speed_hops_between_cells(
+    src: int, dst: int
+) -> tuple[tuple[Direction, int], ...]:
+    """
+    Optimal first moves of a SPEED_BOOST bot, which covers one or two cells
+    per move, from `src` towards `dst`.
+
+    Args:
+        src (int): Current cell index.
+        dst (int): Target cell index.
+
+    Returns:
+        tuple[tuple[Direction, int], ...]: (direction, step) pairs that start
+        a minimum-tick route, two-cell moves first. Empty if no path
+        information is available.
+    """
+    if src < 0 or dst < 0:
+        return ()
+    tables = shortest_distances.speed_tables()
+    return _SPEED_HOPS[tables.guide[dst * tables.cells + src]]
+
+
+def get_optimal_speed_hops(start: Point, end: Point) -> list[tuple[Direction, int]]:
+    """
+    Point variant of `get_optimal_speed_hops_between_cells`.
+
+    Args:
+        start (Point): Current position of the agent.
+        end (Point): Target position to move toward.
+
+    Returns:
+        list[tuple[Direction, int]]: (direction, step) pairs on a
+        minimum-tick route.
+    """
+    return list(get_optimal_speed_hops_between_cells(cell_of(start), cell_of(end)))
+
+
+def get_speed_distance_between_points(start: Point, end: Point) -> int | None:
+    """
+    Minimum number of moves a SPEED_BOOST bot needs between two points,
+    ignoring dynamic obstacles.
+
+    Args:
+        start (Point): Starting coordinate.
+        end (Point): Ending coordinate.
+
+    Returns:
+        int | None: Number of moves, or None if no path exists.
+    """
+    src, dst = cell_of(start), cell_of(end)
+    if src < 0 or dst < 0:
+        return None
+    return shortest_distances.speed_tables().distance(src, dst)
 
 
 class BotIDAllocator:
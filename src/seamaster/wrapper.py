@@ -0,0 +1,397 @@
+"""
+Wrapper module turns engine views into responses for one player.
+
+A WrapperState holds everything a player keeps across ticks (controllers,
+planner, caches, deadline, opt-in services); `play` runs one tick
+of it. The sandbox entrypoint (main.py) keeps one state and feeds it the
+engine's lines. In-process drivers such as the simulator create one state
+per player and call `step` with view dicts directly.
+"""
+
+import json
+import os
+import sys
+import time
+from typing import Callable
+
+from seamaster.api import (
+    AssignmentService,
+    GameAPI,
+    MoveCoordinator,
+    TickCache,
+    WorldMemory,
+)
+from seamaster.botbase import BotController
+from seamaster.context.bot_context import BotContext
+from seamaster.deadline import TickDeadline
+from seamaster.lifecycle import ControllerPool, Lifecycle, user_call
+from seamaster.models.action import Action
+from seamaster.models.player_view import PlayerView
+from seamaster.parallel import ActPool, can_fork
+from seamaster.profiling import Profiler
+from seamaster.shortest_distances import PathPlanner, use_map
+
+# Handshakes. The delta one tells the engine that, after a full first view,
+# it may send `{"delta": 1, ...}` lines holding only what changed (see
+# PlayerView.apply_delta). Full views are still accepted at any time.
+READY = "__READY_V1__"
+READY_DELTA = "__READY_V1__+DELTA"
+
+
+class WrapperState:
+    """
+    State of one player across the ticks of a match.
+    """
+
+    def __init__(
+        self,
+        spawn_policy: Callable[[GameAPI], list[dict]],
+        player: str | None = None,
+    ):
+        """
+        Args:
+            spawn_policy (Callable[[GameAPI], list[dict]]): The submission's
+                spawn policy.
+            player (str | None): Name of the player when several share a
+                process, so that each gets a profile of its own.
+        """
+        # controller recycling, opt-in with SEAMASTER_CONTROLLER_POOL=1
+        pool = (
+            ControllerPool()
+            if os.environ.get("SEAMASTER_CONTROLLER_POOL") == "1"
+            else None
+        )
+        self.lifecycle: Lifecycle = Lifecycle(pool)
+        self.bot_strategies: dict[int, BotController] = self.lifecycle.controllers
+        self.spawn_policy: Callable[[GameAPI], list[dict]] = spawn_policy
+        self.curr_bot_id: int = -1
+        # bots seen without a registered strategy, already logged
+        self.unknown_bots: set[int] = set()
+        self.planner: PathPlanner = PathPlanner()
+        self.cache: TickCache = TickCache()
+        self.assignments: AssignmentService = AssignmentService()
+        # sightings kept across ticks, opt-in with SEAMASTER_MEMORY=1; without
+        # it api.memory() holds the current view only, built on first use
+        self.memory: WorldMemory | None = (
+            WorldMemory() if os.environ.get("SEAMASTER_MEMORY") == "1" else None
+        )
+        self.deadline: TickDeadline = TickDeadline.from_env()
+        # team-level move resolution, opt-in with SEAMASTER_COORDINATE=1
+        self.coordinator: MoveCoordinator | None = (
+            MoveCoordinator() if os.environ.get("SEAMASTER_COORDINATE") == "1" else None
+        )
+        # act() on worker processes, opt-in with SEAMASTER_WORKERS=<n>;
+        # forked on the first line, once the view has loaded the path tables
+        self.workers: ActPool | None = None
+        # per-phase timings, opt-in with SEAMASTER_PROFILE=stderr|<path>
+        self.profiler: Profiler | None = Profiler.from_env(player)
+        # long-lived view, updated in place by delta lines
+        self.view: PlayerView | None = None
+
+    def handle(self, line: str) -> str:
+        """
+        Answers one engine line.
+
+        Args:
+            line (str): JSON view or delta, as read from the engine.
+
+        Returns:
+            str: JSON response.
+        """
+        started = time.perf_counter()
+        self._begin(started)
+        data = json.loads(line)
+        self._lap("decode")
+        if self.workers is None and _workers_requested() > 1 and can_fork():
+            # forked once the tables of the map are loaded, so they are
+            # shared, and before play so the pool sees every line
+            self._load(data)
+            view = self.view
+            use_map(view.width, view.height, view.permanent_entities.walls)
+            self.workers = ActPool(_workers_requested())
+            out = self._run(None, line)
+        else:
+            out = self._run(data, line)
+        response = json.dumps(out)
+        self._lap("encode")
+        return response
+
+    def step(self, data: dict) -> dict:
+        """
+        Answers one view given as a dict, without JSON and worker pool.
+
+        Args:
+            data (dict): View or delta. Decoded lazily, so it must not be
+                reused by the caller.
+
+        Returns:
+            dict: Response with "tick", "spawns" and "actions".
+        """
+        self._begin(time.perf_counter())
+        out = self._run(data, None)
+        if self.profiler is not None:
+            self.profiler.end_tick(self.view.tick)
+        return out
+
+    def written(self) -> None:
+        """
+        Marks the response of the current tick as sent.
+        """
+        if self.profiler is not None:
+            self.profiler.lap("write")
+            self.profiler.end_tick(self.view.tick)
+
+    def close(self) -> None:
+        """
+        Stops the worker pool and writes the profiling summary.
+        """
+        if self.workers is not None:
+            self.workers.close()
+            self.workers = None
+        if self.profiler is not None:
+            self.profiler.close()
+
+    def _begin(self, started: float) -> None:
+        self.deadline.start(started)
+        if self.profiler is not None:
+            self.profiler.begin_tick(started)
+
+    def _lap(self, phase: str) -> None:
+        if self.profiler is not None:
+            self.profiler.lap(phase)
+
+    def _load(self, data: dict) -> None:
+        if data.get("delta") and self.view is not None:
+            self.view.apply_delta(data)
+        else:
+            self.view = PlayerView.from_dict(data)
+        self._lap("view")
+
+    def _run(self, data: dict | None, line: str | None) -> dict:
+        if data is not None:
+            self._load(data)
+        view = self.view
+
+        if self.memory is not None:
+            self.memory.observe(view)
+            self._lap("observe")
+        raw_tick = view.tick
+        api = GameAPI(
+            view,
+            planner=self.planner,
+            cache=self.cache,
+            assignments=self.assignments,
+            memory=self.memory,
+            deadline=self.deadline,
+        )
+        self._lap("api")
+        out = play(self, api, line)
+        # play() linearizes the tick; deltas are relative to the engine's
+        view.tick = raw_tick
+        return out
+
+
+def play(state: WrapperState, api: GameAPI, line: str | None = None) -> dict:
+    """
+    Runs one tick of a player.
+
+    Args:
+        state (WrapperState): The player's state.
+        api (GameAPI): API over the tick's view.
+        line (str | None): Raw engine line, needed by the worker pool.
+
+    Returns:
+        dict: Response with "tick", "spawns" and "actions".
+    """
+    tick = api.get_tick()
+
+    # linearize tick for the user algo
+    # because user algo might do `if tick % 10 then spawn bot`
+    if tick % 2 == 1:
+        api.view.tick = tick // 2 + 1
+    else:
+        api.view.tick = tick // 2
+
+    spawns: dict[str, dict] = {}
+    actions: dict[str, dict] = {}
+
+    if state.curr_bot_id == -1:
+        state.curr_bot_id = api.view.bot_id_seed
+
+    # ---- SPAWN PHASE (EVERY TICK) ----
+    for spec in state.spawn_policy(api):
+        strategy_cls = spec["strategy"]
+
+        if not issubclass(strategy_cls, BotController):
+            raise TypeError(f"Invalid strategy class in spawn_policy: {strategy_cls}")
+
+        abilities = strategy_cls.ABILITIES
+
+        # it's up to the engine to limit
+        # if api.view.bot_count >= api.view.max_bots:
+        #     continue
+
+        bot_id = state.curr_bot_id
+        state.curr_bot_id += 1
+
+        spawns[str(bot_id)] = {
+            "abilities": abilities,
+            "location": {"x": 0, "y": spec["location"]},
+        }
+        state.lifecycle.register(int(bot_id), strategy_cls)
+
+    profiler = state.profiler
+    if profiler is not None:
+        profiler.lap("spawn_policy")
+
+    # ---- ACTION PHASE ----
+    alive_ids: set[int] = set()
+    deadline = api.deadline
+    parallel = state.workers is not None and line is not None
+
+    if parallel:
+        chosen = _act_parallel(state, api, line, alive_ids)
+    else:
+        chosen = _act_serial(state, api, alive_ids)
+    if profiler is not None:
+        profiler.lap("act")
+
+    # ---- LIFECYCLE PHASE ----
+    dead = state.lifecycle.reap(alive_ids)
+    if parallel:
+        # the live controllers are on the workers
+        state.workers.bury(bot_id for bot_id, _ in dead)
+    for bot_id, strategy in dead:
+        if not parallel:
+            user_call(bot_id, strategy.on_death)
+        state.planner.forget(bot_id)
+        if deadline is not None:
+            deadline.forget(bot_id)
+        if profiler is not None:
+            profiler.forget(bot_id)
+        state.lifecycle.release(bot_id)
+    if profiler is not None:
+        profiler.lap("lifecycle")
+
+    # ---- COORDINATION PHASE ----
+    if state.coordinator is not None:
+        chosen = state.coordinator.resolve(api, chosen)
+        if profiler is not None:
+            profiler.lap("coordinate")
+
+    for bot_id, action in chosen.items():
+        if action is not None:
+            actions[str(bot_id)] = action.to_dict()
+
+    return {
+        "tick": tick,
+        "spawns": spawns,
+        "actions": actions,
+    }
+
+
+def _act_serial(
+    state: WrapperState, api: GameAPI, alive_ids: set[int]
+) -> dict[int, Action]:
+    chosen: dict[int, Action] = {}
+    deadline = api.deadline
+    profiler = state.profiler
+
+    # a list of our own, so nothing act() does can change the loop
+    for bot in list(api.view.bots.values()):
+        alive_ids.add(bot.id)
+
+        strategy = _controller(state, bot.id)
+        if strategy is None:
+            continue
+
+        ctx = BotContext(api, bot)
+        strategy.ctx = ctx
+
+        if state.lifecycle.is_new(bot.id):
+            user_call(bot.id, strategy.on_spawn)
+
+        if deadline is not None and deadline.exhausted():
+            # out of time: keep the response on time with a cheap action
+            action = user_call(bot.id, strategy.fallback)
+            deadline.record(bot.id, 0.0, fallback=True)
+        elif deadline is None and profiler is None:
+            action = user_call(bot.id, strategy.act)
+        else:
+            started = time.perf_counter()
+            action = user_call(bot.id, strategy.act)
+            elapsed = time.perf_counter() - started
+            if deadline is not None:
+                deadline.record(bot.id, elapsed)
+            if profiler is not None:
+                profiler.bot(bot.id, type(strategy).__name__, elapsed)
+
+        if action is not None:
+            api.commit_action(bot, action)
+            chosen[bot.id] = action
+
+    return chosen
+
+
+def _act_parallel(
+    state: WrapperState, api: GameAPI, line: str, alive_ids: set[int]
+) -> dict[int, Action]:
+    deadline = api.deadline
+    profiler = state.profiler
+    bots = list(api.view.bots.values())
+    requests = []
+    classes: dict[int, type] = {}
+    for bot in bots:
+        alive_ids.add(bot.id)
+        strategy = _controller(state, bot.id)
+        if strategy is None:
+            continue
+        classes[bot.id] = type(strategy)
+        # the class goes along once, the worker builds the controller
+        new = state.lifecycle.is_new(bot.id)
+        requests.append((bot.id, classes[bot.id] if new else None))
+
+    expires = deadline.expires if deadline is not None else float("inf")
+    # solved here for every bot, so no two workers pick the same target
+    solution = state.assignments.solve_all(api, state.workers.asked)
+    results = state.workers.act(line, api.view.tick, expires, requests, solution)
+
+    # merge in view order, whichever worker answered first
+    chosen: dict[int, Action] = {}
+    for bot in bots:
+        result = results.get(bot.id)
+        if result is None:
+            continue
+        _, action, target, elapsed = result
+        if deadline is not None:
+            deadline.record(bot.id, elapsed or 0.0, fallback=elapsed is None)
+        if profiler is not None and elapsed is not None:
+            profiler.bot(bot.id, classes[bot.id].__name__, elapsed)
+        if target is not None:
+            api.move_targets[bot.id] = target
+        if action is not None:
+            api.commit_action(bot, action)
+            chosen[bot.id] = action
+    return chosen
+
+
+def _controller(state: WrapperState, bot_id: int) -> BotController | None:
+    # a spawn dropped after its grace ticks is registered again; a bot we
+    # never requested is logged once and left idle
+    strategy = state.bot_strategies.get(bot_id)
+    if strategy is None:
+        strategy = state.lifecycle.revive(bot_id)
+    if strategy is None and bot_id not in state.unknown_bots:
+        state.unknown_bots.add(bot_id)
+        print(
+            f"[WRAPPER] Bot {bot_id} exists without a registered strategy, skipped",
+            file=sys.stderr,
+        )
+    return strategy
+
+
+def _workers_requested() -> int:
+    try:
+        return int(os.environ.get("SEAMASTER_WORKERS", "0"))
+    except ValueError:
+        return 0
@@ -0,0 +1,4 @@
+import os
+
+# the tests build their own tables; keep them out of the user's cache
+os.environ["SEAMASTER_CACHE_DIR"] = ""
@@ -0,0 +1,98 @@
+import itertools
+import random
+
+import pytest
+
+from seamaster.api.assignment import AssignmentService, solve_assignment
+from seamaster.api.game_api import GameAPI
+from seamaster.bench.views import Scenario, synthetic_view
+from seamaster.models.player_view import PlayerView
+from seamaster.utils import cell_of
+
+
+def brute_force(cost: list[list[int]]) -> int:
+    m = len(cost[0])
+    return min(
+        sum(row[j] for row, j in zip(cost, cols))
+        for cols in itertools.permutations(range(m), len(cost))
+    )
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_solver_finds_the_minimum_cost(seed):
+    rng = random.Random(seed)
+    n = rng.randint(1, 5)
+    m = rng.randint(n, 6)
+    cost = [[rng.randint(0, 20) for _ in range(m)] for _ in range(n)]
+    result = solve_assignment(cost)
+    assert sorted(result) == list(range(n))
+    assert len(set(result.values())) == n
+    assert sum(cost[i][j] for i, j in result.items()) == brute_force(cost)
+
+
+def test_solver_handles_an_empty_matrix():
+    assert solve_assignment([]) == {}
+
+
+def view_data(bots: int, algae: int) -> dict:
+    # every third alga is UNKNOWN
+    return synthetic_view(
+        Scenario("assign", bots=bots, enemies=0, algae=3 * algae, scraps=0, walls=0)
+    )
+
+
+def make_api(bots: int, algae: int) -> GameAPI:
+    return GameAPI(
+        PlayerView.from_dict(view_data(bots, algae)), assignments=AssignmentService()
+    )
+
+
+def test_bots_get_distinct_targets():
+    data = view_data(bots=6, algae=8)
+    service = AssignmentService()
+    # the second tick solves for every bot that asked on the first
+    for _ in range(2):
+        api = GameAPI(PlayerView.from_dict(data), assignments=service)
+        targets = [api.assigned_target(b, "unknown_algae") for b in api.view.bots]
+        assert None not in targets
+        assert len({cell_of(t.location) for t in targets}) == len(targets)
+    assert service.solves == 2
+
+
+def test_surplus_bots_get_no_target():
+    api = make_api(bots=5, algae=2)
+    targets = [api.assigned_target(b, "unknown_algae") for b in api.view.bots]
+    assert sum(t is not None for t in targets) == 2
+
+
+def test_unknown_kind_is_rejected():
+    api = make_api(bots=1, algae=1)
+    with pytest.raises(ValueError):
+        api.assigned_target(1000, "scraps")
+
+
+def test_workers_answer_from_the_wrappers_solution():
+    wrapper = make_api(bots=6, algae=8)
+    asked = {"unknown_algae": set(wrapper.view.bots)}
+    solution = wrapper.assignments.solve_all(wrapper, asked)
+    cells = solution["unknown_algae"]
+    assert sorted(cells) == sorted(wrapper.view.bots)
+    assert len(set(cells.values())) == len(cells)
+
+    # two workers, each with half of the bots
+    for share in ((1000, 1002, 1004), (1001, 1003, 1005)):
+        service = AssignmentService()
+        service.use(solution)
+        api = GameAPI(wrapper.view, assignments=service)
+        for bot_id in share:
+            target = api.assigned_target(bot_id, "unknown_algae")
+            assert cell_of(target.location) == cells[bot_id]
+        assert service.asked == {"unknown_algae": set(share)}
+
+
+def test_first_request_with_workers_waits_for_the_next_solve():
+    service = AssignmentService()
+    service.use({})
+    api = GameAPI(make_api(bots=2, algae=2).view, assignments=service)
+    assert api.assigned_target(1000, "unknown_algae") is None
+    assert service.asked == {"unknown_algae": {1000}}
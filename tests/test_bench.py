@@ -0,0 +1,57 @@
+from seamaster.bench.runner import _decode_all, compare
+from seamaster.bench.views import Scenario, synthetic_view
+from seamaster.models.player_view import PlayerView
+
+
+def runs(**cases) -> dict:
+    return {
+        "results": {
+            key: {"median_us": value} if isinstance(value, float) else value
+            for key, value in cases.items()
+        }
+    }
+
+
+def statuses(rows: list[dict]) -> dict[str, str]:
+    return {row["case"]: row["status"] for row in rows}
+
+
+def test_compare_counts_slowdowns_past_the_threshold():
+    baseline = runs(a=100.0, b=100.0, c=100.0, d=0.5)
+    current = runs(a=120.0, b=80.0, c=110.0, d=0.9)
+    assert statuses(compare(current, baseline, threshold=0.15)) == {
+        "a": "regressed",
+        "b": "improved",
+        "c": "ok",
+        # below min_delta_us, noise however large the ratio
+        "d": "ok",
+    }
+
+
+def test_compare_reports_errors_and_missing_cases():
+    baseline = runs(a=100.0, b=100.0)
+    current = runs(a={"error": "ValueError: boom"})
+    rows = {row["case"]: row for row in compare(current, baseline)}
+    assert rows["a"]["status"] == "error"
+    assert rows["a"]["error"] == "ValueError: boom"
+    assert rows["b"]["status"] == "missing"
+    assert rows["b"]["current_us"] is None
+
+
+def test_compare_skips_cases_without_a_baseline_time():
+    baseline = runs(failed={"error": "KeyError: 1"})
+    current = runs(new=10.0, failed=10.0)
+    assert compare(current, baseline) == []
+
+
+def test_compare_reports_new_failures():
+    assert statuses(compare(runs(new={"error": "E"}), runs())) == {"new": "error"}
+
+
+def test_decode_all_decodes_every_entity_group():
+    view = PlayerView.from_dict(synthetic_view(Scenario("small", bots=2)))
+    _decode_all(view)
+    for group in (view.visible_entities, view.permanent_entities):
+        for name in type(group).__slots__:
+            if name != "_data":
+                assert getattr(group, name) is not None, name
@@ -0,0 +1,58 @@
+import os
+
+from seamaster.shortest_distances import TableCache, build_tables
+from seamaster.shortest_distances.cache import DEFAULT_MAX_BYTES, fingerprint
+
+
+def test_fingerprint_depends_on_every_part_of_the_layout():
+    key = fingerprint("walk", 20, 20, frozenset({1, 2}))
+    assert key == fingerprint("walk", 20, 20, frozenset({2, 1}))
+    assert key != fingerprint("speed", 20, 20, frozenset({1, 2}))
+    assert key != fingerprint("walk", 20, 21, frozenset({1, 2}))
+    assert key != fingerprint("walk", 20, 20, frozenset({1, 3}))
+    assert key != fingerprint("walk", 20, 20, frozenset())
+
+
+def test_store_and_load(tmp_path):
+    cache = TableCache(tmp_path)
+    tables = build_tables(4, 3, [])
+    assert cache.load("k") is None
+    cache.store("k", tables)
+    loaded = cache.load("k")
+    assert bytes(loaded.dist) == bytes(tables.dist)
+    assert bytes(loaded.guide) == bytes(tables.guide)
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_corrupt_entry_is_dropped(tmp_path):
+    cache = TableCache(tmp_path)
+    (tmp_path / "k.bin").write_bytes(b"not a table")
+    assert cache.load("k") is None
+    assert not (tmp_path / "k.bin").exists()
+
+
+def test_disabled_cache_does_nothing(tmp_path):
+    cache = TableCache(None)
+    cache.store("k", build_tables(2, 2, []))
+    assert cache.load("k") is None
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    tables = build_tables(4, 3, [])
+    size = len(tables.to_bytes())
+    cache = TableCache(tmp_path, max_bytes=2 * size)
+    cache.store("a", tables)
+    cache.store("b", tables)
+    # "a" is older, but reading it makes "b" the least recently used
+    os.utime(tmp_path / "a.bin", (1, 1))
+    os.utime(tmp_path / "b.bin", (2, 2))
+    cache.load("a")
+    cache.store("c", tables)
+    assert sorted(p.stem for p in tmp_path.glob("*.bin")) == ["a", "c"]
+
+
+def test_from_env_ignores_a_malformed_size(monkeypatch):
+    monkeypatch.setenv("SEAMASTER_CACHE_MAX_BYTES", "lots")
+    assert TableCache.from_env().max_bytes == DEFAULT_MAX_BYTES
+    monkeypatch.setenv("SEAMASTER_CACHE_MAX_BYTES", "1234")
+    assert TableCache.from_env().max_bytes == 1234
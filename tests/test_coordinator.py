@@ -0,0 +1,61 @@
+import copy
+
+from seamaster.api.coordinator import MoveCoordinator
+from seamaster.api.game_api import GameAPI
+from seamaster.bench.views import Scenario, synthetic_view
+from seamaster.constants import Ability, Direction
+from seamaster.models.action import Action
+from seamaster.models.player_view import PlayerView
+from seamaster.models.point import Point
+from seamaster.shortest_distances import OFFSETS
+from seamaster.translate import move, move_speed
+from seamaster.utils import cell_of
+
+BASE = synthetic_view(Scenario("empty", bots=2, enemies=0, algae=0, scraps=0, walls=0))
+
+
+def api_at(*locations: tuple[int, int]) -> GameAPI:
+    data = copy.deepcopy(BASE)
+    for bot_id, (x, y) in zip(sorted(data["bots"]), locations):
+        data["bots"][bot_id]["location"] = {"x": x, "y": y}
+    return GameAPI(PlayerView.from_dict(data))
+
+
+def test_free_moves_are_kept():
+    api = api_at((5, 5), (5, 8))
+    actions = {1000: move(Direction.EAST), 1001: move(Direction.WEST)}
+    assert MoveCoordinator().resolve(api, actions) == actions
+
+
+def test_move_into_a_standing_bot_is_rerouted_with_its_payload():
+    api = api_at((5, 5), (6, 5))
+    api.move_targets[1000] = cell_of(Point(10, 5))
+    actions = {1000: Action(Ability.MOVE, {"direction": "EAST", "step": 1})}
+    coordinator = MoveCoordinator()
+    rerouted = coordinator.resolve(api, actions)[1000]
+    assert rerouted.as_move() in ((Direction.NORTH, 1), (Direction.SOUTH, 1))
+    assert rerouted.payload["step"] == 1
+    assert coordinator.rerouted == 1
+
+
+def test_head_on_moves_do_not_collide():
+    api = api_at((5, 5), (7, 5))
+    api.move_targets[1000] = cell_of(Point(10, 5))
+    api.move_targets[1001] = cell_of(Point(0, 5))
+    resolved = MoveCoordinator().resolve(
+        api, {1000: move(Direction.EAST), 1001: move(Direction.WEST)}
+    )
+    landing = set()
+    for bot_id, (x, y) in ((1000, (5, 5)), (1001, (7, 5))):
+        action = resolved[bot_id]
+        if action is not None:
+            dx, dy = OFFSETS[list(Direction).index(action.as_move()[0])]
+            x, y = x + dx, y + dy
+        landing.add((x, y))
+    assert len(landing) == 2
+
+
+def test_speed_moves_are_sent_as_chosen():
+    api = api_at((5, 5), (6, 5))
+    actions = {1000: move_speed(Direction.NORTH, 2)}
+    assert MoveCoordinator().resolve(api, actions) == actions
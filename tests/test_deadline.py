@@ -0,0 +1,42 @@
+import time
+
+import pytest
+
+from seamaster.deadline import DEFAULT_BUDGET_MS, DEFAULT_RESERVE_MS, TickDeadline
+
+
+def test_from_env_reads_milliseconds(monkeypatch):
+    monkeypatch.setenv("SEAMASTER_TICK_BUDGET_MS", "200")
+    monkeypatch.setenv("SEAMASTER_TICK_RESERVE_MS", "20")
+    deadline = TickDeadline.from_env()
+    assert (deadline.budget, deadline.reserve) == (0.2, 0.02)
+
+
+def test_zero_budget_disables_the_limit(monkeypatch):
+    monkeypatch.setenv("SEAMASTER_TICK_BUDGET_MS", "0")
+    deadline = TickDeadline.from_env()
+    deadline.start()
+    assert deadline.budget is None
+    assert not deadline.exhausted()
+
+
+@pytest.mark.parametrize("raw", ["fast", "nan", "1,5"])
+def test_malformed_values_fall_back_to_the_default(monkeypatch, capsys, raw):
+    monkeypatch.setenv("SEAMASTER_TICK_BUDGET_MS", raw)
+    monkeypatch.setenv("SEAMASTER_TICK_RESERVE_MS", "")
+    deadline = TickDeadline.from_env()
+    assert deadline.budget == DEFAULT_BUDGET_MS / 1000
+    assert deadline.reserve == DEFAULT_RESERVE_MS / 1000
+    assert "SEAMASTER_TICK_BUDGET_MS" in capsys.readouterr().err
+
+
+def test_record_counts_overruns_and_fallbacks():
+    deadline = TickDeadline(0.05)
+    deadline.start(time.perf_counter() - 1)
+    assert deadline.exhausted()
+    deadline.record(1, 0.5)
+    deadline.record(1, 0.0, fallback=True)
+    timing = deadline.stats[1]
+    assert (timing.calls, timing.overruns, timing.fallbacks) == (1, 1, 1)
+    deadline.forget(1)
+    assert deadline.stats == {}
@@ -0,0 +1,93 @@
+from seamaster.botbase import BotController
+from seamaster.lifecycle import ControllerPool, Lifecycle, user_call
+
+
+class Idle(BotController):
+    def act(self):
+        return None
+
+
+class Other(BotController):
+    def act(self):
+        return None
+
+
+def test_bot_goes_live_when_first_seen():
+    lifecycle = Lifecycle()
+    controller = lifecycle.register(1, Idle)
+    assert isinstance(controller, Idle)
+    assert lifecycle.is_new(1)
+    assert not lifecycle.is_new(1)
+    assert lifecycle.spawned == 1
+
+
+def test_dead_bots_are_reaped_once():
+    lifecycle = Lifecycle()
+    controller = lifecycle.register(1, Idle)
+    lifecycle.is_new(1)
+    assert lifecycle.reap([1]) == []
+    assert lifecycle.reap([]) == [(1, controller)]
+    lifecycle.release(1)
+    assert lifecycle.controllers == {}
+    assert lifecycle.reap([]) == []
+    assert lifecycle.died == 1
+
+
+def test_spawns_that_never_show_up_are_dropped_after_the_grace():
+    lifecycle = Lifecycle(spawn_grace=2)
+    lifecycle.register(1, Idle)
+    assert lifecycle.reap([]) == []
+    assert lifecycle.reap([]) == []
+    assert 1 in lifecycle.controllers
+    assert lifecycle.reap([]) == []
+    assert 1 not in lifecycle.controllers
+    assert lifecycle.dropped == 1
+
+
+def test_dropped_spawn_is_revived_when_it_shows_up_late():
+    lifecycle = Lifecycle(spawn_grace=0)
+    lifecycle.register(1, Idle)
+    lifecycle.reap([])
+    controller = lifecycle.revive(1)
+    assert isinstance(controller, Idle)
+    assert lifecycle.controllers[1] is controller
+    assert lifecycle.is_new(1)
+    assert lifecycle.dropped == 0
+    # only once, and never for bots that were not requested
+    assert lifecycle.revive(1) is None
+    assert lifecycle.revive(2) is None
+
+
+def test_pool_recycles_controllers_per_class():
+    pool = ControllerPool(max_per_class=1)
+    first = pool.acquire(Idle)
+    first.note = "left by the previous bot"
+    pool.release(first)
+    pool.release(Idle(None))
+
+    again = pool.acquire(Idle)
+    assert again is first
+    assert not hasattr(again, "note")
+    assert again.ctx is None and again.args == {}
+    assert pool.reused == 1
+    assert isinstance(pool.acquire(Other), Other)
+    # the second idle Idle did not fit
+    assert pool.acquire(Idle) is not first
+
+
+def test_lifecycle_returns_freed_controllers_to_the_pool():
+    lifecycle = Lifecycle(ControllerPool())
+    controller = lifecycle.register(1, Idle)
+    lifecycle.is_new(1)
+    lifecycle.reap([])
+    lifecycle.release(1)
+    assert lifecycle.register(2, Idle) is controller
+
+
+def test_user_call_swallows_errors(capsys):
+    def boom():
+        raise RuntimeError("boom")
+
+    assert user_call(7, boom) is None
+    assert user_call(7, lambda: 3) == 3
+    assert "[USER_CODE] Error in bot 7: boom" in capsys.readouterr().err
@@ -0,0 +1,97 @@
+import pytest
+
+from seamaster.api.game_api import GameAPI
+from seamaster.api.memory import WorldMemory
+from seamaster.bench.views import Scenario, synthetic_view
+from seamaster.constants import AlgaeType
+from seamaster.models.player_view import PlayerView
+from seamaster.models.point import Point
+
+
+def view(bot=(0, 0), algae=(), enemies=(), scraps=()) -> PlayerView:
+    data = synthetic_view(
+        Scenario("mem", bots=1, enemies=0, algae=0, scraps=0, walls=0)
+    )
+    data["bots"]["1000"]["location"] = {"x": bot[0], "y": bot[1]}
+    data["visible_entities"] = {
+        "algae": [{"location": {"x": x, "y": y}, "is_poison": p} for x, y, p in algae],
+        "enemies": [
+            {"id": i, "location": {"x": x, "y": y}, "scraps": 0, "abilities": []}
+            for i, x, y in enemies
+        ],
+        "scraps": [{"location": {"x": x, "y": y}, "amount": 1} for x, y in scraps],
+    }
+    return PlayerView.from_dict(data)
+
+
+def test_sightings_outlive_vision_and_age():
+    memory = WorldMemory()
+    memory.observe(view(algae=[(5, 5, "UNKNOWN")], scraps=[(7, 7)]))
+    memory.observe(view())
+    memory.observe(view())
+    assert memory.recall("algae") == [(Point(5, 5), 2, AlgaeType.UNKNOWN)]
+    assert memory.recall("scraps") == [(Point(7, 7), 2, None)]
+    assert memory.recall("algae", max_age=1) == []
+    assert memory.age("scraps", Point(7, 7)) == 2
+    assert memory.age("scraps", Point(1, 1)) is None
+
+
+def test_missing_entities_near_our_bots_are_forgotten():
+    memory = WorldMemory(clear_radius=1)
+    memory.observe(view(algae=[(5, 5, "UNKNOWN"), (9, 9, "UNKNOWN")]))
+    # our bot next to (5, 5), which is not there any more
+    memory.observe(view(bot=(5, 4)))
+    assert [p for p, _, _ in memory.recall("algae")] == [Point(9, 9)]
+
+
+def test_poison_status_is_kept_over_unknown_sightings():
+    memory = WorldMemory()
+    memory.observe(view(algae=[(5, 5, "TRUE")]))
+    memory.observe(view(algae=[(5, 5, "UNKNOWN")]))
+    assert memory.recall("algae") == [(Point(5, 5), 0, AlgaeType.TRUE)]
+
+
+def test_enemies_are_remembered_where_last_seen():
+    memory = WorldMemory()
+    memory.observe(view(enemies=[(7, 3, 3)]))
+    memory.observe(view(enemies=[(7, 8, 3)]))
+    assert memory.recall("enemies") == [(Point(8, 3), 0, 7)]
+
+
+def test_recall_lists_cells_in_order():
+    memory = WorldMemory()
+    memory.observe(view(scraps=[(9, 9), (2, 3), (5, 1)]))
+    assert [p for p, _, _ in memory.recall("scraps")] == [
+        Point(5, 1),
+        Point(2, 3),
+        Point(9, 9),
+    ]
+    # a later addition lands in order too
+    memory.observe(view(scraps=[(1, 1)]))
+    assert [p for p, _, _ in memory.recall("scraps")][0] == Point(1, 1)
+
+
+def test_observing_does_not_decode_the_view():
+    v = view(algae=[(5, 5, "FALSE")], enemies=[(7, 3, 3)], scraps=[(7, 7)])
+    memory = WorldMemory()
+    memory.observe(v)
+    assert v.visible_entities.raw("algae") is not None
+
+    decoded = view(algae=[(5, 5, "FALSE")], enemies=[(7, 3, 3)], scraps=[(7, 7)])
+    decoded.visible_entities.algae
+    decoded.visible_entities.enemies
+    decoded.visible_entities.scraps
+    other = WorldMemory()
+    other.observe(decoded)
+    for category in WorldMemory.CATEGORIES:
+        assert memory.recall(category) == other.recall(category)
+
+
+def test_unknown_category_is_rejected():
+    with pytest.raises(ValueError):
+        WorldMemory().recall("banks")
+
+
+def test_api_memory_without_the_wrapper_holds_the_current_view():
+    api = GameAPI(view(scraps=[(7, 7)]))
+    assert api.memory().recall("scraps") == [(Point(7, 7), 0, None)]
@@ -0,0 +1,55 @@
+import copy
+
+from seamaster.api.game_api import GameAPI
+from seamaster.bench.views import Scenario, synthetic_view
+from seamaster.constants import Direction
+from seamaster.context.bot_context import BotContext
+from seamaster.models.player_view import PlayerView
+from seamaster.models.point import Point
+from seamaster.shortest_distances import PathPlanner
+
+BASE = synthetic_view(Scenario("empty", bots=1, enemies=0, algae=0, scraps=0, walls=0))
+TARGET = Point(10, 5)
+
+
+def move(planner: PathPlanner, at: tuple[int, int], enemies: list[tuple[int, int]]):
+    data = copy.deepcopy(BASE)
+    data["bots"]["1000"]["location"] = {"x": at[0], "y": at[1]}
+    data["visible_entities"]["enemies"] = [
+        {"id": 9 + i, "location": {"x": x, "y": y}, "scraps": 0, "abilities": []}
+        for i, (x, y) in enumerate(enemies)
+    ]
+    api = GameAPI(PlayerView.from_dict(data), planner=planner)
+    bot = api.view.bots[1000]
+    return BotContext(api, bot).move_target(bot.location, TARGET)
+
+
+def test_free_path_needs_no_plan():
+    planner = PathPlanner()
+    assert move(planner, (5, 5), []) == Direction.EAST
+    assert planner.plans == {}
+
+
+def test_blocked_path_is_planned_around_and_followed():
+    planner = PathPlanner()
+    first = move(planner, (5, 5), [(6, 5)])
+    assert first in (Direction.NORTH, Direction.SOUTH)
+    assert 1000 in planner.plans
+
+    # one step along the detour the plan is as short as the direct path
+    y = 4 if first == Direction.NORTH else 6
+    assert move(planner, (5, y), [(6, 5)]) == Direction.EAST
+    assert 1000 in planner.plans
+
+
+def test_detour_is_dropped_once_the_direct_hop_is_free():
+    planner = PathPlanner()
+    assert move(planner, (5, 5), [(6, 5)]) in (Direction.NORTH, Direction.SOUTH)
+    assert move(planner, (5, 5), []) == Direction.EAST
+    assert 1000 not in planner.plans
+
+
+def test_detour_is_kept_while_the_direct_hop_is_blocked():
+    planner = PathPlanner()
+    first = move(planner, (5, 5), [(6, 5)])
+    assert move(planner, (5, 5), [(6, 5)]) == first
@@ -0,0 +1,76 @@
+import json
+import time
+
+import pytest
+
+from seamaster.bench.views import Scenario, synthetic_view
+from seamaster.botbase import BotController
+from seamaster.parallel import ActPool, can_fork
+
+pytestmark = pytest.mark.skipif(not can_fork(), reason="needs fork")
+
+LINE = json.dumps(synthetic_view(Scenario("test", bots=2)))
+
+
+class Sleepy(BotController):
+    """
+    Stalls the worker for half a second on tick 2.
+    """
+
+    def act(self):
+        if self.ctx.api.get_tick() == 2:
+            time.sleep(0.5)
+        return None
+
+
+def acted(result) -> bool:
+    # act() ran when the worker reports its time
+    return result[3] is not None
+
+
+def test_act_runs_bots_on_their_worker():
+    pool = ActPool(2)
+    try:
+        results = pool.act(
+            LINE, 1, time.perf_counter() + 5, [(1000, Sleepy), (1001, Sleepy)]
+        )
+        assert set(results) == {1000, 1001}
+        assert all(acted(r) for r in results.values())
+    finally:
+        pool.close()
+
+
+def test_late_worker_catches_up_with_bots_spawned_meanwhile():
+    pool = ActPool(1)
+    try:
+        assert acted(pool.act(LINE, 1, time.perf_counter() + 5, [(1000, Sleepy)])[1000])
+
+        # tick 2 stalls the worker past the deadline
+        results = pool.act(LINE, 2, time.perf_counter() + 0.1, [(1000, None)])
+        assert results[1000] == (1000, None, None, None)
+
+        # still busy: 1001 spawns while its worker is late
+        results = pool.act(
+            LINE, 3, time.perf_counter() + 0.05, [(1000, None), (1001, Sleepy)]
+        )
+        assert results[1001] == (1001, None, None, None)
+
+        time.sleep(0.6)
+        results = pool.act(
+            LINE, 4, time.perf_counter() + 5, [(1000, None), (1001, None)]
+        )
+        assert acted(results[1000])
+        assert acted(results[1001])
+    finally:
+        pool.close()
+
+
+def test_crashed_worker_answers_none():
+    pool = ActPool(1)
+    try:
+        pool._procs[0].kill()
+        pool._procs[0].join()
+        results = pool.act(LINE, 1, time.perf_counter() + 1, [(1000, Sleepy)])
+        assert results[1000] == (1000, None, None, None)
+    finally:
+        pool.close()
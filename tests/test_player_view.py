@@ -0,0 +1,142 @@
+import copy
+
+from seamaster.bench.views import Scenario, synthetic_view
+from seamaster.models.algae import Algae
+from seamaster.models.player_view import PlayerView
+
+DATA = synthetic_view(Scenario("small", bots=3, enemies=2, algae=6, scraps=2))
+
+
+def fresh() -> dict:
+    return copy.deepcopy(DATA)
+
+
+def test_scalars_and_bots_are_decoded_up_front():
+    view = PlayerView.from_dict(fresh())
+    assert (view.width, view.height, view.tick) == (20, 20, 1)
+    assert sorted(view.bots) == [1000, 1001, 1002]
+    bot = view.bots[1000]
+    raw = DATA["bots"]["1000"]
+    assert (bot.location.x, bot.location.y) == (
+        raw["location"]["x"],
+        raw["location"]["y"],
+    )
+    assert bot.energy == raw["energy"]
+
+
+def test_entity_lists_are_decoded_on_first_access():
+    view = PlayerView.from_dict(fresh())
+    entities = view.visible_entities
+    assert entities._algae is None
+    algae = entities.algae
+    assert len(algae) == 6 and all(isinstance(a, Algae) for a in algae)
+    # decoded once, then the same list
+    assert entities.algae is algae
+    assert entities._enemies is None and entities._scraps is None
+
+
+def test_banks_and_pads_are_decoded_on_first_access():
+    view = PlayerView.from_dict(fresh())
+    permanent = view.permanent_entities
+    assert permanent._banks is None and permanent._energypads is None
+    assert sorted(permanent.banks) == [0, 1, 2, 3]
+    assert sorted(permanent.energypads) == [0, 1]
+    assert permanent.banks is permanent.banks
+
+
+def test_models_use_slots():
+    view = PlayerView.from_dict(fresh())
+    for obj in (view, view.bots[1000], view.visible_entities.algae[0]):
+        assert not hasattr(obj, "__dict__")
+
+
+def test_revision_changes_with_every_view():
+    assert (
+        PlayerView.from_dict(fresh()).revision != PlayerView.from_dict(fresh()).revision
+    )
+
+
+def snapshot(view: PlayerView) -> dict:
+    """
+    Everything a strategy can read from a view, as plain values.
+    """
+    ve, pe = view.visible_entities, view.permanent_entities
+    return {
+        "scalars": {k: getattr(view, k) for k in PlayerView._SCALARS},
+        "bots": {
+            i: {k: getattr(b, k) for k in type(b).__slots__}
+            for i, b in view.bots.items()
+        },
+        "enemies": [(e.id, e.location) for e in ve.enemies],
+        "scraps": [(s.location, s.amount) for s in ve.scraps],
+        "algae": [(a.location, a.is_poison) for a in ve.algae],
+        "banks": {
+            i: {k: getattr(b, k) for k in type(b).__slots__}
+            for i, b in pe.banks.items()
+        },
+        "pads": {
+            i: {k: getattr(p, k) for k in type(p).__slots__}
+            for i, p in pe.energypads.items()
+        },
+        "walls": list(pe.walls),
+    }
+
+
+def test_delta_gives_the_same_view_as_a_full_decode():
+    before, after = fresh(), fresh()
+    after["tick"] = 2
+    after["scraps"] = 90
+    after["bots"]["1000"]["location"] = {"x": 0, "y": 0}
+    after["bots"]["1000"]["energy"] = 1
+    del after["bots"]["1001"]
+    after["bots"]["1003"] = dict(after["bots"]["1002"], id=1003)
+    after["visible_entities"]["algae"] = after["visible_entities"]["algae"][:2]
+    after["permanent_entities"]["banks"]["1"]["deposit_amount"] = 9
+    del after["permanent_entities"]["energy_pads"]["1"]
+
+    delta = {
+        "delta": 1,
+        "tick": 2,
+        "scraps": 90,
+        "bots": {
+            "1000": {"location": {"x": 0, "y": 0}, "energy": 1},
+            "1001": None,
+            "1003": after["bots"]["1003"],
+        },
+        "visible_entities": {"algae": after["visible_entities"]["algae"]},
+        "permanent_entities": {
+            "banks": {"1": {"deposit_amount": 9}},
+            "energy_pads": {"1": None},
+        },
+    }
+    view = PlayerView.from_dict(before)
+    revision = view.revision
+    view.apply_delta(delta)
+    assert view.revision != revision
+    assert snapshot(view) == snapshot(PlayerView.from_dict(after))
+
+
+def test_delta_replaces_only_the_lists_it_holds():
+    view = PlayerView.from_dict(fresh())
+    enemies = view.visible_entities.enemies
+    view.visible_entities.algae
+    view.apply_delta({"delta": 1, "visible_entities": {"algae": []}})
+    assert view.visible_entities.enemies is enemies
+    assert view.visible_entities.algae == []
+
+
+def test_delta_keeps_untouched_bots_and_banks():
+    view = PlayerView.from_dict(fresh())
+    bot, bank = view.bots[1002], view.permanent_entities.banks[0]
+    view.apply_delta({"delta": 1, "bots": {"1000": {"energy": 3}}})
+    assert view.bots[1002] is bot
+    assert view.permanent_entities.banks[0] is bank
+    assert view.bots[1000].energy == 3
+
+
+def test_pad_ticks_left_maps_to_its_attribute():
+    view = PlayerView.from_dict(fresh())
+    view.apply_delta(
+        {"delta": 1, "permanent_entities": {"energy_pads": {"0": {"ticks_left": 4}}}}
+    )
+    assert view.permanent_entities.energypads[0].ticksleft == 4
@@ -0,0 +1,82 @@
+import dataclasses
+import pickle
+
+from seamaster.api.game_api import GameAPI
+from seamaster.bench.views import Scenario, synthetic_view
+from seamaster.context.bot_context import BotContext
+from seamaster.models.player_view import PlayerView
+from seamaster.models.point import Point, pooled_cell, use_grid
+from seamaster.utils import cell_of
+
+
+def setup_module():
+    use_grid(20, 20)
+
+
+def test_pooled_points_are_shared_and_carry_their_cell():
+    p = Point.at(3, 2)
+    assert Point.at(3, 2) is p
+    assert p.cell == 2 * 20 + 3
+    assert pooled_cell(p) == p.cell
+    assert p == Point(3, 2) and hash(p) == hash(Point(3, 2))
+
+
+def test_points_off_the_grid_are_not_pooled():
+    p = Point.at(-1, 4)
+    assert p is not Point.at(-1, 4)
+    assert pooled_cell(p) == -1
+    assert cell_of(p) == -1
+
+
+def test_neighbours_are_in_direction_order():
+    # N, E, S, W; the corner lacks N and W
+    assert Point.at(5, 5).neighbours == (
+        Point(5, 4),
+        Point(6, 5),
+        Point(5, 6),
+        Point(4, 5),
+    )
+    assert Point.at(0, 0).neighbours == (Point(1, 0), Point(0, 1))
+
+
+def test_dataclass_helpers_see_only_the_coordinates():
+    p = Point.at(1, 1)
+    assert dataclasses.asdict(p) == {"x": 1, "y": 1}
+    moved = dataclasses.replace(p, x=5)
+    assert moved.cell == -1
+    assert cell_of(moved) == 1 * 20 + 5
+
+
+def test_cell_of_plain_points():
+    assert cell_of(Point(7, 3)) == 3 * 20 + 7
+
+
+def test_points_unpickle_into_the_pool():
+    p = Point.at(4, 4)
+    assert pickle.loads(pickle.dumps(p)) is p
+
+
+def test_regridding_drops_the_old_pool():
+    old = Point.at(2, 2)
+    use_grid(10, 10)
+    try:
+        assert pooled_cell(old) == -1
+        assert Point.at(2, 2).cell == 2 * 10 + 2
+    finally:
+        use_grid(20, 20)
+
+
+def test_bank_sides_break_ties_east_first():
+    view_data = synthetic_view(
+        Scenario("empty", bots=1, enemies=0, algae=0, scraps=0, walls=0)
+    )
+    view_data["bots"]["1000"]["location"] = {"x": 12, "y": 8}
+    view_data["permanent_entities"]["banks"]["0"]["location"] = {"x": 10, "y": 10}
+    api = GameAPI(PlayerView.from_dict(view_data))
+    bot = api.view.bots[1000]
+    bank = api.view.permanent_entities.banks[0]
+    # north (10, 9) and east (11, 10) are both 3 steps away
+    assert BotContext(api, bot).min_adjacent_distance_bank(bank, bot.location) == (
+        3,
+        Point(11, 10),
+    )
@@ -0,0 +1,54 @@
+import io
+import json
+
+from seamaster.profiling import SLOWEST_BOTS, Profiler
+
+
+def test_from_env_is_off_by_default(monkeypatch):
+    monkeypatch.delenv("SEAMASTER_PROFILE", raising=False)
+    assert Profiler.from_env() is None
+
+
+def test_malformed_memory_interval_falls_back(monkeypatch, capsys):
+    monkeypatch.setenv("SEAMASTER_PROFILE", "stderr")
+    monkeypatch.setenv("SEAMASTER_PROFILE_MEMORY", "often")
+    assert Profiler.from_env().memory_every == 10
+    assert "SEAMASTER_PROFILE_MEMORY" in capsys.readouterr().err
+
+
+def test_negative_memory_interval_never_traces():
+    profiler = Profiler(io.StringIO(), memory_every=-1, helpers=())
+    assert profiler.memory_every == 0
+    profiler.begin_tick()
+    profiler.end_tick(1)
+    assert "memory" not in json.loads(profiler.out.getvalue())
+
+
+def test_ticks_and_summary_are_json_lines():
+    out = io.StringIO()
+    profiler = Profiler(out, memory_every=0, helpers=(), player="p1")
+    profiler.begin_tick()
+    profiler.lap("act")
+    profiler.bot(1, "Forager", 0.002)
+    profiler.end_tick(1)
+    # close() closes every target but stderr
+    out.close = lambda: None
+    profiler.close()
+    tick, summary = map(json.loads, out.getvalue().splitlines())
+    assert tick["tick"] == 1 and tick["player"] == "p1"
+    assert set(tick["phases"]) == {"act"}
+    assert tick["slowest"] == {"bot": 1, "class": "Forager", "ms": 2.0}
+    assert summary["summary"] and summary["ticks"] == 1
+    assert summary["slowest_bots"][0]["bot"] == 1
+
+
+def test_dead_bots_keep_only_the_slowest():
+    profiler = Profiler(io.StringIO(), memory_every=0, helpers=())
+    profiler.begin_tick()
+    for bot_id in range(SLOWEST_BOTS + 3):
+        profiler.bot(bot_id, "Scout", bot_id / 1000)
+        profiler.forget(bot_id)
+    assert profiler._bots == {}
+    assert sorted(bot_id for bot_id, _ in profiler._dead) == list(
+        range(3, SLOWEST_BOTS + 3)
+    )
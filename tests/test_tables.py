@@ -0,0 +1,124 @@
+from array import array
+
+import pytest
+
+from seamaster import shortest_distances
+from seamaster.models.point import Point
+from seamaster.shortest_distances import LazyPathTables, PathTables, build_tables, bfs
+from seamaster.shortest_distances.tables import pack_dist_json
+from seamaster.simulator import DEFAULT_WALLS
+
+NORTH, EAST, SOUTH, WEST = (1 << i for i in range(4))
+
+
+def default_map() -> PathTables:
+    return build_tables(20, 20, [Point(x, y) for x, y in DEFAULT_WALLS])
+
+
+def test_packaged_tables_match_the_default_map():
+    packaged = shortest_distances._load_packaged("paths.bin")
+    built = default_map()
+    assert (packaged.width, packaged.height) == (20, 20)
+    assert bytes(packaged.dist) == bytes(built.dist)
+    assert bytes(packaged.guide) == bytes(built.guide)
+
+
+def test_distance_and_hops():
+    tables = build_tables(3, 1, [])
+    assert tables.distance(0, 2) == 2
+    assert tables.distance(1, 1) == 0
+    assert tables.hops(0, 2) == EAST
+    assert tables.hops(2, 0) == WEST
+    assert tables.hops(1, 1) == 0
+
+
+def test_walls_are_unreachable():
+    # a wall splitting a 3x1 map
+    tables = build_tables(3, 1, [Point(1, 0)])
+    assert tables.distance(0, 2) is None
+    assert tables.distance(1, 1) is None
+    assert tables.hops(0, 2) == 0
+    assert tables.wall_cells() == frozenset({1})
+
+
+def test_every_optimal_hop_is_in_the_mask():
+    tables = build_tables(2, 2, [])
+    # from the top-left corner both EAST and SOUTH reach the opposite one
+    assert tables.hops(0, 3) == EAST | SOUTH
+
+
+def test_file_round_trip(tmp_path):
+    tables = default_map()
+    path = tmp_path / "paths.bin"
+    tables.dump(path)
+    loaded = PathTables.load(path)
+    assert (loaded.width, loaded.height) == (20, 20)
+    assert bytes(loaded.dist) == bytes(tables.dist)
+    assert bytes(loaded.guide) == bytes(tables.guide)
+    assert loaded.wall_cells() == tables.wall_cells()
+
+
+def test_two_byte_distances_round_trip():
+    dist = array("H", [0, 300, 300, 0])
+    tables = PathTables(2, 1, memoryview(dist), memoryview(bytes([0, WEST, EAST, 0])))
+    loaded = PathTables.from_buffer(tables.to_bytes())
+    assert loaded.dist.itemsize == 2
+    assert loaded.distance(0, 1) == 300
+    assert loaded.hops(1, 0) == WEST
+    assert loaded.unreachable == 0xFFFF
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda data: data[:10],
+        lambda data: b"XXXX" + data[4:],
+        lambda data: data + b"\0",
+        lambda data: data[:-1],
+    ],
+)
+def test_corrupt_buffers_are_rejected(corrupt):
+    data = build_tables(3, 1, []).to_bytes()
+    with pytest.raises(ValueError):
+        PathTables.from_buffer(corrupt(data))
+
+
+def test_pack_dist_json_derives_the_hops():
+    legacy = {
+        "0,0": {"0,0": 0, "1,0": 1, "2,0": 2},
+        "1,0": {"0,0": 1, "1,0": 0, "2,0": 1},
+        "2,0": {"0,0": 2, "1,0": 1, "2,0": 0},
+    }
+    tables = pack_dist_json(legacy, 3, 1)
+    built = build_tables(3, 1, [])
+    assert bytes(tables.dist) == bytes(built.dist)
+    assert bytes(tables.guide) == bytes(built.guide)
+
+
+def wide_map_walls() -> list[Point]:
+    # a comb of walls with gaps, so paths have to wind
+    return [Point(x, y) for x in range(2, 40, 4) for y in range(24) if y != x % 25]
+
+
+def test_large_maps_get_lazy_tables():
+    tables = build_tables(40, 25, wide_map_walls())
+    assert isinstance(tables, LazyPathTables)
+    assert tables.rows == {}
+    tables.distance(0, 999)
+    assert list(tables.rows) == [999]
+    with pytest.raises(TypeError):
+        tables.to_bytes()
+
+
+def test_lazy_tables_match_eager_ones(monkeypatch):
+    walls = wide_map_walls()
+    lazy = build_tables(40, 25, walls)
+    monkeypatch.setattr(bfs, "EAGER_MAX_CELLS", 40 * 25)
+    eager = build_tables(40, 25, walls)
+    assert not isinstance(eager, LazyPathTables)
+
+    assert lazy.wall_cells() == eager.wall_cells()
+    for dst in range(0, lazy.cells, 7):
+        for src in range(lazy.cells):
+            assert lazy.distance(src, dst) == eager.distance(src, dst)
+            assert lazy.hops(src, dst) == eager.hops(src, dst)